@@ -0,0 +1,318 @@
+# benchmarks/nlp_bench.py
+"""
+NLP Micro-Benchmark
+- Korpus sintetis deterministik (seed tetap) gaya postingan sosmed: Indonesia & Inggris,
+  ukuran 1 KB, 100 KB, 10 MB (mention, hashtag, URL, emoji, angka engagement "1.2rb likes")
+- Mengukur fungsi NLPAnalyzer: throughput (MB/s, docs/s) & puncak alokasi (tracemalloc)
+- Dibandingkan dengan baseline tersimpan (baselines.json); exit code 1 jika regresi
+
+Waktu dinormalisasi dengan loop kalibrasi Python murni (diukur di sela tiap case, diambil yang
+tercepat) agar baseline tetap berarti di mesin yang lebih cepat/lambat. Baseline tetap paling
+akurat di mesin yang sama.
+
+Tiap case diukur minimal MIN_REPEAT kali; yang dibandingkan median, dan toleransi diperlebar
+sesuai variasi antar pengulangan (MAD / median, dibatasi MAX_NOISE) saat ini & baseline.
+Case yang tampak regresi diukur ulang sekali sebelum dinyatakan gagal.
+
+Jalankan dari root repo:
+    python -m benchmarks.nlp_bench                  # bandingkan dengan baseline
+    python -m benchmarks.nlp_bench --update         # simpan hasil sebagai baseline baru
+    python -m benchmarks.nlp_bench --sizes 1KB 100KB --cases robust_tokenize
+    python -m benchmarks.nlp_bench --full           # tanpa batas ukuran per case (lama)
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Log per panggilan tidak membanjiri output benchmark (set LOG_LEVEL=INFO untuk ikut diukur)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from core.nlp_analyzer import NLPAnalyzer  # noqa: E402
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+SIZES = {"1KB": 1 << 10, "100KB": 100 << 10, "10MB": 10 << 20}
+LANGUAGES = ("id", "en")
+SEED = 20240601
+POST_SEPARATOR = "\n---\n"
+
+MIN_TIME = 0.5       # ulangi pengukuran sampai total waktu >= MIN_TIME detik (dan >= MIN_REPEAT kali)
+MIN_REPEAT = 5
+MAX_REPEAT = 1000
+TOLERANCE = 0.25     # regresi jika > 25% lebih lambat / lebih boros dari baseline
+NOISE_FACTOR = 2     # toleransi waktu += NOISE_FACTOR x variasi gabungan (current & baseline)...
+MAX_NOISE = 0.5      # ...maksimal +50%, agar case yang berisik tetap bisa gagal
+
+VOCAB = {
+    "id": {
+        "words": ["belajar", "golang", "bagus", "banget", "kontennya", "jelas", "mantap", "tutorial",
+                  "keren", "sekali", "kurang", "membantu", "jelek", "lambat", "cepat", "mudah",
+                  "dipahami", "videonya", "penjelasannya", "programmer", "pemula", "coba", "aplikasi",
+                  "rekomendasi", "harga", "murah", "mahal", "kecewa", "senang", "terima", "kasih",
+                  "ditunggu", "part", "selanjutnya", "gimana", "caranya", "install", "error", "terus",
+                  "akhirnya", "berhasil", "makasih", "kak", "bang", "gan", "wkwk", "parah", "sih"],
+        "fillers": ["yang", "dan", "di", "ini", "itu", "untuk", "dengan", "ada", "juga", "tidak", "sudah"],
+        "metrics": ["{n}rb likes", "{n}jt views", "{n} ribu penonton", "{n}k followers", "{i} komentar",
+                    "{i} share", "{i},{t} views", "{i}x ditonton"],
+    },
+    "en": {
+        "words": ["learning", "golang", "great", "awesome", "content", "clear", "amazing", "tutorial",
+                  "cool", "really", "helpful", "bad", "slow", "fast", "easy", "understand", "video",
+                  "explanation", "programmer", "beginner", "trying", "app", "recommended", "price",
+                  "cheap", "expensive", "disappointed", "happy", "thanks", "waiting", "next", "part",
+                  "how", "install", "error", "finally", "worked", "love", "hate", "terrible", "best",
+                  "worst", "subscribed", "shared", "watching", "again", "lol", "honestly"],
+        "fillers": ["the", "and", "is", "this", "that", "for", "with", "it", "was", "not", "so"],
+        "metrics": ["{n}k likes", "{n}m views", "{i} comments", "{i} subscribers", "{i} share",
+                    "{i},{t} views", "{i} times", "{n}k followers"],
+    },
+}
+TAGS = ["golang", "coding", "tutorial", "fyp", "viral", "tech", "review", "programming"]
+EMOJI = ["🔥", "😂", "👍", "🙏", "😡", "❤️", "🚀"]
+
+
+# ===== KORPUS =====
+def make_post(rng: random.Random, lang: str) -> str:
+    vocab = VOCAB[lang]
+    words = [rng.choice(vocab["words"] if rng.random() < 0.7 else vocab["fillers"])
+             for _ in range(rng.randint(8, 30))]
+    if rng.random() < 0.3:
+        words.insert(rng.randrange(len(words)), f"@user{rng.randint(1, 9999)}")
+    if rng.random() < 0.4:
+        words.append(f"#{rng.choice(TAGS)}")
+    if rng.random() < 0.15:
+        words.append(f"https://example.com/v/{rng.getrandbits(32):08x}")
+    if rng.random() < 0.3:
+        words.append(rng.choice(EMOJI))
+    text = " ".join(words).capitalize() + rng.choice([".", "!", "?", "!!"])
+
+    metrics = [rng.choice(vocab["metrics"]).format(n=round(rng.uniform(1, 99), 1), i=rng.randint(1, 999),
+                                                   t=rng.randint(100, 999))
+               for _ in range(rng.randint(0, 3))]
+    return f"{text} | {' | '.join(metrics)}" if metrics else text
+
+
+def make_corpus(lang: str, size: int) -> Tuple[str, int]:
+    """Return (teks, jumlah post); deterministik untuk (lang, size) yang sama"""
+    rng = random.Random(f"{SEED}:{lang}:{size}")
+    posts, total = [], 0
+    while total < size:
+        post = make_post(rng, lang)
+        posts.append(post)
+        total += len(post.encode("utf-8")) + len(POST_SEPARATOR)
+    return POST_SEPARATOR.join(posts), len(posts)
+
+
+# ===== CASES =====
+# name -> (setup(analyzer, text) -> callable, batas ukuran default atau None)
+def _case_stem(analyzer: NLPAnalyzer, text: str) -> Callable:
+    # Stem dijalankan pada token mentah (sebelum stem) agar tidak tercampur biaya tokenisasi
+    words = analyzer.preprocess_text(text).split()
+    return lambda: [analyzer._simple_stem(word) for word in words]
+
+
+CASES: Dict[str, Tuple[Callable, int]] = {
+    "preprocess_text": (lambda a, t: lambda: a.preprocess_text(t), None),
+    "robust_tokenize": (lambda a, t: lambda: a.robust_tokenize(t), None),
+    "_simple_stem": (_case_stem, None),
+    # VADER (cek negasi per kata) & multiplier engagement (text.lower() per angka) superlinear
+    # terhadap panjang teks -> 10 MB hanya dengan --full
+    "sentiment_vader": (lambda a, t: lambda: a.sentiment_analysis_vader(t), SIZES["100KB"]),
+    "sentiment_textblob": (lambda a, t: lambda: a.sentiment_analysis_textblob(t), SIZES["100KB"]),
+    "analyze_engagement_metrics": (lambda a, t: lambda: a.analyze_engagement_metrics(t), SIZES["100KB"]),
+    "comprehensive_analysis": (lambda a, t: lambda: a.comprehensive_analysis(t), SIZES["100KB"]),
+}
+
+
+# ===== PENGUKURAN =====
+def calibrate() -> float:
+    """Waktu loop Python murni yang tetap; pembagi untuk menormalkan antar mesin"""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        counts = {}
+        for i in range(100_000):
+            key = str(i % 997)
+            counts[key] = counts.get(key, 0) + 1
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(func: Callable) -> Tuple[List[float], int]:
+    """Return (detik per panggilan untuk tiap pengulangan, puncak alokasi byte)"""
+    samples, total = [], 0.0
+    while len(samples) < MIN_REPEAT or (total < MIN_TIME and len(samples) < MAX_REPEAT):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        total += elapsed
+
+    # Pass terpisah untuk memori: tracemalloc memperlambat eksekusi
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, peak
+
+
+def summarize(samples: List[float], peak: int) -> dict:
+    median = statistics.median(samples)
+    return {
+        "seconds": median,
+        "min": min(samples),
+        # MAD / median: satu outlier (GC, scheduler) tidak melebarkan toleransi seperti stdev
+        "spread": statistics.median(abs(s - median) for s in samples) / median if median else 0.0,
+        "runs": len(samples),
+        "peak_bytes": peak,
+    }
+
+
+def measure_case(analyzer: NLPAnalyzer, case: str, lang: str, size_name: str) -> dict:
+    text, _ = make_corpus(lang, SIZES[size_name])
+    setup, _ = CASES[case]
+    return summarize(*measure(setup(analyzer, text)))
+
+
+def run(cases: List[str], sizes: List[str], full: bool) -> Tuple[dict, float]:
+    analyzer = NLPAnalyzer()
+    results, units = {}, []
+
+    for size_name in sizes:
+        for lang in LANGUAGES:
+            text, posts = make_corpus(lang, SIZES[size_name])
+            megabytes = len(text.encode("utf-8")) / (1 << 20)
+            for case in cases:
+                setup, limit = CASES[case]
+                key = f"{case}/{lang}/{size_name}"
+                if limit and SIZES[size_name] > limit and not full:
+                    print(f"  {key:42} dilewati (> batas default, pakai --full)")
+                    continue
+
+                func = setup(analyzer, text)
+                units.append(calibrate())
+                entry = results[key] = summarize(*measure(func))
+                entry.update(lang=lang, size=size_name, megabytes=megabytes, posts=posts)
+                print(format_entry(key, entry))
+    # Kecepatan mesin = kalibrasi tercepat (minimum dari banyak sampel jauh lebih stabil)
+    unit = min(units, default=1.0)
+    for entry in results.values():
+        entry["normalized"] = entry["seconds"] / unit
+    return results, unit
+
+
+def format_entry(key: str, entry: dict) -> str:
+    seconds = entry["seconds"]
+    return (f"  {key:42} {seconds * 1000:10.2f} ms ±{entry['spread']:4.0%} (n={entry['runs']:<4}) "
+            f"{entry['megabytes'] / seconds:9.2f} MB/s  {entry['posts'] / seconds:11.0f} docs/s  "
+            f"peak {entry['peak_bytes'] / (1 << 20):8.2f} MB")
+
+
+def time_regression(current: dict, base: dict, tolerance: float) -> Tuple[float, float]:
+    """Return (perlambatan relatif median, batas yang diizinkan termasuk noise)"""
+    slower = current["normalized"] / base["normalized"] - 1
+    noise = math.hypot(current.get("spread", 0.0), base.get("spread", 0.0))
+    return slower, tolerance + min(NOISE_FACTOR * noise, MAX_NOISE)
+
+
+def compare(results: dict, baselines: dict, tolerance: float) -> List[str]:
+    regressions = []
+    for key, current in results.items():
+        base = baselines.get(key)
+        if not base:
+            continue
+        slower, allowed = time_regression(current, base, tolerance)
+        if slower > allowed:
+            regressions.append(f"{key}: {slower:+.0%} waktu median (normalized, batas {allowed:+.0%})")
+        # Lantai 64 KB: alokasi kecil terlalu berisik untuk dibandingkan relatif
+        if current["peak_bytes"] > max(base["peak_bytes"] * (1 + tolerance), base["peak_bytes"] + (64 << 10)):
+            grown = current["peak_bytes"] / max(base["peak_bytes"], 1) - 1
+            regressions.append(f"{key}: {grown:+.0%} puncak memori")
+    return regressions
+
+
+def confirm(results: dict, baselines: dict, tolerance: float, unit: float):
+    """Ukur ulang case yang tampak lebih lambat; pakai median yang lebih baik dari dua pengukuran"""
+    suspects = []
+    for key, current in results.items():
+        if key in baselines:
+            slower, allowed = time_regression(current, baselines[key], tolerance)
+            if slower > allowed:
+                suspects.append(key)
+    if not suspects:
+        return
+    print(f"[BENCH] Mengukur ulang {len(suspects)} case yang tampak regresi...")
+    analyzer = NLPAnalyzer()
+    for key in suspects:
+        case, lang, size_name = key.split("/")
+        retry = measure_case(analyzer, case, lang, size_name)
+        if retry["seconds"] < results[key]["seconds"]:
+            retry.update({k: results[key][k] for k in ("lang", "size", "megabytes", "posts")})
+            retry["normalized"] = retry["seconds"] / unit
+            results[key] = retry
+        print(format_entry(key, results[key]))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Micro-benchmark NLPAnalyzer dengan korpus sintetis")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--full", action="store_true", help="Abaikan batas ukuran per case")
+    parser.add_argument("--update", action="store_true", help="Simpan hasil sebagai baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help=f"Toleransi regresi relatif (default {TOLERANCE})")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    print(f"[BENCH] Python {sys.version.split()[0]}, cases={len(args.cases)}, sizes={' '.join(args.sizes)}")
+    results, unit = run(args.cases, args.sizes, args.full)
+    print(f"[BENCH] Kalibrasi: {unit * 1000:.1f} ms")
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f).get("results", {})
+
+    if args.update:
+        # Merge: case/ukuran yang tidak dijalankan kali ini tetap memakai baseline lama
+        baselines.update({key: {k: v for k, v in entry.items() if k not in ("lang", "size", "megabytes", "posts")}
+                          for key, entry in results.items()})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "calibration": unit, "results": baselines},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"[BENCH] Baseline disimpan ke {args.baseline} ({len(results)} hasil)")
+        return 0
+
+    if not baselines:
+        print("[BENCH] Belum ada baseline; jalankan dengan --update")
+        return 0
+
+    missing = [key for key in results if key not in baselines]
+    if missing:
+        print(f"[BENCH] {len(missing)} hasil tanpa baseline: {', '.join(missing)}")
+    confirm(results, baselines, args.tolerance, unit)
+    regressions = compare(results, baselines, args.tolerance)
+    if regressions:
+        print(f"[BENCH] ❌ {len(regressions)} regresi (toleransi {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print(f"[BENCH] ✅ Tidak ada regresi (toleransi {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
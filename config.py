@@ -7,9 +7,156 @@ load_dotenv()
 class Config:
     OLLAMA_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma3:1b")
+    # Berapa lama model tetap di memori Ollama setelah call terakhir
+    OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+    # LLM cascade: heuristik NLP -> model kecil -> model utama
+    CASCADE_ENABLED = os.getenv("CASCADE_ENABLED", "True").lower() == "true"
+    LLM_SMALL_MODEL = os.getenv("LLM_SMALL_MODEL", "")  # kosong = tier small dilewati
+    CASCADE_HIGH_CONFIDENCE = float(os.getenv("CASCADE_HIGH_CONFIDENCE", 0.6))
+    CASCADE_MEDIUM_CONFIDENCE = float(os.getenv("CASCADE_MEDIUM_CONFIDENCE", 0.3))
+    CASCADE_SHORT_CHARS = int(os.getenv("CASCADE_SHORT_CHARS", 800))
+    CASCADE_MEDIUM_CHARS = int(os.getenv("CASCADE_MEDIUM_CHARS", 2500))
+
+    # Chunked map-reduce untuk capture panjang (~4 karakter per token)
+    LLM_CHUNKED = os.getenv("LLM_CHUNKED", "True").lower() == "true"
+    LLM_CHUNK_CHARS = int(os.getenv("LLM_CHUNK_CHARS", 3500))
+    # Samakan dengan OLLAMA_NUM_PARALLEL di server agar chunk benar-benar diproses paralel
+    LLM_PARALLEL = int(os.getenv("LLM_PARALLEL", 4))
     # Ubah string "True"/"False" jadi boolean Python
     HEADLESS = os.getenv("HEADLESS_MODE", "False").lower() == "true"
     TIMEOUT = int(os.getenv("TIMEOUT", 60000))
+
+    # Budget end-to-end per job (detik): scrape + NLP + LLM
+    # Override per platform dengan JOB_BUDGET_<PLATFORM>, mis. JOB_BUDGET_FACEBOOK=240
+    JOB_BUDGET = int(os.getenv("JOB_BUDGET", 180))
+    JOB_BUDGETS = {
+        key[len("JOB_BUDGET_"):].lower(): int(value)
+        for key, value in os.environ.items() if key.startswith("JOB_BUDGET_")
+    }
+    # Batas atas satu request ke Ollama (thread LLM tidak bisa di-kill, jadi dibatasi di client)
+    LLM_TIMEOUT = int(os.getenv("LLM_TIMEOUT", 120))
+
+    # Network capture: baca payload JSON platform, DOM jadi fallback
+    CAPTURE_MODE = os.getenv("CAPTURE_MODE", "True").lower() == "true"
+    CAPTURE_WAIT = int(os.getenv("CAPTURE_WAIT", 8000))
+    # Blokir gambar/media/font di context browser. Off by default: routing aktif mematikan
+    # HTTP cache Playwright (asset tidak lagi dipakai ulang dari context yang warm)
+    BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "False").lower() == "true"
+    # Statistik strategi selector yang menang (dipakai untuk urutan percobaan berikutnya)
+    SELECTOR_STATS_FILE = os.getenv("SELECTOR_STATS_FILE", "selector_stats.json")
+
+    # Fetch tier HTTP (tanpa browser) untuk platform server-rendered
+    HTTP_TIER = os.getenv("HTTP_TIER", "True").lower() == "true"
+    HTTP_TIMEOUT = int(os.getenv("HTTP_TIMEOUT", 15000))
+
+    # Session login per platform (<SESSION_DIR>/<platform>.json, dibuat utils/auth_generator.py)
+    SESSION_DIR = os.getenv("SESSION_DIR", "sessions")
+    # Browser pool: interval (detik) simpan balik storage state ke file session
+    SESSION_SAVE_INTERVAL = int(os.getenv("SESSION_SAVE_INTERVAL", 300))
+    # Pre-flight cek session semua platform (paralel) saat startup, hasil di-cache (detik)
+    SESSION_CHECK = os.getenv("SESSION_CHECK", "True").lower() == "true"
+    SESSION_CHECK_TTL = int(os.getenv("SESSION_CHECK_TTL", 1800))
+    SESSION_CHECK_TIMEOUT = int(os.getenv("SESSION_CHECK_TIMEOUT", 10000))
+    # Job platform dengan session mati: "anonymous" (scrape tanpa login) atau "skip"
+    SESSION_DEAD_ACTION = os.getenv("SESSION_DEAD_ACTION", "anonymous").lower()
+
+    # Recycling browser pool & memory watchdog (RSS Chromium + Python)
+    RECYCLE_CONTEXT_PAGES = int(os.getenv("RECYCLE_CONTEXT_PAGES", 40))
+    RECYCLE_CONTEXT_MINUTES = int(os.getenv("RECYCLE_CONTEXT_MINUTES", 30))
+    RECYCLE_BROWSER_PAGES = int(os.getenv("RECYCLE_BROWSER_PAGES", 200))
+    RECYCLE_BROWSER_MINUTES = int(os.getenv("RECYCLE_BROWSER_MINUTES", 120))
+    RECYCLE_MEMORY_MB = int(os.getenv("RECYCLE_MEMORY_MB", 1500))
+    WATCHDOG_INTERVAL = int(os.getenv("WATCHDOG_INTERVAL", 30))
+
+    # Cache asset (JS/CSS/font) di disk, dipakai antar run & antar worker
+    ASSET_CACHE = os.getenv("ASSET_CACHE", "False").lower() == "true"
+    ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR", ".asset_cache")
+    # Batas total semua platform
+    ASSET_CACHE_MAX_MB = int(os.getenv("ASSET_CACHE_MAX_MB", 200))
+    ASSET_CACHE_TTL_HOURS = float(os.getenv("ASSET_CACHE_TTL_HOURS", 24))
+
+    # Job ledger (SQLite) untuk resume & multi-worker
+    LEDGER_FILE = os.getenv("LEDGER_FILE", "jobs.db")
+    # WAL untuk disk lokal; pakai DELETE jika file ledger dibagi antar host lewat network filesystem
+    LEDGER_JOURNAL_MODE = os.getenv("LEDGER_JOURNAL_MODE", "WAL")
+    LEDGER_HEARTBEAT = int(os.getenv("LEDGER_HEARTBEAT", 10))
+    LEDGER_STALE_SECONDS = int(os.getenv("LEDGER_STALE_SECONDS", 120))
+    LEDGER_MAX_ATTEMPTS = int(os.getenv("LEDGER_MAX_ATTEMPTS", 3))
+
+    # Circuit breaker per platform (Captcha / login redirect berturut-turut)
+    BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", 3))
+    BREAKER_BASE_COOLDOWN = int(os.getenv("BREAKER_BASE_COOLDOWN", 300))
+    BREAKER_MAX_COOLDOWN = int(os.getenv("BREAKER_MAX_COOLDOWN", 21600))
+    BREAKER_PROBE_TIMEOUT = int(os.getenv("BREAKER_PROBE_TIMEOUT", 300))
+    
+    # Near-duplicate detection (MinHash + LSH) sebelum NLP/LLM
+    DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "True").lower() == "true"
+    DEDUP_DB = os.getenv("DEDUP_DB", "dedup.db")
+    # bands x rows = jumlah permutasi MinHash; 16 x 4 -> kandidat mulai di Jaccard ~0.5
+    DEDUP_BANDS = int(os.getenv("DEDUP_BANDS", 16))
+    DEDUP_ROWS = int(os.getenv("DEDUP_ROWS", 4))
+    DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", 0.8))
+    DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS", 7))
+    # Proses yang hidup lama (--serve / --monitor) prune cluster kedaluwarsa tiap N detik
+    DEDUP_PRUNE_INTERVAL = int(os.getenv("DEDUP_PRUNE_INTERVAL", 3600))
+    
+    # Corpus TF-IDF incremental (document frequency ter-hash, per keyword & global)
+    CORPUS_DB = os.getenv("CORPUS_DB", "corpus.db")
+    CORPUS_HASH_BITS = int(os.getenv("CORPUS_HASH_BITS", 20))
+    # Minimal dokumen di korpus keyword sebelum dipakai sebagai baseline (selain itu global)
+    CORPUS_MIN_DOCS = int(os.getenv("CORPUS_MIN_DOCS", 50))
+    
+    # Trending terms (Space-Saving top-k per keyword per bucket waktu, di CORPUS_DB)
+    TRENDING_CAPACITY = int(os.getenv("TRENDING_CAPACITY", 200))
+    TRENDING_BUCKET_SECONDS = int(os.getenv("TRENDING_BUCKET_SECONDS", 3600))
+    
+    # Inverted index full-text atas item mentah & summary (python main.py --search ...)
+    SEARCH_INDEX = os.getenv("SEARCH_INDEX", "True").lower() == "true"
+    SEARCH_DB = os.getenv("SEARCH_DB", "search.db")
+    # Ukuran blok posting list sebelum term mulai blok baru
+    SEARCH_BLOCK_BYTES = int(os.getenv("SEARCH_BLOCK_BYTES", 4096))
+    
+    # Export Parquet terpartisi (date/keyword/platform), butuh pyarrow
+    PARQUET_EXPORT = os.getenv("PARQUET_EXPORT", "True").lower() == "true"
+    PARQUET_DIR = os.getenv("PARQUET_DIR", "parquet")
+    PARQUET_FLUSH_ROWS = int(os.getenv("PARQUET_FLUSH_ROWS", 50))
+    
+    # Report parsial ke analysis_summary.txt setiap N job selesai (0 = hanya di akhir run)
+    REPORT_EVERY = int(os.getenv("REPORT_EVERY", 10))
+    
+    # Service mode (python main.py --serve): job API lokal, pipeline tetap warm
+    SERVICE_HOST = os.getenv("SERVICE_HOST", "127.0.0.1")
+    SERVICE_PORT = int(os.getenv("SERVICE_PORT", 8765))
+    SERVICE_SOCKET = os.getenv("SERVICE_SOCKET", "")  # diisi path -> Unix socket, bukan TCP
+    
+    # Monitoring adaptif (python main.py --monitor): interval refresh (detik) per trend_strength
+    SCHEDULE_VIRAL = int(os.getenv("SCHEDULE_VIRAL", 900))
+    SCHEDULE_RISING = int(os.getenv("SCHEDULE_RISING", 3600))
+    SCHEDULE_STABLE = int(os.getenv("SCHEDULE_STABLE", 6 * 3600))
+    SCHEDULE_DECLINING = int(os.getenv("SCHEDULE_DECLINING", 12 * 3600))
+    SCHEDULE_MIN = int(os.getenv("SCHEDULE_MIN", 300))
+    SCHEDULE_MAX = int(os.getenv("SCHEDULE_MAX", 48 * 3600))
+    # Skor berubah >= SCHEDULE_CHANGE -> interval dipersingkat; tidak berubah -> dikali SCHEDULE_BACKOFF
+    SCHEDULE_CHANGE = float(os.getenv("SCHEDULE_CHANGE", 2))
+    SCHEDULE_BACKOFF = float(os.getenv("SCHEDULE_BACKOFF", 1.5))
+    # Back off maksimal N x interval dasar trend (Viral 900s -> paling lama 1 jam)
+    SCHEDULE_BACKOFF_CAP = float(os.getenv("SCHEDULE_BACKOFF_CAP", 4))
+    # Batas global kapasitas scrape + inference
+    SCHEDULE_BUDGET_PER_HOUR = int(os.getenv("SCHEDULE_BUDGET_PER_HOUR", 60))
+    SCHEDULE_TICK = int(os.getenv("SCHEDULE_TICK", 60))
+    
+    # Profiling per stage (python main.py --profile [DIR]); kosong = nonaktif
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "")
+    PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", 25))
+    
+    # Logger (utils/logger.py): I/O di thread background; LOG_FILE kosong = stdout
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()  # text | json
+    LOG_FILE = os.getenv("LOG_FILE", "")
+    # Event frekuensi tinggi (mis. angka engagement) hanya 1 dari N yang ditulis
+    LOG_SAMPLE_RATE = int(os.getenv("LOG_SAMPLE_RATE", 100))
+    LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
     
     # Parsing keyword dari koma menjadi list
     KEYWORDS = [k.strip() for k in os.getenv("TARGET_KEYWORDS", "").split(",") if k.strip()]
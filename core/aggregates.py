@@ -0,0 +1,142 @@
+# core/aggregates.py
+"""
+Streaming Aggregates per Run
+- Agregator online per keyword & per platform: count, mean, max, distribusi sentiment,
+  mix tier, persentil aproksimasi dari histogram skor (bin tetap -> memori konstan)
+- Di-update setiap job selesai; state disimpan di file ledger (aman multi-worker & resume)
+- Report parsial bisa dibuat kapan saja selama run berjalan (python main.py --report)
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from typing import Dict, Optional
+
+from config import settings
+
+SCOPE_KEYWORD = "keyword"
+SCOPE_PLATFORM = "platform"
+
+# Skor 0-10 dengan resolusi 0.5
+HISTOGRAM_BINS = 21
+BIN_WIDTH = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS aggregates (
+    run_id  TEXT NOT NULL,
+    scope   TEXT NOT NULL,
+    name    TEXT NOT NULL,
+    state   TEXT NOT NULL,
+    PRIMARY KEY (run_id, scope, name)
+);
+"""
+
+
+class RunningStats:
+    def __init__(self, state: dict = None):
+        state = state or {}
+        self.count = state.get("count", 0)
+        self.mean = state.get("mean", 0.0)
+        self.max = state.get("max")
+        self.max_label = state.get("max_label")
+        self.histogram = state.get("histogram", [0] * HISTOGRAM_BINS)
+        self.sentiments = Counter(state.get("sentiments", {}))
+        self.tiers = Counter(state.get("tiers", {}))
+        self.llm_tiers = Counter(state.get("llm_tiers", {}))
+        # Skor terakhir per label (platform untuk scope keyword; jumlahnya terbatas)
+        self.breakdown = state.get("breakdown", {})
+
+    def add(self, score: float, label: str = None, sentiment: str = None, tier: str = None,
+            llm_tier: str = None, trend: str = None, track_label: bool = False):
+        self.count += 1
+        self.mean += (score - self.mean) / self.count
+        if self.max is None or score > self.max:
+            self.max, self.max_label = score, label
+
+        index = min(HISTOGRAM_BINS - 1, max(0, int(round(score / BIN_WIDTH))))
+        self.histogram[index] += 1
+
+        if sentiment:
+            self.sentiments[sentiment] += 1
+        if tier:
+            self.tiers[tier] += 1
+        if llm_tier:
+            self.llm_tiers[llm_tier] += 1
+        if track_label and label:
+            self.breakdown[label] = {"score": score, "trend": trend}
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Persentil dari histogram (akurat sampai lebar bin)"""
+        if not self.count:
+            return None
+        target = p / 100 * self.count
+        cumulative = 0
+        for index, n in enumerate(self.histogram):
+            cumulative += n
+            if cumulative >= target:
+                return index * BIN_WIDTH
+        return (HISTOGRAM_BINS - 1) * BIN_WIDTH
+
+    def to_state(self) -> dict:
+        return {
+            "count": self.count, "mean": self.mean, "max": self.max, "max_label": self.max_label,
+            "histogram": self.histogram, "sentiments": dict(self.sentiments),
+            "tiers": dict(self.tiers), "llm_tiers": dict(self.llm_tiers), "breakdown": self.breakdown,
+        }
+
+
+class RunAggregates:
+    def __init__(self, path: str = None):
+        self.conn = sqlite3.connect(path or settings.LEDGER_FILE, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def _update(self, run_id: str, scope: str, name: str, **fields):
+        row = self.conn.execute(
+            "SELECT state FROM aggregates WHERE run_id = ? AND scope = ? AND name = ?", (run_id, scope, name)
+        ).fetchone()
+        stats = RunningStats(json.loads(row["state"]) if row else None)
+        stats.add(**fields)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO aggregates (run_id, scope, name, state) VALUES (?, ?, ?, ?)",
+            (run_id, scope, name, json.dumps(stats.to_state(), ensure_ascii=False))
+        )
+
+    def record(self, run_id: str, result: dict):
+        """Masukkan satu hasil ke agregat keyword & platform (read-modify-write atomik)"""
+        try:
+            score = float(result.get('score', 0))
+        except (TypeError, ValueError):
+            return
+        nlp = result.get('nlp_analysis') or {}
+        common = {
+            "sentiment": nlp.get('sentiment_label'),
+            "tier": result.get('tier'),
+            "llm_tier": result.get('llm_tier'),
+            "trend": result.get('trend_strength'),
+        }
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._update(run_id, SCOPE_KEYWORD, result['keyword'], score=score,
+                         label=result['platform'], track_label=True, **common)
+            self._update(run_id, SCOPE_PLATFORM, result['platform'], score=score,
+                         label=result['keyword'], **common)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def load(self, run_id: str) -> Dict[str, Dict[str, RunningStats]]:
+        """{scope: {name: RunningStats}}"""
+        aggregates = {SCOPE_KEYWORD: {}, SCOPE_PLATFORM: {}}
+        rows = self.conn.execute(
+            "SELECT scope, name, state FROM aggregates WHERE run_id = ? ORDER BY name", (run_id,)
+        ).fetchall()
+        for row in rows:
+            aggregates[row["scope"]][row["name"]] = RunningStats(json.loads(row["state"]))
+        return aggregates
+
+    def close(self):
+        self.conn.close()
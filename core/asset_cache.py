@@ -0,0 +1,191 @@
+# core/asset_cache.py
+"""
+Disk-backed Asset Cache
+- Cache JS/CSS/font platform di disk, dipakai ulang antar context & antar run
+- File per platform, index bersama di SQLite (<dir>/index.db) -> aman untuk worker multi-proses
+- Batas ukuran global (semua platform) dengan eviksi LRU, entry kedaluwarsa setelah TTL
+  (di-fetch ulang dari network)
+- Statistik hit ratio & bytes yang tidak perlu didownload ulang
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+CACHEABLE_TYPES = {"script", "stylesheet", "font"}
+
+# Header yang tidak boleh ikut di-replay saat fulfill dari disk
+SKIP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "set-cookie", "date", "age"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    platform   TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    size       INTEGER NOT NULL,
+    headers    TEXT NOT NULL,
+    stored_at  REAL NOT NULL,
+    last_used  REAL NOT NULL,
+    PRIMARY KEY (platform, key)
+);
+CREATE INDEX IF NOT EXISTS idx_assets_lru ON assets (last_used);
+"""
+
+
+class AssetCache:
+    def __init__(self, root_dir: str, max_bytes: int, ttl: float = 86400):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.touched = {}   # (platform, key) -> last_used, ditulis ke index saat flush()
+        self.stats = {"hits": 0, "misses": 0, "bytes_avoided": 0, "bytes_stored": 0, "evictions": 0}
+
+        os.makedirs(root_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root_dir, "index.db"), timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def _platform_dir(self, platform: str) -> str:
+        return os.path.join(self.root_dir, platform)
+
+    def _path(self, platform: str, key: str) -> str:
+        return os.path.join(self._platform_dir(platform), key)
+
+    # ===== GET / PUT =====
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _remove(self, platform: str, key: str):
+        try:
+            os.remove(self._path(platform, key))
+        except OSError:
+            pass
+
+    def get(self, platform: str, url: str):
+        """Return (headers, body) atau None (tidak ada / kedaluwarsa)"""
+        key = self._key(url)
+        row = self.conn.execute(
+            "SELECT headers, stored_at FROM assets WHERE platform = ? AND key = ?", (platform, key)
+        ).fetchone()
+        if not row or time.time() - row["stored_at"] >= self.ttl:
+            return None
+
+        try:
+            with open(self._path(platform, key), "rb") as f:
+                body = f.read()
+        except OSError:
+            # Sudah dieviksi proses lain
+            self.conn.execute("DELETE FROM assets WHERE platform = ? AND key = ?", (platform, key))
+            return None
+
+        self.touched[(platform, key)] = time.time()
+        return json.loads(row["headers"]), body
+
+    def put(self, platform: str, url: str, headers: dict, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+
+        key = self._key(url)
+        directory = self._platform_dir(platform)
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self._path(platform, key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, self._path(platform, key))
+
+        now = time.time()
+        headers = {k: v for k, v in headers.items() if k.lower() not in SKIP_HEADERS}
+        self.conn.execute(
+            "INSERT OR REPLACE INTO assets (platform, key, url, size, headers, stored_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (platform, key, url, len(body), json.dumps(headers), now, now)
+        )
+        self.stats["bytes_stored"] += len(body)
+        self._evict()
+
+    def _evict(self):
+        """Hapus entry kedaluwarsa, lalu yang paling lama tidak dipakai sampai total (semua platform) <= max_bytes"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            victims = self.conn.execute(
+                "SELECT platform, key, size FROM assets WHERE stored_at < ?", (time.time() - self.ttl,)
+            ).fetchall()
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM assets").fetchone()[0]
+            total -= sum(row["size"] for row in victims)
+            if total > self.max_bytes:
+                for row in self.conn.execute(
+                    "SELECT platform, key, size FROM assets WHERE stored_at >= ? ORDER BY last_used",
+                    (time.time() - self.ttl,)
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    victims.append(row)
+                    total -= row["size"]
+            self.conn.executemany("DELETE FROM assets WHERE platform = ? AND key = ?",
+                                  [(row["platform"], row["key"]) for row in victims])
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        for row in victims:
+            self._remove(row["platform"], row["key"])
+        self.stats["evictions"] += len(victims)
+
+    def flush(self):
+        """Tulis waktu pemakaian terakhir (LRU) ke index bersama"""
+        if not self.touched:
+            return
+        self.conn.executemany(
+            "UPDATE assets SET last_used = MAX(last_used, ?) WHERE platform = ? AND key = ?",
+            [(last_used, platform, key) for (platform, key), last_used in self.touched.items()]
+        )
+        self.touched.clear()
+
+    # ===== PLAYWRIGHT ROUTE =====
+    def route_handler(self, platform: str):
+        """Handler untuk context.route('**/*', ...) milik platform ini"""
+        async def handle(route):
+            request = route.request
+            if request.method != "GET" or request.resource_type not in CACHEABLE_TYPES:
+                await route.fallback()
+                return
+
+            cached = self.get(platform, request.url)
+            if cached:
+                headers, body = cached
+                self.stats["hits"] += 1
+                self.stats["bytes_avoided"] += len(body)
+                await route.fulfill(status=200, headers=headers, body=body)
+                return
+
+            self.stats["misses"] += 1
+            try:
+                response = await route.fetch()
+            except Exception:
+                # Biarkan browser yang menangani request (dan error-nya) seperti biasa
+                await route.fallback()
+                return
+            body = await response.body()
+            cache_control = response.headers.get("cache-control", "")
+            if response.status == 200 and "no-store" not in cache_control:
+                self.put(platform, request.url, response.headers, body)
+            await route.fulfill(response=response, body=body)
+
+        return handle
+
+    def summary(self) -> str:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        ratio = self.stats["hits"] / lookups if lookups else 0
+        return (f"[CACHE] Asset hit ratio: {ratio:.0%} ({self.stats['hits']}/{lookups}), "
+                f"bytes avoided: {self.stats['bytes_avoided'] / 1_048_576:.1f} MB, "
+                f"evictions: {self.stats['evictions']}")
+
+    def close(self):
+        self.flush()
+        self.conn.close()
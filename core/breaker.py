@@ -0,0 +1,142 @@
+# core/breaker.py
+"""
+Circuit Breaker per Platform
+- Trip setelah N sinyal blokir berturut-turut (Captcha / login redirect)
+- Cooldown tumbuh eksponensial setiap kali trip lagi
+- Setelah cooldown, satu probe (half-open) menentukan breaker tertutup atau terbuka lagi
+- Outcome netral (empty, error, deadline) tidak mengubah hitungan; hanya saat half-open
+  error/deadline dihitung sebagai probe gagal
+- State disimpan di SQLite (file ledger) agar bertahan antar run & antar worker
+"""
+
+import sqlite3
+import time
+from typing import Dict
+
+from config import settings
+from scrapers.base import ScrapeOutcome
+from utils.logger import get_logger
+
+log = get_logger("BREAKER")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Outcome scraper yang dihitung sebagai sinyal blokir (Captcha / login wall)
+BLOCK_OUTCOMES = {ScrapeOutcome.BLOCKED, ScrapeOutcome.LOGIN_REQUIRED}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS breakers (
+    platform      TEXT PRIMARY KEY,
+    state         TEXT NOT NULL DEFAULT 'closed',
+    failures      INTEGER NOT NULL DEFAULT 0,
+    trips         INTEGER NOT NULL DEFAULT 0,
+    open_until    REAL NOT NULL DEFAULT 0,
+    probe_started REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+def is_block_signal(raw_data) -> bool:
+    return getattr(raw_data, "outcome", None) in BLOCK_OUTCOMES
+
+
+class CircuitBreaker:
+    def __init__(self, path: str = None):
+        self.conn = sqlite3.connect(path or settings.LEDGER_FILE, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def _row(self, platform: str) -> sqlite3.Row:
+        self.conn.execute("INSERT OR IGNORE INTO breakers (platform) VALUES (?)", (platform,))
+        return self.conn.execute("SELECT * FROM breakers WHERE platform = ?", (platform,)).fetchone()
+
+    def _update(self, platform: str, **fields):
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        self.conn.execute(f"UPDATE breakers SET {assignments} WHERE platform = ?", (*fields.values(), platform))
+
+    def allow(self, platform: str) -> bool:
+        """True jika job platform ini boleh jalan (termasuk sebagai probe half-open)"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._row(platform)
+            allowed = True
+
+            if row["state"] == OPEN:
+                if now < row["open_until"]:
+                    allowed = False
+                else:
+                    # Cooldown selesai -> caller ini jadi probe
+                    self._update(platform, state=HALF_OPEN, probe_started=now)
+                    log.info("%s: half-open, mengirim probe", platform, platform=platform)
+            elif row["state"] == HALF_OPEN:
+                # Hanya satu probe dalam satu waktu (probe yang macet dianggap hilang setelah timeout)
+                if now - row["probe_started"] < settings.BREAKER_PROBE_TIMEOUT:
+                    allowed = False
+                else:
+                    self._update(platform, probe_started=now)
+
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return allowed
+
+    def record_success(self, platform: str):
+        row = self._row(platform)
+        if row["state"] != CLOSED:
+            log.info("%s: probe berhasil, breaker ditutup", platform, platform=platform)
+        self._update(platform, state=CLOSED, failures=0, trips=0, open_until=0, probe_started=0)
+
+    def _trip(self, platform: str, row: sqlite3.Row, failures: int):
+        trips = row["trips"] + 1
+        cooldown = min(settings.BREAKER_BASE_COOLDOWN * 2 ** (trips - 1), settings.BREAKER_MAX_COOLDOWN)
+        self._update(platform, state=OPEN, failures=failures, trips=trips,
+                     open_until=time.time() + cooldown, probe_started=0)
+        log.warning("%s: TRIP #%d, cooldown %ss", platform, trips, cooldown,
+                    platform=platform, trips=trips, cooldown=cooldown)
+
+    def record_block(self, platform: str):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._row(platform)
+            failures = row["failures"] + 1
+
+            if row["state"] == HALF_OPEN or failures >= settings.BREAKER_THRESHOLD:
+                self._trip(platform, row, failures)
+            else:
+                self._update(platform, failures=failures)
+
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def record_failure(self, platform: str):
+        """Error / deadline: netral saat closed, probe gagal saat half-open"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._row(platform)
+            if row["state"] == HALF_OPEN:
+                log.info("%s: probe gagal (error/deadline)", platform, platform=platform)
+                self._trip(platform, row, row["failures"])
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def record_neutral(self, platform: str):
+        """Hasil kosong: tidak membuktikan blokir maupun pulih; slot probe half-open dilepas"""
+        self.conn.execute(
+            "UPDATE breakers SET probe_started = 0 WHERE platform = ? AND state = ?", (platform, HALF_OPEN)
+        )
+
+    def status(self) -> Dict[str, dict]:
+        rows = self.conn.execute("SELECT * FROM breakers WHERE state != ?", (CLOSED,)).fetchall()
+        return {row["platform"]: dict(row) for row in rows}
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,278 @@
+# core/browser.py
+"""
+Browser Pool
+- Satu Chromium per run, satu context "hangat" per platform (cookie jar, service worker, HTTP cache tetap hidup)
+- Session login per platform (sessions/<platform>.json), di-reload hanya jika cookie auth di file
+  berubah (login ulang); platform dengan session mati bisa dipaksa anonymous
+- Storage state disimpan balik secara periodik, bukan per job, dan hanya oleh satu proses
+  (save_sessions) agar worker lain tidak saling menimpa cookie
+- Opsional: asset JS/CSS/font dilayani dari cache disk bersama (antar run & antar worker)
+- Recycling: context di-recreate setelah N page / M menit, browser di-restart saat RSS Chromium
+  melewati batas; page yang masih jalan di-drain dulu
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+from playwright.async_api import async_playwright
+
+from config import settings
+from core.asset_cache import AssetCache
+from core.memory import sample_rss
+from core.session import (load_session, migrate_legacy_session, session_fingerprint, session_path,
+                          state_fingerprint, write_session)
+from utils.logger import get_logger
+
+log = get_logger("POOL")
+
+# Resource yang tidak dibutuhkan saat data diambil dari network payload (BLOCK_RESOURCES)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_URL_PATTERN = "**/*.{png,jpg,jpeg,gif,webp,avif,svg,ico,mp4,webm,m4s,woff,woff2,ttf,otf}"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+class BrowserPool:
+    def __init__(self, session_dir: str = None, save_sessions: bool = True):
+        self.session_dir = session_dir or settings.SESSION_DIR
+        self.save_sessions = save_sessions
+        migrate_legacy_session(self.session_dir)
+        self.playwright = None
+        self.browser = None
+        self.contexts = {}        # platform -> BrowserContext
+        self.context_session = {}  # platform -> fingerprint session saat context dibuat (None = anonymous)
+        self.anonymous = set()    # platform yang session-nya mati -> scrape tanpa login
+        self._last_save = time.monotonic()
+
+        # Recycling & memory watchdog
+        self.context_pages = {}      # platform -> page dibuka sejak context dibuat
+        self.context_started = {}    # platform -> monotonic saat context dibuat
+        self.in_flight = Counter()   # platform -> page yang masih terbuka
+        self.page_platform = {}      # page -> platform
+        self.recycle_contexts = {}   # platform -> alasan (menunggu in-flight habis)
+        self.recycle_browser = None  # alasan restart browser (menunggu semua in-flight habis)
+        self.browser_pages = 0
+        self.browser_started = None
+        self._last_sample = 0.0
+        self.stats = {"context_recycles": Counter(), "browser_recycles": Counter(),
+                      "peak_python": 0, "peak_browser": 0, "samples": 0}
+
+        self.asset_cache = None
+        if settings.ASSET_CACHE:
+            self.asset_cache = AssetCache(settings.ASSET_CACHE_DIR, settings.ASSET_CACHE_MAX_MB * 1_048_576,
+                                          settings.ASSET_CACHE_TTL_HOURS * 3600)
+
+    async def start(self):
+        if self.browser:
+            return
+        if not self.playwright:
+            self.playwright = await async_playwright().start()
+        self.browser_pages = 0
+        self.browser_started = time.monotonic()
+        self.browser = await self.playwright.chromium.launch(
+            headless=settings.HEADLESS,
+            args=["--disable-blink-features=AutomationControlled"]
+        )
+
+    def _session_fingerprint(self, platform: str):
+        if platform in self.anonymous:
+            return None
+        return session_fingerprint(platform, self.session_dir)
+
+    def set_anonymous(self, platform: str, anonymous: bool):
+        """Paksa platform jalan tanpa login (session mati); context dibuat ulang saat page berikutnya"""
+        if anonymous and platform not in self.anonymous:
+            log.warning("Session %s mati, lanjut Mode Anonymous", platform, platform=platform)
+            self.anonymous.add(platform)
+        elif not anonymous:
+            self.anonymous.discard(platform)
+
+    async def get_context(self, platform: str):
+        """Context warm untuk platform; dibuat ulang hanya jika login di file session-nya berubah"""
+        await self.start()
+        fingerprint = self._session_fingerprint(platform)
+        path = session_path(platform, self.session_dir)
+
+        context = self.contexts.get(platform)
+        if context and self.context_session.get(platform) == fingerprint:
+            return context
+
+        if context:
+            log.info("Session %s berubah, reload context", platform, platform=platform)
+            await context.close()
+
+        context_options = {"user_agent": USER_AGENT}
+        if fingerprint is None:
+            if platform not in self.anonymous:
+                log.warning("%s tidak ditemukan! Mode Anonymous (%s).", path, platform, platform=platform)
+        else:
+            log.info("Menggunakan %s (Login Mode) untuk %s", path, platform, platform=platform)
+            context_options["storage_state"] = path
+
+        context = await self.browser.new_context(**context_options)
+        # Routing apa pun mematikan HTTP cache context -> hanya dipasang jika diminta
+        if self.asset_cache:
+            await context.route("**/*", self.asset_cache.route_handler(platform))
+        if settings.BLOCK_RESOURCES:
+            await context.route(BLOCKED_URL_PATTERN, self._block_resource)
+        self.contexts[platform] = context
+        self.context_session[platform] = fingerprint
+        self.context_pages[platform] = 0
+        self.context_started[platform] = time.monotonic()
+        return context
+
+    @staticmethod
+    async def _block_resource(route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.fallback()
+
+    async def new_page(self, platform: str):
+        # Restart browser tertunda: page baru menunggu sampai page lama selesai (drain)
+        while self.recycle_browser and sum(self.in_flight.values()):
+            await asyncio.sleep(0.5)
+        await self._apply_recycles()
+
+        context = await self.get_context(platform)
+        page = await context.new_page()
+        self.page_platform[page] = platform
+        self.in_flight[platform] += 1
+        self.context_pages[platform] += 1
+        self.browser_pages += 1
+        return page
+
+    async def release(self, page):
+        """Tutup page job; context tetap hidup untuk keyword berikutnya (kecuali waktunya recycle)"""
+        platform = self.page_platform.pop(page, None)
+        await page.close()
+        if platform:
+            self.in_flight[platform] -= 1
+            self._check_limits(platform)
+            await self._apply_recycles()
+
+        if time.monotonic() - self._last_save >= settings.SESSION_SAVE_INTERVAL:
+            await self.save_state()
+            if self.asset_cache:
+                self.asset_cache.flush()
+
+    # ===== RECYCLING & WATCHDOG =====
+    def _check_limits(self, platform: str):
+        """Tandai context/browser untuk recycle; eksekusi menunggu in-flight habis"""
+        now = time.monotonic()
+        if platform in self.contexts and platform not in self.recycle_contexts:
+            if self.context_pages.get(platform, 0) >= settings.RECYCLE_CONTEXT_PAGES:
+                self.recycle_contexts[platform] = "pages"
+            elif now - self.context_started.get(platform, now) >= settings.RECYCLE_CONTEXT_MINUTES * 60:
+                self.recycle_contexts[platform] = "age"
+
+        if self.recycle_browser or not self.browser:
+            return
+        if self.browser_pages >= settings.RECYCLE_BROWSER_PAGES:
+            self.recycle_browser = "pages"
+        elif now - self.browser_started >= settings.RECYCLE_BROWSER_MINUTES * 60:
+            self.recycle_browser = "age"
+        elif now - self._last_sample >= settings.WATCHDOG_INTERVAL:
+            self._last_sample = now
+            rss = sample_rss()
+            if not rss:
+                return
+            self.stats["samples"] += 1
+            self.stats["peak_python"] = max(self.stats["peak_python"], rss["python"])
+            self.stats["peak_browser"] = max(self.stats["peak_browser"], rss["browser"])
+            if rss["browser"] >= settings.RECYCLE_MEMORY_MB * 1_048_576:
+                log.warning("RSS browser %.0f MB melewati batas %d MB", rss['browser'] / 1_048_576,
+                            settings.RECYCLE_MEMORY_MB, rss_browser=rss['browser'])
+                self.recycle_browser = "memory"
+
+    async def _apply_recycles(self):
+        if self.recycle_browser:
+            if not sum(self.in_flight.values()):
+                await self._restart_browser()
+            return
+        for platform, reason in list(self.recycle_contexts.items()):
+            if not self.in_flight[platform]:
+                await self._close_context(platform, reason)
+
+    async def _close_context(self, platform: str, reason: str):
+        # Simpan cookie/login dulu agar context baru melanjutkan sesi yang sama
+        if self.context_session.get(platform) is not None:
+            await self.save_state()
+        context = self.contexts.pop(platform, None)
+        if context:
+            await context.close()
+        log.info("Recycle context %s (%s, %d page)", platform, reason, self.context_pages.get(platform, 0),
+                 platform=platform, reason=reason)
+        self.context_session.pop(platform, None)
+        self.context_pages.pop(platform, None)
+        self.context_started.pop(platform, None)
+        self.recycle_contexts.pop(platform, None)
+        self.stats["context_recycles"][f"{platform}:{reason}"] += 1
+
+    async def _restart_browser(self):
+        reason = self.recycle_browser
+        if self.contexts:
+            await self.save_state()
+        for context in self.contexts.values():
+            await context.close()
+        self.contexts.clear()
+        self.context_session.clear()
+        self.context_pages.clear()
+        self.context_started.clear()
+        self.recycle_contexts.clear()
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        log.info("Restart browser (%s, %d page); diluncurkan ulang saat job berikutnya", reason, self.browser_pages,
+                 reason=reason)
+        self.stats["browser_recycles"][reason] += 1
+        self.recycle_browser = None
+
+    def summary(self) -> str:
+        contexts = ", ".join(f"{key}×{n}" for key, n in sorted(self.stats["context_recycles"].items())) or "-"
+        browsers = ", ".join(f"{key}×{n}" for key, n in sorted(self.stats["browser_recycles"].items())) or "-"
+        memory = "RSS tidak tersedia"
+        if self.stats["samples"]:
+            memory = (f"peak RSS python {self.stats['peak_python'] / 1_048_576:.0f} MB, "
+                      f"browser {self.stats['peak_browser'] / 1_048_576:.0f} MB")
+        return f"[POOL] Recycle context: {contexts} | restart browser: {browsers} | {memory}"
+
+    async def save_state(self):
+        """Simpan storage state tiap context login ke file session platform-nya (jika berubah)"""
+        self._last_save = time.monotonic()
+        if not self.save_sessions:
+            return
+
+        saved = []
+        for platform, context in self.contexts.items():
+            if self.context_session.get(platform) is None:
+                continue
+            state = await context.storage_state()
+            if state == load_session(platform, self.session_dir):
+                continue
+            write_session(platform, state, self.session_dir)
+            # Tulisan kita sendiri tidak boleh memicu reload context
+            self.context_session[platform] = state_fingerprint(platform, state)
+            saved.append(platform)
+        if saved:
+            log.info("Session state disimpan ke %s/ (%s)", self.session_dir, ", ".join(sorted(saved)))
+
+    async def close(self):
+        if self.contexts:
+            await self.save_state()
+        for context in self.contexts.values():
+            await context.close()
+        self.contexts.clear()
+        if self.asset_cache:
+            self.asset_cache.close()
+            self.asset_cache = None
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
@@ -0,0 +1,260 @@
+# core/capture.py
+"""
+Network Response Capture
+- Dengarkan page.on("response") dan parse payload JSON/GraphQL platform
+- Hasilkan item record (teks + angka engagement asli) tanpa menunggu render DOM
+- DOM extraction di scraper tetap jadi fallback
+"""
+
+import asyncio
+import json
+import re
+from typing import Dict, List, Optional
+
+
+# URL fragment yang berisi data hasil pencarian per platform
+CAPTURE_PATTERNS = {
+    "tiktok": ["/api/search/general/full", "/api/search/item/full", "/api/search/video/full"],
+    "youtube": ["/youtubei/v1/search", "/results?search_query"],
+    "threads": ["/api/graphql", "/graphql/query"],
+    "twitter": ["/SearchTimeline"],
+}
+
+# Pemisah antar item (post/tweet/video) di output scraper; teks satu item boleh multi-baris
+ITEM_SEPARATOR = "\n---\n"
+
+YT_INITIAL_DATA_RE = re.compile(r'(?:var\s+ytInitialData|window\["ytInitialData"\])\s*=\s*(\{.+?\});\s*</script>', re.S)
+
+
+def _walk(obj, key: str):
+    """Cari semua dict yang punya `key` secara rekursif (payload platform sangat nested)"""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if key in current:
+                yield current
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+NUMBER_RE = re.compile(r'(\d[\d.,]*)(?:\s*(ribu|rb|juta|jt|miliar|mlr|k|m|b)(?![a-z]))?')
+MULTIPLIERS = {"ribu": 1e3, "rb": 1e3, "k": 1e3, "juta": 1e6, "jt": 1e6, "m": 1e6,
+               "miliar": 1e9, "mlr": 1e9, "b": 1e9}
+
+
+def _parse_number(digits: str, scaled: bool) -> float:
+    """Angka dengan pemisah locale en ('1,234.5') atau id ('1.234,5') -> float"""
+    digits = digits.rstrip(".,")
+    if "." in digits and "," in digits:
+        # Pemisah yang muncul terakhir adalah desimal
+        decimal = "." if digits.rfind(".") > digits.rfind(",") else ","
+    elif digits.count(".") + digits.count(",") == 1:
+        separator = "." if "." in digits else ","
+        # '1,2 rb' / '1.2K' -> desimal; '1.234' / '1,234' tanpa suffix -> ribuan
+        decimal = separator if scaled or len(digits.split(separator)[1]) != 3 else None
+    else:
+        # Tanpa pemisah, atau beberapa grup ('1.234.567') -> semuanya pemisah ribuan
+        decimal = None
+
+    thousands = {".", ","} - {decimal}
+    for separator in thousands:
+        digits = digits.replace(separator, "")
+    return float(digits.replace(",", ".")) if decimal else float(digits)
+
+
+def _to_int(value) -> Optional[int]:
+    """Konversi angka dari payload ke int, locale en & id (Accept-Language id-ID):
+    1234, '1,234', '1.2K views' (en) dan '1.234.567 x ditonton', '1,2 rb', '3 jt' (id)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    match = NUMBER_RE.search(str(value).strip().lower())
+    if not match:
+        return None
+
+    suffix = match.group(2)
+    number = _parse_number(match.group(1), scaled=suffix is not None)
+    return int(round(number * MULTIPLIERS.get(suffix, 1)))
+
+
+def _yt_text(node) -> str:
+    """YouTube menyimpan teks sebagai {'simpleText': ...} atau {'runs': [{'text': ...}]}"""
+    if not isinstance(node, dict):
+        return ""
+    if "simpleText" in node:
+        return node["simpleText"]
+    return "".join(run.get("text", "") for run in node.get("runs", []))
+
+
+def _item(text: str, **metrics) -> Dict:
+    """Bentuk standar item record"""
+    record = {"text": " ".join((text or "").split())}
+    for name, value in metrics.items():
+        record[name] = value
+    return record
+
+
+# ================================
+#  PARSER PER PLATFORM
+# ================================
+def parse_tiktok(payload: dict) -> List[Dict]:
+    items = []
+    for node in _walk(payload, "desc"):
+        stats = node.get("stats") or {}
+        if not node.get("id") or not stats:
+            continue
+        author = node.get("author") or {}
+        items.append(_item(
+            node.get("desc", ""),
+            id=node.get("id"),
+            author=author.get("uniqueId") if isinstance(author, dict) else author,
+            views=_to_int(stats.get("playCount")),
+            likes=_to_int(stats.get("diggCount")),
+            comments=_to_int(stats.get("commentCount")),
+            shares=_to_int(stats.get("shareCount")),
+        ))
+    return items
+
+
+def parse_youtube(payload: dict) -> List[Dict]:
+    items = []
+    for node in _walk(payload, "videoRenderer"):
+        video = node["videoRenderer"]
+        if not isinstance(video, dict) or not video.get("videoId"):
+            continue
+        items.append(_item(
+            _yt_text(video.get("title")),
+            id=video.get("videoId"),
+            author=_yt_text(video.get("ownerText")),
+            views=_to_int(_yt_text(video.get("viewCountText"))),
+            published=_yt_text(video.get("publishedTimeText")),
+        ))
+    return items
+
+
+def parse_threads(payload: dict) -> List[Dict]:
+    items = []
+    for node in _walk(payload, "caption"):
+        caption = node.get("caption")
+        if not isinstance(caption, dict) or not caption.get("text"):
+            continue
+        user = node.get("user") or {}
+        text_info = node.get("text_post_app_info") or {}
+        items.append(_item(
+            caption["text"],
+            id=node.get("pk") or node.get("id"),
+            author=user.get("username"),
+            likes=_to_int(node.get("like_count")),
+            comments=_to_int(text_info.get("direct_reply_count")),
+            shares=_to_int(text_info.get("repost_count")),
+        ))
+    return items
+
+
+def parse_twitter(payload: dict) -> List[Dict]:
+    items = []
+    for node in _walk(payload, "legacy"):
+        legacy = node["legacy"]
+        if not isinstance(legacy, dict) or "full_text" not in legacy:
+            continue
+        views = (node.get("views") or {}).get("count")
+        items.append(_item(
+            legacy["full_text"],
+            id=legacy.get("id_str") or node.get("rest_id"),
+            views=_to_int(views),
+            likes=_to_int(legacy.get("favorite_count")),
+            comments=_to_int(legacy.get("reply_count")),
+            shares=_to_int(legacy.get("retweet_count")),
+        ))
+    return items
+
+
+PARSERS = {
+    "tiktok": parse_tiktok,
+    "youtube": parse_youtube,
+    "threads": parse_threads,
+    "twitter": parse_twitter,
+}
+
+
+def extract_yt_initial_data(html: str) -> Optional[dict]:
+    """Ambil objek ytInitialData yang di-embed di HTML halaman YouTube"""
+    match = YT_INITIAL_DATA_RE.search(html or "")
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None
+
+
+def format_items(items: List[Dict], label: str, limit: int = 10) -> str:
+    """Ubah item record jadi teks per item, dipisah ITEM_SEPARATOR (format sama dengan DOM scraper)"""
+    lines = []
+    for i, item in enumerate(items[:limit]):
+        metrics = [
+            f"{name}: {item[name]}"
+            for name in ("views", "likes", "comments", "shares")
+            if item.get(name) is not None
+        ]
+        meta = f" ({' | '.join(metrics)})" if metrics else ""
+        lines.append(f"{label} {i+1}: {item['text']}{meta}")
+    return ITEM_SEPARATOR.join(lines)
+
+
+# ================================
+#  CAPTURE LAYER
+# ================================
+class ResponseCapture:
+    """Kumpulkan item dari response network selama halaman dimuat"""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.patterns = CAPTURE_PATTERNS.get(platform, [])
+        self.parser = PARSERS.get(platform)
+        self.items: List[Dict] = []
+        self._seen_ids = set()
+        self._got_items = asyncio.Event()
+
+    def attach(self, page):
+        # Listener ikut hilang saat page ditutup setelah job
+        page.on("response", self._on_response)
+
+    async def _on_response(self, response):
+        if not self.parser or not any(p in response.url for p in self.patterns):
+            return
+
+        try:
+            if response.request.resource_type == "document":
+                payload = extract_yt_initial_data(await response.text())
+            else:
+                payload = await response.json()
+        except Exception:
+            # Body tidak tersedia (redirect/preflight) atau bukan JSON
+            return
+
+        if payload:
+            self.add_items(self.parser(payload))
+
+    def add_items(self, items: List[Dict]):
+        for item in items:
+            key = item.get("id") or item["text"]
+            if not item["text"] or key in self._seen_ids:
+                continue
+            self._seen_ids.add(key)
+            self.items.append(item)
+
+        if self.items:
+            self._got_items.set()
+
+    async def wait_for_items(self, timeout_ms: int) -> List[Dict]:
+        """Tunggu sampai ada item tertangkap, atau timeout (return list kosong)"""
+        try:
+            await asyncio.wait_for(self._got_items.wait(), timeout=timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+        return self.items
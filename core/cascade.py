@@ -0,0 +1,101 @@
+# core/cascade.py
+"""
+Confidence-based LLM Cascade
+- heuristic : NLP sudah yakin & teks pendek -> hasil dari NLP, tanpa LLM
+- small     : kasus menengah -> model kecil (LLM_SMALL_MODEL)
+- main      : ambigu / panjang -> model utama (OLLAMA_MODEL)
+"""
+
+import math
+from typing import Dict
+
+from config import settings
+from core.nlp_analyzer import NLPAnalyzer
+
+TIER_HEURISTIC = "heuristic"
+TIER_SMALL = "small"
+TIER_MAIN = "main"
+
+# Leksikon sederhana untuk kategori heuristik (Indonesian + English, kata dasar)
+CATEGORY_WORDS = {
+    "Technology": {"ai", "tech", "teknologi", "framework", "coding", "program", "golang", "python",
+                   "javascript", "web", "app", "aplikasi", "software", "developer", "gadget", "hp"},
+    "Business": {"bisnis", "usaha", "jualan", "market", "marketing", "saham", "investasi", "uang",
+                 "startup", "umkm", "profit", "cuan", "modal", "ekonomi"},
+    "Entertainment": {"film", "musik", "lagu", "artis", "game", "movie", "drama", "konser", "viral",
+                      "lucu", "meme", "anime", "series", "video"},
+    "Sports": {"bola", "sepak", "liga", "match", "timnas", "gol", "olahraga", "badminton", "motogp",
+               "football", "basket"},
+    "Social Issue": {"politik", "pemerintah", "demo", "isu", "hukum", "korupsi", "pemilu", "rakyat",
+                     "kebijakan", "sosial"},
+}
+
+# Keyword NLP sudah di-stem robust_tokenize (coding -> cod, bisnis -> bisni): leksikon ikut di-stem
+CATEGORY_LEXICON = {category: {NLPAnalyzer._simple_stem(word) for word in words}
+                    for category, words in CATEGORY_WORDS.items()}
+
+
+class CascadePolicy:
+    """Tentukan tier inference dari confidence NLP & panjang input"""
+
+    @staticmethod
+    def nlp_confidence(nlp_result: dict) -> float:
+        """0-1: seberapa yakin NLP (kekuatan VADER, dikurangi jika VADER & TextBlob tidak sepakat)"""
+        if not nlp_result:
+            return 0.0
+        sentiment = nlp_result['sentiment']
+        confidence = sentiment['vader'].get('confidence', 0)
+        if sentiment['vader']['label'] != sentiment['textblob']['label']:
+            confidence *= 0.5
+        return confidence
+
+    @staticmethod
+    def choose_tier(raw_text: str, nlp_result: dict) -> str:
+        if not settings.CASCADE_ENABLED or not nlp_result:
+            return TIER_MAIN
+
+        confidence = CascadePolicy.nlp_confidence(nlp_result)
+        length = len(raw_text or "")
+
+        if confidence >= settings.CASCADE_HIGH_CONFIDENCE and length <= settings.CASCADE_SHORT_CHARS:
+            return TIER_HEURISTIC
+        if (settings.LLM_SMALL_MODEL and confidence >= settings.CASCADE_MEDIUM_CONFIDENCE
+                and length <= settings.CASCADE_MEDIUM_CHARS):
+            return TIER_SMALL
+        return TIER_MAIN
+
+    @staticmethod
+    def heuristic_result(nlp_result: dict) -> Dict:
+        """Hasil format LLM yang dibangun dari NLP saja"""
+        keywords = [kw[0] for kw in nlp_result['keywords']]
+        avg_engagement = nlp_result['engagement']['avg_engagement']
+
+        # Kategori: leksikon dengan overlap keyword terbanyak
+        overlaps = {cat: len(words.intersection(keywords)) for cat, words in CATEGORY_LEXICON.items()}
+        best_category = max(overlaps, key=overlaps.get)
+        category = best_category if overlaps[best_category] > 0 else "Other"
+
+        # Skor popularitas dari skala log engagement (1rb ~ 5, 1jt ~ 8); tanpa angka pakai sentiment
+        if avg_engagement > 0:
+            score = min(10, max(1, round(math.log10(avg_engagement) + 2)))
+        else:
+            score = round(nlp_result['sentiment']['score'])
+
+        if avg_engagement >= 1_000_000:
+            trend = "Viral"
+        elif avg_engagement >= 100_000:
+            trend = "Rising"
+        else:
+            trend = "Stable"
+
+        label = nlp_result['sentiment']['label']
+        summary = f"Konten didominasi sentimen {label.lower()}"
+        if keywords:
+            summary += f" seputar {', '.join(keywords[:3])}"
+
+        return {
+            "summary": summary + ".",
+            "score": score,
+            "category": category,
+            "trend_strength": trend
+        }
@@ -0,0 +1,122 @@
+# core/corpus.py
+"""
+Corpus-level TF-IDF (incremental, persisted)
+- Document frequency disimpan di SQLite per keyword & global, tanpa refit vectorizer
+- Vocabulary di-hash ke 2^CORPUS_HASH_BITS bucket -> ukuran tabel terbatas berapapun korpusnya
+- Satu dokumen = satu item (post/tweet/video); skor hasil baru O(jumlah token)
+- "Distinctive terms": term dengan TF-IDF tertinggi terhadap baseline sebelum hasil ini masuk
+"""
+
+import hashlib
+import math
+import re
+import sqlite3
+from collections import Counter
+from typing import Callable, List, Tuple
+
+from config import settings
+from core.dedup import split_items, shingle_text
+
+GLOBAL_SCOPE = "*"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS doc_freq (
+    scope   TEXT NOT NULL,
+    bucket  INTEGER NOT NULL,
+    df      INTEGER NOT NULL,
+    PRIMARY KEY (scope, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS doc_count (
+    scope   TEXT PRIMARY KEY,
+    docs    INTEGER NOT NULL
+);
+"""
+
+
+class CorpusIDF:
+    def __init__(self, tokenizer: Callable[[str], List[str]] = None, path: str = None):
+        self.tokenizer = tokenizer or (lambda text: re.findall(r'\w+', text.lower()))
+        self.mask = (1 << settings.CORPUS_HASH_BITS) - 1
+
+        self.conn = sqlite3.connect(path or settings.CORPUS_DB, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def _bucket(self, term: str) -> int:
+        return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "big") & self.mask
+
+    def _doc_count(self, scope: str) -> int:
+        row = self.conn.execute("SELECT docs FROM doc_count WHERE scope = ?", (scope,)).fetchone()
+        return row["docs"] if row else 0
+
+    def _doc_freqs(self, scope: str, buckets: List[int]) -> dict:
+        freqs = {}
+        # Batas jumlah parameter SQLite -> query per 500 bucket
+        for i in range(0, len(buckets), 500):
+            part = buckets[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT bucket, df FROM doc_freq WHERE scope = ? AND bucket IN ({','.join('?' * len(part))})",
+                (scope, *part)
+            ).fetchall()
+            freqs.update((row["bucket"], row["df"]) for row in rows)
+        return freqs
+
+    def distinctive_terms(self, raw_text: str, keyword: str, top_n: int = 10) -> List[Tuple[str, float]]:
+        """Skor TF-IDF hasil ini terhadap korpus, lalu masukkan item-nya ke korpus"""
+        # Tanpa nomor urut & angka engagement, sama seperti dedup
+        token_lists = [self.tokenizer(shingle_text(item)) for item in split_items(raw_text)]
+        documents = [set(tokens) for tokens in token_lists if tokens]
+        term_freq = Counter(term for tokens in token_lists for term in tokens)
+        if not term_freq:
+            return []
+
+        # Baseline keyword jika sudah cukup besar, selain itu korpus global
+        scope = keyword.lower()
+        if self._doc_count(scope) < settings.CORPUS_MIN_DOCS:
+            scope = GLOBAL_SCOPE
+        total_docs = self._doc_count(scope)
+
+        buckets = {term: self._bucket(term) for term in term_freq}
+        freqs = self._doc_freqs(scope, list(set(buckets.values())))
+
+        total_terms = sum(term_freq.values())
+        scores = []
+        for term, count in term_freq.items():
+            idf = math.log((1 + total_docs) / (1 + freqs.get(buckets[term], 0))) + 1
+            scores.append((term, round(count / total_terms * idf, 4)))
+        scores.sort(key=lambda pair: pair[1], reverse=True)
+
+        self.add_documents(keyword, documents)
+        return scores[:top_n]
+
+    def add_documents(self, keyword: str, documents: List[set]):
+        """Update document frequency (per keyword & global) dalam satu transaksi"""
+        if not documents:
+            return
+        # Hash collision dalam satu dokumen: df per dokumen tetap maksimal 1
+        bucket_docs = Counter()
+        for doc in documents:
+            bucket_docs.update({self._bucket(term) for term in doc})
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for scope in (keyword.lower(), GLOBAL_SCOPE):
+                self.conn.executemany(
+                    "INSERT INTO doc_freq (scope, bucket, df) VALUES (?, ?, ?) "
+                    "ON CONFLICT (scope, bucket) DO UPDATE SET df = df + excluded.df",
+                    [(scope, bucket, n) for bucket, n in bucket_docs.items()]
+                )
+                self.conn.execute(
+                    "INSERT INTO doc_count (scope, docs) VALUES (?, ?) "
+                    "ON CONFLICT (scope) DO UPDATE SET docs = docs + excluded.docs",
+                    (scope, len(documents))
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,46 @@
+# core/deadline.py
+"""
+Deadline Budget per Job
+- Satu budget end-to-end (scrape -> NLP -> LLM) per job, bisa diatur per platform
+- Setiap stage memakai SISA budget, bukan timeout sendiri-sendiri
+- Lewat deadline -> stage dibatalkan & DeadlineExceeded dilempar ke worker
+"""
+
+import asyncio
+import time
+
+from config import settings
+
+
+class DeadlineExceeded(Exception):
+    """Budget waktu job habis di stage tertentu"""
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def for_platform(cls, platform: str) -> "Deadline":
+        return cls(settings.JOB_BUDGETS.get(platform, settings.JOB_BUDGET))
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def remaining_ms(self, cap_ms: int = None) -> int:
+        """Sisa budget dalam ms (dibatasi cap_ms, mis. settings.TIMEOUT)"""
+        remaining = int(self.remaining() * 1000)
+        return min(cap_ms, remaining) if cap_ms is not None else remaining
+
+    def check(self, stage: str):
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(f"budget {self.budget}s habis sebelum stage '{stage}'")
+
+    async def run(self, awaitable, stage: str):
+        """Jalankan awaitable dengan sisa budget; dibatalkan jika deadline lewat"""
+        self.check(stage)
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"budget {self.budget}s habis di stage '{stage}'") from None
@@ -0,0 +1,231 @@
+# core/dedup.py
+"""
+Near-Duplicate Detection (MinHash + LSH)
+- Shingle 3-kata dari output robust_tokenize per item
+- Signature MinHash, di-bucket per band (LSH) di SQLite -> lookup lewat index, bukan scan
+- Satu representatif per cluster dikirim ke NLP/LLM; ukuran cluster disimpan sebagai bobot
+  (dipakai untuk sentiment/keyword NLP & trending term)
+- Cluster berlaku dalam satu run & antar run terbaru (DEDUP_WINDOW_DAYS); cluster & bucket
+  yang lebih tua dihapus saat index dibuka
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import time
+from array import array
+from collections import Counter
+from typing import Callable, List, Tuple
+
+from config import settings
+from core.capture import ITEM_SEPARATOR
+from utils.logger import get_logger
+
+log = get_logger("DEDUP")
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+# "Tweet 3: ..." / "Video 1: ..." -> nomor urut bukan bagian dari konten
+ITEM_PREFIX_RE = re.compile(r'^\s*\w+ \d+:\s*')
+# Angka engagement dari capture layer berubah antar run, jangan ikut di-shingle
+METRICS_SUFFIX_RE = re.compile(r'\s*\((?:views|likes|comments|shares):[^)]*\)\s*$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clusters (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    size        INTEGER NOT NULL DEFAULT 1,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    platforms   TEXT NOT NULL,
+    signature   BLOB NOT NULL,
+    sample      TEXT
+);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    band        INTEGER NOT NULL,
+    bucket      INTEGER NOT NULL,
+    cluster_id  INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lsh_lookup ON lsh_buckets (band, bucket);
+CREATE INDEX IF NOT EXISTS idx_lsh_cluster ON lsh_buckets (cluster_id);
+CREATE INDEX IF NOT EXISTS idx_clusters_last_seen ON clusters (last_seen);
+"""
+
+
+def _hash64(data: bytes) -> int:
+    """Hash 63-bit (muat di INTEGER SQLite)"""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big") >> 1
+
+
+def split_items(raw_text: str) -> List[str]:
+    """Pecah output scraper menjadi item (post/tweet/video) di ITEM_SEPARATOR; newline di dalam item tetap"""
+    parts = raw_text.split(ITEM_SEPARATOR)
+    items = []
+    for part in parts:
+        part = part.strip()
+        if part:
+            items.append(part)
+    return items
+
+
+def shingle_text(item: str) -> str:
+    """Bagian item yang menentukan kemiripan (tanpa nomor urut & angka engagement)"""
+    return METRICS_SUFFIX_RE.sub("", ITEM_PREFIX_RE.sub("", item))
+
+
+class MinHasher:
+    def __init__(self, num_perm: int, seed: int = 42):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+
+    @staticmethod
+    def shingles(tokens: List[str], size: int = 3) -> set:
+        if len(tokens) < size:
+            return {" ".join(tokens)} if tokens else set()
+        return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+    def signature(self, shingles: set) -> Tuple[int, ...]:
+        hashes = [_hash64(s.encode("utf-8")) for s in shingles]
+        return tuple(min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self.params)
+
+
+class DedupIndex:
+    def __init__(self, tokenizer: Callable[[str], List[str]] = None, path: str = None):
+        self.tokenizer = tokenizer or (lambda text: re.findall(r'\w+', text.lower()))
+        self.bands = settings.DEDUP_BANDS
+        self.rows = settings.DEDUP_ROWS
+        self.hasher = MinHasher(self.bands * self.rows)
+
+        self.conn = sqlite3.connect(path or settings.DEDUP_DB, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+        self.prune()
+
+    def prune(self):
+        """Hapus cluster di luar DEDUP_WINDOW_DAYS beserta bucket LSH-nya (tidak akan pernah cocok lagi)"""
+        self._last_prune = time.monotonic()
+        since = time.time() - settings.DEDUP_WINDOW_DAYS * 86400
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "DELETE FROM lsh_buckets WHERE cluster_id IN (SELECT id FROM clusters WHERE last_seen < ?)", (since,)
+            )
+            removed = self.conn.execute("DELETE FROM clusters WHERE last_seen < ?", (since,)).rowcount
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        if removed:
+            log.info("%d cluster lama (> %d hari) dihapus", removed, settings.DEDUP_WINDOW_DAYS, removed=removed)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[int]:
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            keys.append(_hash64(array("Q", rows).tobytes()))
+        return keys
+
+    @staticmethod
+    def _similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """Estimasi Jaccard: fraksi slot MinHash yang sama"""
+        return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+    def _find_cluster(self, signature, band_keys, since: float):
+        """Kandidat dari bucket LSH (lookup index per band), verifikasi dengan signature"""
+        seen = set()
+        for band, bucket in enumerate(band_keys):
+            rows = self.conn.execute(
+                "SELECT c.id, c.signature FROM lsh_buckets b JOIN clusters c ON c.id = b.cluster_id "
+                "WHERE b.band = ? AND b.bucket = ? AND c.last_seen >= ?",
+                (band, bucket, since)
+            ).fetchall()
+            for row in rows:
+                if row["id"] in seen:
+                    continue
+                seen.add(row["id"])
+                candidate = tuple(array("Q", row["signature"]))
+                if self._similarity(signature, candidate) >= settings.DEDUP_THRESHOLD:
+                    return row["id"]
+        return None
+
+    def filter(self, raw_text: str, platform: str) -> Tuple[str, dict, dict]:
+        """
+        Return (teks berisi item representatif saja, statistik dedup, batch untuk commit()).
+        Hanya membaca index: cluster baru & bobot duplikat baru ditulis lewat commit() setelah
+        analisis berhasil, agar job yang di-retry tidak menganggap item miliknya sendiri duplikat.
+        """
+        since = time.time() - settings.DEDUP_WINDOW_DAYS * 86400
+        items = split_items(raw_text)
+        batch = {"platform": platform, "new": [], "hits": Counter()}
+
+        for item in items:
+            shingles = self.hasher.shingles(self.tokenizer(shingle_text(item)))
+            if not shingles:
+                continue
+
+            signature = self.hasher.signature(shingles)
+            # Duplikat di dalam batch yang sama (mis. repost di halaman yang sama)
+            twin = next((new for new in batch["new"]
+                         if self._similarity(signature, new["signature"]) >= settings.DEDUP_THRESHOLD), None)
+            if twin:
+                twin["size"] += 1
+                continue
+
+            band_keys = self._band_keys(signature)
+            cluster_id = self._find_cluster(signature, band_keys, since)
+            if cluster_id:
+                batch["hits"][cluster_id] += 1
+                continue
+
+            batch["new"].append({"item": item, "signature": signature, "band_keys": band_keys, "size": 1})
+
+        representatives = [new["item"] for new in batch["new"]]
+        stats = {
+            "items": len(items),
+            "unique": len(representatives),
+            "duplicates": len(items) - len(representatives),
+            # Bobot per representatif = ukuran cluster-nya di batch ini
+            "weights": [new["size"] for new in batch["new"]],
+        }
+        if stats["duplicates"]:
+            log.info("%s: %d/%d item near-duplicate dilewati", platform, stats['duplicates'], len(items),
+                     platform=platform, duplicates=stats['duplicates'], items=len(items))
+        return ITEM_SEPARATOR.join(representatives), stats, batch
+
+    def commit(self, batch: dict):
+        """Simpan cluster baru + tambah bobot cluster lama (satu transaksi)"""
+        now = time.time()
+        platform = batch["platform"]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for cluster_id, hits in batch["hits"].items():
+                self.conn.execute(
+                    "UPDATE clusters SET size = size + ?, last_seen = ?, "
+                    "platforms = CASE WHEN instr(platforms, ?) THEN platforms ELSE platforms || ',' || ? END "
+                    "WHERE id = ?",
+                    (hits, now, platform, platform, cluster_id)
+                )
+            for new in batch["new"]:
+                cursor = self.conn.execute(
+                    "INSERT INTO clusters (size, first_seen, last_seen, platforms, signature, sample) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (new["size"], now, now, platform, array("Q", new["signature"]).tobytes(), new["item"][:300])
+                )
+                self.conn.executemany(
+                    "INSERT INTO lsh_buckets (band, bucket, cluster_id) VALUES (?, ?, ?)",
+                    [(band, bucket, cursor.lastrowid) for band, bucket in enumerate(new["band_keys"])]
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        # Saat dibuka saja tidak cukup untuk proses --serve / --monitor yang berjalan berhari-hari
+        if time.monotonic() - self._last_prune >= settings.DEDUP_PRUNE_INTERVAL:
+            self.prune()
+
+    def close(self):
+        self.conn.close()
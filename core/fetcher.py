@@ -0,0 +1,98 @@
+# core/fetcher.py
+"""
+Tiered Fetcher
+- Tier 1 (http): httpx client dengan connection pool + parser HTML per platform
+- Tier 2 (browser): Playwright, hanya jika tier 1 kena bot wall, login redirect, atau kosong
+"""
+
+import httpx
+
+from config import settings
+from scrapers.base import ScrapeResult
+from scrapers.http_parsers import HTTP_PARSERS
+from utils.logger import get_logger
+
+log = get_logger("HTTP")
+
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+# URL search server-rendered per platform (params di-encode oleh httpx)
+HTTP_URLS = {
+    "google": ("https://www.google.com/search", lambda kw: {"q": kw, "hl": "id", "gl": "id"}),
+    "youtube": ("https://www.youtube.com/results", lambda kw: {"search_query": kw}),
+}
+
+BOT_WALL_URL_MARKERS = ["/sorry/", "google_abuse", "captcha"]
+BOT_WALL_BODY_MARKERS = ["unusual traffic", "/httpservice/retry/enablejs"]
+LOGIN_MARKERS = ["login", "signin", "consent."]
+
+
+class TieredFetcher:
+    """Coba fetch HTTP biasa dulu; return None jika harus eskalasi ke browser"""
+
+    def __init__(self):
+        self.client = httpx.AsyncClient(
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                "Accept-Language": "id-ID,id;q=0.9,en;q=0.8",
+            },
+            timeout=settings.HTTP_TIMEOUT / 1000,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    @staticmethod
+    def supports(platform: str) -> bool:
+        return settings.HTTP_TIER and platform in HTTP_PARSERS
+
+    async def fetch(self, platform: str, keyword: str):
+        """Return teks hasil parsing, atau None jika perlu browser"""
+        if not self.supports(platform):
+            return None
+
+        url, build_params = HTTP_URLS[platform]
+        try:
+            response = await self.client.get(url, params=build_params(keyword))
+        except httpx.HTTPError as e:
+            log.info("%s gagal (%s), eskalasi ke browser", platform, e.__class__.__name__, platform=platform)
+            return None
+
+        reason = self._escalation_reason(response)
+        if reason:
+            log.info("%s: %s, eskalasi ke browser", platform, reason, platform=platform)
+            return None
+
+        text = HTTP_PARSERS[platform](response.text)
+        if not text.strip():
+            log.info("%s: hasil kosong, eskalasi ke browser", platform, platform=platform)
+            return None
+
+        log.info("%s dilayani tanpa browser (%d chars)", platform, len(text), platform=platform, chars=len(text))
+        return ScrapeResult.ok(text)
+
+    @staticmethod
+    def _escalation_reason(response: httpx.Response):
+        # Host + path saja: query berisi keyword pencarian ("login", "captcha" bisa jadi keyword)
+        final_url = f"{response.url.host}{response.url.path}".lower()
+
+        if response.status_code in (403, 429, 503):
+            return f"bot wall (HTTP {response.status_code})"
+        if any(marker in final_url for marker in LOGIN_MARKERS):
+            return "login redirect"
+        if any(marker in final_url for marker in BOT_WALL_URL_MARKERS):
+            return "bot wall"
+        if response.status_code != 200 or not response.text:
+            return f"response kosong (HTTP {response.status_code})"
+
+        head = response.text[:20000].lower()
+        if any(marker in head for marker in BOT_WALL_BODY_MARKERS):
+            return "bot wall"
+        return None
+
+    async def close(self):
+        await self.client.aclose()
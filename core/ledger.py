@@ -0,0 +1,225 @@
+# core/ledger.py
+"""
+Durable Job Ledger (SQLite)
+- Satu baris per job keyword x platform beserta state-nya
+- Worker (proses / host) claim job secara atomik, kirim heartbeat, release jika gagal
+- Run yang terputus bisa di-resume dari job yang belum selesai
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id      TEXT NOT NULL,
+    keyword     TEXT NOT NULL,
+    platform    TEXT NOT NULL,
+    state       TEXT NOT NULL DEFAULT 'pending',
+    worker      TEXT,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    heartbeat   REAL,
+    error       TEXT,
+    outcome     TEXT,
+    result      TEXT,
+    updated_at  REAL NOT NULL,
+    UNIQUE (run_id, keyword, platform)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (run_id, state, id);
+"""
+
+
+class JobLedger:
+    def __init__(self, path: str = None):
+        self.path = path or settings.LEDGER_FILE
+        # isolation_level=None -> transaksi dikontrol manual (BEGIN IMMEDIATE untuk claim)
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(f"PRAGMA journal_mode={settings.LEDGER_JOURNAL_MODE}")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Tambah kolom baru ke ledger lama"""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "outcome" not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN outcome TEXT")
+
+    # ===== RUN MANAGEMENT =====
+    @staticmethod
+    def new_run_id() -> str:
+        return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    def latest_open_run(self) -> Optional[str]:
+        """Run terakhir yang masih punya job pending/running (untuk resume)"""
+        row = self.conn.execute(
+            "SELECT run_id FROM jobs WHERE state IN (?, ?) ORDER BY id DESC LIMIT 1",
+            (PENDING, RUNNING)
+        ).fetchone()
+        return row["run_id"] if row else None
+
+    def latest_run(self) -> Optional[str]:
+        row = self.conn.execute("SELECT run_id FROM jobs ORDER BY id DESC LIMIT 1").fetchone()
+        return row["run_id"] if row else None
+
+    def enqueue(self, run_id: str, keywords: List[str], platforms: List[str]) -> int:
+        """Buat job keyword x platform (job yang sudah ada tidak diduplikasi)"""
+        return self.enqueue_pairs(run_id, [(kw, platform) for kw in keywords for platform in platforms])
+
+    def enqueue_pairs(self, run_id: str, pairs: List[Tuple[str, str]]) -> int:
+        """Buat job untuk pasangan (keyword, platform) tertentu saja"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (run_id, keyword, platform, updated_at) VALUES (?, ?, ?, ?)",
+                [(run_id, kw, platform, now) for kw, platform in pairs]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return cursor.rowcount
+
+    # ===== CLAIM & HEARTBEAT =====
+    @staticmethod
+    def _worker_dead(worker: str) -> bool:
+        """Worker "<host>:<pid>[:suffix]" di host ini yang prosesnya sudah tidak ada"""
+        host, _, rest = (worker or "").partition(":")
+        pid = rest.split(":")[0]
+        # os.kill(pid, 0) hanya aman (tanpa efek) di POSIX; host lain -> tunggu heartbeat stale
+        if os.name != "posix" or host != socket.gethostname() or not pid.isdigit():
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass
+        return False
+
+    def claim(self, run_id: str, worker: str) -> Optional[sqlite3.Row]:
+        """Ambil satu job pending secara atomik (job worker mati / stale di-requeue dulu)"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "UPDATE jobs SET state = ?, worker = NULL, updated_at = ? "
+                "WHERE run_id = ? AND state = ? AND heartbeat < ?",
+                (PENDING, now, run_id, RUNNING, now - settings.LEDGER_STALE_SECONDS)
+            )
+            # Proses lokal yang sudah mati (Ctrl-C / kill) tidak perlu ditunggu sampai stale
+            dead = [row["id"] for row in self.conn.execute(
+                "SELECT id, worker FROM jobs WHERE run_id = ? AND state = ?", (run_id, RUNNING)
+            ) if self._worker_dead(row["worker"])]
+            self.conn.executemany(
+                "UPDATE jobs SET state = ?, worker = NULL, updated_at = ? WHERE id = ?",
+                [(PENDING, now, job_id) for job_id in dead]
+            )
+            row = self.conn.execute(
+                "SELECT * FROM jobs WHERE run_id = ? AND state = ? ORDER BY id LIMIT 1",
+                (run_id, PENDING)
+            ).fetchone()
+            if row:
+                self.conn.execute(
+                    "UPDATE jobs SET state = ?, worker = ?, attempts = attempts + 1, "
+                    "heartbeat = ?, updated_at = ? WHERE id = ?",
+                    (RUNNING, worker, now, now, row["id"])
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def heartbeat(self, job_id: int, worker: str):
+        self.conn.execute(
+            "UPDATE jobs SET heartbeat = ? WHERE id = ? AND worker = ? AND state = ?",
+            (time.time(), job_id, worker, RUNNING)
+        )
+
+    # ===== STATE TRANSITIONS =====
+    # Semua transisi hanya berlaku jika job masih running milik worker ini: job yang sudah
+    # di-requeue (heartbeat stale) & di-claim worker lain tidak boleh diselesaikan worker lama.
+    # Return False jika job sudah bukan milik worker ini.
+    def _finish(self, job_id: int, worker: str, state: str, outcome: str,
+                error: str = None, result: dict = None) -> bool:
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = ?, outcome = ?, error = ?, result = ?, updated_at = ? "
+            "WHERE id = ? AND worker = ? AND state = ?",
+            (state, outcome, error, json.dumps(result, ensure_ascii=False) if result is not None else None,
+             time.time(), job_id, worker, RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result: dict) -> bool:
+        return self._finish(job_id, worker, DONE, "ok", result=result)
+
+    def skip(self, job_id: int, worker: str, outcome: str, reason: str = None) -> bool:
+        return self._finish(job_id, worker, SKIPPED, outcome, error=reason)
+
+    def release(self, job_id: int, worker: str, error: str, outcome: str = "error") -> bool:
+        """Job gagal: kembalikan ke antrian, atau tandai failed jika sudah melebihi batas retry"""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker = NULL, "
+            "outcome = ?, error = ?, updated_at = ? WHERE id = ? AND worker = ? AND state = ?",
+            (settings.LEDGER_MAX_ATTEMPTS, FAILED, PENDING, outcome, error, time.time(), job_id, worker, RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    def requeue(self, job_id: int, worker: str) -> bool:
+        """Job terputus (Ctrl-C / cancel): kembali ke antrian tanpa menghabiskan jatah retry"""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = ?, worker = NULL, attempts = MAX(attempts - 1, 0), updated_at = ? "
+            "WHERE id = ? AND worker = ? AND state = ?",
+            (PENDING, time.time(), job_id, worker, RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    # ===== QUERY =====
+    def counts(self, run_id: str) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT state, COUNT(*) AS n FROM jobs WHERE run_id = ? GROUP BY state", (run_id,)
+        ).fetchall()
+        return {row["state"]: row["n"] for row in rows}
+
+    def outcome_counts(self, run_id: str) -> Dict[str, Dict[str, int]]:
+        """Jumlah outcome per platform: {platform: {outcome: n}}"""
+        rows = self.conn.execute(
+            "SELECT platform, outcome, COUNT(*) AS n FROM jobs "
+            "WHERE run_id = ? AND outcome IS NOT NULL GROUP BY platform, outcome", (run_id,)
+        ).fetchall()
+        counts = {}
+        for row in rows:
+            counts.setdefault(row["platform"], {})[row["outcome"]] = row["n"]
+        return counts
+
+    def jobs(self, run_id: str) -> List[dict]:
+        """Semua job run ini beserta outcome & result (result sudah di-decode)"""
+        rows = self.conn.execute(
+            "SELECT keyword, platform, state, outcome, result FROM jobs WHERE run_id = ? ORDER BY id", (run_id,)
+        ).fetchall()
+        return [{**dict(row), "result": json.loads(row["result"]) if row["result"] else None} for row in rows]
+
+    def results(self, run_id: str) -> List[dict]:
+        rows = self.conn.execute(
+            "SELECT result FROM jobs WHERE run_id = ? AND state = ? ORDER BY id", (run_id, DONE)
+        ).fetchall()
+        return [json.loads(row["result"]) for row in rows if row["result"]]
+
+    def close(self):
+        self.conn.close()
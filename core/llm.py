@@ -7,7 +7,19 @@ Combines AI + Traditional NLP untuk hasil yang lebih akurat
 import ollama
 import json
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from config import settings
+from core.llm_session import LLMSession
+from core.cascade import CascadePolicy, TIER_HEURISTIC, TIER_SMALL
+from core.capture import ITEM_SEPARATOR
+from core.deadline import DeadlineExceeded
+from core.dedup import split_items
+from utils.profiler import profiler
+from utils.logger import get_logger
+
+log = get_logger("LLM")
+cascade_log = get_logger("CASCADE")
 
 # Import NLP Analyzer
 try:
@@ -15,27 +27,31 @@ try:
     NLP_ENABLED = True
 except ImportError as e:
     NLP_ENABLED = False
-    print(f"[WARN] NLP Analyzer tidak tersedia: {e}")
+    log.warning("NLP Analyzer tidak tersedia: %s", e)
 
 
 class LLMProcessor:
     def __init__(self):
-        self.client = ollama.Client(host=settings.OLLAMA_URL)
+        self.client = ollama.Client(host=settings.OLLAMA_URL, timeout=settings.LLM_TIMEOUT)
         self.model = settings.OLLAMA_MODEL
+
+        # Session: preload model + keep_alive, system prompt statis (prefix cache)
+        self.session = LLMSession(self.client, self.model)
+        self.session.warm_up()
         
         # Initialize NLP Analyzer
         self.nlp_analyzer = None
         if NLP_ENABLED:
             try:
                 self.nlp_analyzer = NLPAnalyzer()
-                print("[✓] NLP Analyzer initialized successfully")
+                log.info("NLP Analyzer initialized successfully")
             except Exception as e:
                 self.nlp_analyzer = None
-                print(f"[!] NLP Analyzer failed to initialize: {e}")
+                log.warning("NLP Analyzer failed to initialize: %s", e)
         else:
             self.nlp_analyzer = None
 
-    def analyze_content(self, raw_text: str, query: str) -> dict:
+    def analyze_content(self, raw_text: str, query: str, deadline=None, weights: list = None) -> dict:
         """
         Enhanced Analysis: Combines LLM + NLP
         Returns: {
@@ -51,46 +67,149 @@ class LLMProcessor:
         nlp_result = None
         if self.nlp_analyzer:
             try:
-                nlp_result = self.nlp_analyzer.comprehensive_analysis(raw_text)
-                print(f"[NLP] Sentiment: {nlp_result['sentiment']['label']} "
-                      f"(Score: {nlp_result['sentiment']['score']})")
+                with profiler.stage("nlp"):
+                    # Bobot cluster near-duplicate: sentiment & keyword tetap mewakili semua copy
+                    nlp_result = self.nlp_analyzer.comprehensive_analysis(raw_text, deadline, weights)
+                log.debug("NLP sentiment: %s (Score: %s)",
+                          nlp_result['sentiment']['label'], nlp_result['sentiment']['score'])
+            except DeadlineExceeded:
+                raise
             except Exception as e:
-                print(f"[!] NLP Analysis error: {e}")
+                log.error("NLP Analysis error: %s", e)
                 nlp_result = None
         
-        # ===== 2. LLM ANALYSIS =====
-        llm_prompt = self._build_enhanced_prompt(raw_text, query, nlp_result)
+        # ===== 2. CASCADE: pilih tier inference =====
+        tier = CascadePolicy.choose_tier(raw_text, nlp_result)
+
+        if tier == TIER_HEURISTIC:
+            cascade_log.info("NLP yakin & teks pendek -> hasil heuristik, tanpa LLM", tier=TIER_HEURISTIC)
+            llm_result = CascadePolicy.heuristic_result(nlp_result)
+        else:
+            # Budget job sudah habis -> jangan mulai inference (DeadlineExceeded ke worker)
+            if deadline:
+                deadline.check("llm")
+
+            model = settings.LLM_SMALL_MODEL if tier == TIER_SMALL else self.model
+            cascade_log.info("Tier %s -> %s", tier, model, tier=tier, model=model)
+
+            chunks = self._split_chunks(raw_text) if settings.LLM_CHUNKED else [raw_text]
+            if len(chunks) > 1:
+                llm_result = self._map_reduce(chunks, query, nlp_result, model, deadline)
+            else:
+                llm_prompt = self._build_enhanced_prompt(raw_text, query, nlp_result)
+                llm_result = self._run_llm(llm_prompt, model, deadline)
         
+        # ===== 3. COMBINE RESULTS =====
+        combined_result = self._combine_analysis(llm_result, nlp_result)
+        combined_result['llm_tier'] = tier
+        
+        return combined_result
+
+    def _run_llm(self, prompt: str, model: str = None, deadline=None) -> dict:
+        """Satu call LLM -> dict hasil parsing JSON (fallback jika gagal, DeadlineExceeded jika budget habis)"""
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'user', 'content': llm_prompt},
-            ])
-            content = response['message']['content']
-            
-            # Enhanced JSON cleaning
-            clean_json = re.sub(r'```json\n?|```', '', content).strip()
+            content = self.session.chat(prompt, model=model, deadline=deadline)
             
-            # Handle multiple JSON objects atau invalid JSON
-            try:
-                llm_result = json.loads(clean_json)
-            except json.JSONDecodeError:
-                # Coba extract JSON dari teks
-                llm_result = self._extract_json_from_text(clean_json)
+            with profiler.stage("llm_parse"):
+                # Enhanced JSON cleaning
+                clean_json = re.sub(r'```json\n?|```', '', content).strip()
                 
+                # Handle multiple JSON objects atau invalid JSON
+                try:
+                    return json.loads(clean_json)
+                except json.JSONDecodeError:
+                    # Coba extract JSON dari teks
+                    return self._extract_json_from_text(clean_json)
+                
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            print(f"[LLM] General Error: {e}")
-            llm_result = {
+            # Timeout request karena budget habis -> bukan hasil fallback, job gagal karena deadline
+            if deadline and deadline.remaining() <= 0:
+                raise DeadlineExceeded(f"budget {deadline.budget}s habis di stage 'llm'") from e
+            log.error("General Error: %s", e)
+            return {
                 "summary": f"Analysis completed but with formatting issues",
                 "score": 5,
                 "category": "Unknown", 
                 "trend_strength": "Medium"
             }
-        
-        # ===== 3. COMBINE RESULTS =====
-        combined_result = self._combine_analysis(llm_result, nlp_result)
-        
-        return combined_result
     
+    # ================================
+    #  CHUNKED MODE (map-reduce)
+    # ================================
+    def _split_chunks(self, raw_text: str) -> list:
+        """Potong capture per item (batas ITEM_SEPARATOR) agar tiap chunk muat di budget token"""
+        max_chars = settings.LLM_CHUNK_CHARS
+        chunks, current = [], ""
+
+        for item in split_items(raw_text):
+            # Item yang sendirinya terlalu panjang dipotong keras
+            while len(item) > max_chars:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(item[:max_chars])
+                item = item[max_chars:]
+
+            if current and len(current) + len(item) + len(ITEM_SEPARATOR) > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}{ITEM_SEPARATOR}{item}" if current else item
+
+        if current.strip():
+            chunks.append(current)
+        return chunks
+
+    def _map_reduce(self, chunks: list, query: str, nlp_result: dict, model: str, deadline=None) -> dict:
+        """Map: analisis chunk paralel. Reduce: merge deterministik + satu call untuk summary"""
+        log.info("Chunked mode: %d chunk, %d slot paralel", len(chunks), settings.LLM_PARALLEL)
+
+        # ---- MAP ----
+        prompts = [self._build_enhanced_prompt(chunk, query, nlp_result) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=settings.LLM_PARALLEL) as executor:
+            # Tiap chunk cek deadline sebelum mulai; yang sedang jalan diputus saat budget habis
+            partials = list(executor.map(lambda prompt: self._run_llm(prompt, model, deadline), prompts))
+
+        # ---- REDUCE (deterministik, dibobot panjang chunk) ----
+        weights = [len(chunk) for chunk in chunks]
+        total_weight = sum(weights)
+
+        scores = []
+        for partial, weight in zip(partials, weights):
+            try:
+                scores.append((float(partial.get('score', 5)), weight))
+            except (TypeError, ValueError):
+                continue
+        score = round(sum(s * w for s, w in scores) / sum(w for _, w in scores)) if scores else 5
+
+        def weighted_mode(field: str, default: str) -> str:
+            votes = Counter()
+            for partial, weight in zip(partials, weights):
+                votes[partial.get(field, default)] += weight
+            return votes.most_common(1)[0][0] if votes else default
+
+        merged = {
+            "score": score,
+            "category": weighted_mode('category', 'Unknown'),
+            "trend_strength": weighted_mode('trend_strength', 'Medium'),
+        }
+
+        # ---- REDUCE summary: satu call LLM atas ringkasan parsial ----
+        summaries = [p.get('summary', '') for p in partials if p.get('summary')]
+        if deadline:
+            deadline.check("llm-reduce")
+        reduce_prompt = (
+            f'KATA KUNCI PENCARIAN: "{query}"\n\n'
+            f"DATA MENTAH (ringkasan parsial dari {len(chunks)} bagian data, "
+            f"bobot {total_weight} karakter):\n"
+            + "\n".join(f"- {summary}" for summary in summaries)
+        )
+        merged["summary"] = self._run_llm(reduce_prompt, model, deadline).get('summary') or " ".join(summaries[:2])
+        merged["chunks"] = len(chunks)
+
+        return merged
+
     def _extract_json_from_text(self, text: str) -> dict:
         """Extract JSON from problematic text responses"""
         import re
@@ -121,22 +240,15 @@ class LLMProcessor:
         }
 
     def _build_enhanced_prompt(self, raw_text: str, query: str, nlp_result: dict = None) -> str:
-        """Build smarter prompt dengan NLP context"""
+        """
+        Build user message dengan NLP context.
+        Instruksi & format output ada di SYSTEM_PROMPT (core/llm_session.py) agar prefix-nya
+        identik di setiap call; di sini hanya bagian yang berubah per job.
+        """
         
         # Base prompt
-        prompt = f"""
-            Kamu adalah analis trend digital yang ahli. Analisis data berikut dari pencarian "{query}".
-
-            INSTRUKSI:
-            1. Buat ringkasan singkat & informatif (max 3 kalimat)
-            2. Berikan skor popularitas (1-10) berdasarkan:
-            - Volume konten/engagement
-            - Sentiment publik
-            - Trending indicators
-            3. Tentukan kategori trend: Entertainment, Business, Technology, Social Issue, Sports, atau Other
-            4. Tentukan kekuatan trend: Viral, Rising, Stable, atau Declining
-
-        """
+        prompt = f"""KATA KUNCI PENCARIAN: "{query}"
+"""
         
         # Add NLP context jika ada
         if nlp_result:
@@ -145,25 +257,16 @@ class LLMProcessor:
             top_keywords = ', '.join([kw[0] for kw in nlp_result['keywords'][:5]])
             
             prompt += f"""
-                CONTEXT NLP ANALYSIS:
-                - Sentiment: {sentiment_label} ({sentiment_score}/10)
-                - Top Keywords: {top_keywords}
-                - Engagement Metrics: {nlp_result['engagement']['avg_engagement']}
-
-            """
+CONTEXT NLP ANALYSIS:
+- Sentiment: {sentiment_label} ({sentiment_score}/10)
+- Top Keywords: {top_keywords}
+- Engagement Metrics: {nlp_result['engagement']['avg_engagement']}
+"""
         
         prompt += f"""
-            OUTPUT FORMAT (JSON ONLY):
-            {{
-                "summary": "Ringkasan kamu...",
-                "score": 8,
-                "category": "Entertainment",
-                "trend_strength": "Viral"
-            }}
-
-            DATA MENTAH:
-            {raw_text[:3500]}
-        """
+DATA MENTAH:
+{raw_text[:settings.LLM_CHUNK_CHARS]}
+"""
         
         return prompt
     
@@ -0,0 +1,112 @@
+# core/llm_session.py
+"""
+LLM Session Manager (Ollama)
+- Preload model saat startup dengan keep_alive eksplisit (tidak di-unload di antara keyword)
+- Instruksi statis dikirim sebagai system message yang byte-identik di setiap call,
+  sehingga prefix/KV cache server bisa dipakai ulang
+- Log time-to-first-token (TTFT) per call
+- Dengan deadline job: timeout request = sisa budget, stream diputus begitu budget habis
+  (koneksi ditutup -> Ollama berhenti generate)
+"""
+
+import time
+
+import ollama
+
+from config import settings
+from core.deadline import DeadlineExceeded
+from utils.logger import get_logger
+
+log = get_logger("LLM")
+
+# JANGAN sisipkan data dinamis (query, tanggal, dll) ke sini: harus identik di setiap call
+SYSTEM_PROMPT = """Kamu adalah analis trend digital yang ahli. Kamu akan menerima kata kunci pencarian, konteks NLP (opsional), dan data mentah hasil scraping.
+
+INSTRUKSI:
+1. Buat ringkasan singkat & informatif (max 3 kalimat)
+2. Berikan skor popularitas (1-10) berdasarkan:
+- Volume konten/engagement
+- Sentiment publik
+- Trending indicators
+3. Tentukan kategori trend: Entertainment, Business, Technology, Social Issue, Sports, atau Other
+4. Tentukan kekuatan trend: Viral, Rising, Stable, atau Declining
+
+OUTPUT FORMAT (JSON ONLY):
+{
+    "summary": "Ringkasan kamu...",
+    "score": 8,
+    "category": "Entertainment",
+    "trend_strength": "Viral"
+}"""
+
+
+class LLMSession:
+    def __init__(self, client, model: str, keep_alive: str = None):
+        self.client = client
+        self.model = model
+        self.keep_alive = keep_alive or settings.OLLAMA_KEEP_ALIVE
+        self.stats = {"calls": 0, "ttft_total": 0.0, "latency_total": 0.0}
+
+    def warm_up(self):
+        """Load model ke memori + isi KV cache dengan system prompt"""
+        start = time.perf_counter()
+        try:
+            self.client.generate(model=self.model, prompt="", keep_alive=self.keep_alive)
+            # Satu token saja: cukup untuk memproses (dan meng-cache) prefix system prompt
+            self.client.chat(
+                model=self.model,
+                messages=[{"role": "system", "content": SYSTEM_PROMPT}, {"role": "user", "content": "ok"}],
+                keep_alive=self.keep_alive,
+                options={"num_predict": 1},
+            )
+            log.info("Model %s siap (warm-up %.1fs, keep_alive=%s)",
+                     self.model, time.perf_counter() - start, self.keep_alive)
+        except Exception as e:
+            log.warning("LLM warm-up gagal: %s", e)
+
+    def chat(self, user_content: str, model: str = None, deadline=None) -> str:
+        """Streaming chat: ukur TTFT, return seluruh konten"""
+        client = self.client
+        if deadline:
+            deadline.check("llm")
+            # Client sekali pakai dengan timeout sisa budget, bukan LLM_TIMEOUT tetap
+            client = ollama.Client(host=settings.OLLAMA_URL,
+                                   timeout=min(settings.LLM_TIMEOUT, max(deadline.remaining(), 0.1)))
+
+        start = time.perf_counter()
+        ttft = None
+        parts = []
+
+        try:
+            stream = client.chat(
+                model=model or self.model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content},
+                ],
+                stream=True,
+                keep_alive=self.keep_alive,
+            )
+            try:
+                for chunk in stream:
+                    content = chunk["message"]["content"]
+                    if content and ttft is None:
+                        ttft = time.perf_counter() - start
+                    parts.append(content)
+                    if deadline and deadline.remaining() <= 0:
+                        raise DeadlineExceeded(f"budget {deadline.budget}s habis saat generate LLM")
+            finally:
+                stream.close()
+        finally:
+            if client is not self.client:
+                client.close()
+
+        latency = time.perf_counter() - start
+        ttft = ttft if ttft is not None else latency
+        self.stats["calls"] += 1
+        self.stats["ttft_total"] += ttft
+        self.stats["latency_total"] += latency
+        log.info("%s: TTFT %.2fs, total %.2fs", model or self.model, ttft, latency,
+                 model=model or self.model, ttft=round(ttft, 3), latency=round(latency, 3))
+
+        return "".join(parts)
@@ -0,0 +1,68 @@
+# core/memory.py
+"""
+Memory Sampling (RSS)
+- Proses Python sendiri & semua turunannya (driver Playwright + proses Chromium)
+- psutil dipakai jika ada; tanpa psutil dibaca langsung dari /proc (Linux)
+- Platform lain tanpa psutil: sampling tidak tersedia (watchdog hanya pakai batas page/umur)
+"""
+
+import os
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+PROC_AVAILABLE = os.path.isdir("/proc/self")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+SAMPLING_AVAILABLE = PSUTIL_AVAILABLE or PROC_AVAILABLE
+
+
+def _proc_rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _proc_descendants(root: int) -> List[int]:
+    """Semua turunan pid dari tabel ppid di /proc"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Nama proses bisa berisi spasi/kurung -> ambil setelah ')' terakhir
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    result, stack = [], [root]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            result.append(child)
+            stack.append(child)
+    return result
+
+
+def sample_rss() -> Optional[Dict[str, int]]:
+    """{'python': byte, 'browser': byte (driver + Chromium)} atau None jika tidak didukung"""
+    pid = os.getpid()
+    if PSUTIL_AVAILABLE:
+        process = psutil.Process(pid)
+        browser = 0
+        for child in process.children(recursive=True):
+            try:
+                browser += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return {"python": process.memory_info().rss, "browser": browser}
+    if PROC_AVAILABLE:
+        return {"python": _proc_rss(pid), "browser": sum(_proc_rss(child) for child in _proc_descendants(pid))}
+    return None
@@ -13,6 +13,13 @@ from collections import Counter
 from typing import Dict, List, Tuple
 import json
 
+from core.deadline import DeadlineExceeded
+from core.dedup import split_items
+from utils.logger import get_logger
+
+log = get_logger("NLP")
+engagement_log = get_logger("ENGAGEMENT")
+
 # Install: pip install textblob vaderSentiment scikit-learn
 try:
     from textblob import TextBlob
@@ -22,7 +29,7 @@ try:
     NLP_AVAILABLE = True
 except ImportError as e:
     NLP_AVAILABLE = False
-    print(f"[WARN] NLP libraries not installed: {e}")
+    log.warning("NLP libraries not installed: %s", e)
 
 
 class NLPAnalyzer:
@@ -114,7 +121,8 @@ class NLPAnalyzer:
         
         return filtered
     
-    def _simple_stem(self, word: str) -> str:
+    @staticmethod
+    def _simple_stem(word: str) -> str:
         """Simple stemming untuk kata umum (Indonesian & English)"""
         # Indonesian suffixes
         id_suffixes = ['nya', 'lah', 'kah', 'pun', 'ku', 'mu']
@@ -143,20 +151,19 @@ class NLPAnalyzer:
             
         scores = self.vader.polarity_scores(text)
         
-        # Interpretasi
-        compound = scores['compound']
-        if compound >= 0.05:
-            label = "Positive"
-        elif compound <= -0.05:
-            label = "Negative"
-        else:
-            label = "Neutral"
-        
         return {
             'scores': scores,
-            'label': label,
-            'confidence': abs(compound)
+            'label': self._vader_label(scores['compound']),
+            'confidence': abs(scores['compound'])
         }
+
+    @staticmethod
+    def _vader_label(compound: float) -> str:
+        if compound >= 0.05:
+            return "Positive"
+        if compound <= -0.05:
+            return "Negative"
+        return "Neutral"
     
     
     def sentiment_analysis_textblob(self, text: str) -> Dict:
@@ -172,29 +179,58 @@ class NLPAnalyzer:
             polarity = blob.sentiment.polarity  # -1 to 1
             subjectivity = blob.sentiment.subjectivity  # 0 to 1
             
-            if polarity > 0.1:
-                label = "Positive"
-            elif polarity < -0.1:
-                label = "Negative"
-            else:
-                label = "Neutral"
-            
             return {
                 'polarity': polarity,
                 'subjectivity': subjectivity,
-                'label': label
+                'label': self._textblob_label(polarity)
             }
         except:
             return {'polarity': 0, 'subjectivity': 0, 'label': 'Neutral'}
+
+    @staticmethod
+    def _textblob_label(polarity: float) -> str:
+        if polarity > 0.1:
+            return "Positive"
+        if polarity < -0.1:
+            return "Negative"
+        return "Neutral"
+
+    def weighted_sentiment(self, items: List[str], weights: List[int]) -> Tuple[Dict, Dict]:
+        """
+        VADER & TextBlob per item, dirata-rata dengan bobot (ukuran cluster near-duplicate),
+        agar konten yang dipost ulang di banyak tempat tetap dihitung sesuai jumlahnya
+        Returns: (vader_sentiment, textblob_sentiment) dengan bentuk yang sama seperti versi satu teks
+        """
+        total = sum(weights)
+        vader_scores = Counter()
+        polarity = subjectivity = 0.0
+        for item, weight in zip(items, weights):
+            for name, value in self.sentiment_analysis_vader(item)['scores'].items():
+                vader_scores[name] += value * weight / total
+            blob = self.sentiment_analysis_textblob(item)
+            polarity += blob['polarity'] * weight / total
+            subjectivity += blob['subjectivity'] * weight / total
+
+        compound = vader_scores['compound']
+        vader_sentiment = {'scores': dict(vader_scores), 'label': self._vader_label(compound),
+                           'confidence': abs(compound)}
+        textblob_sentiment = {'polarity': polarity, 'subjectivity': subjectivity,
+                              'label': self._textblob_label(polarity)}
+        return vader_sentiment, textblob_sentiment
     
     
-    def extract_keywords(self, text: str, top_n: int = 10) -> List[Tuple[str, int]]:
-        """Extract Top Keywords by Frequency"""
-        tokens = self.robust_tokenize(text)
-        if not tokens:
+    def extract_keywords(self, text: str, top_n: int = 10, weights: List[int] = None) -> List[Tuple[str, int]]:
+        """Extract Top Keywords by Frequency (weights: bobot per item, token item dihitung x bobot)"""
+        if weights:
+            counter = Counter()
+            for item, weight in zip(split_items(text), weights):
+                for token in self.robust_tokenize(item):
+                    counter[token] += weight
+        else:
+            counter = Counter(self.robust_tokenize(text))
+        if not counter:
             return []
             
-        counter = Counter(tokens)
         keywords = counter.most_common(top_n)
         
         # Filter hanya kata yang meaningful (minimal 2 karakter dan muncul minimal 1 kali)
@@ -224,7 +260,7 @@ class NLPAnalyzer:
             vectorizer.fit_transform(texts)
             return vectorizer.get_feature_names_out().tolist()
         except Exception as e:
-            print(f"[TF-IDF] Error: {e}")
+            log.error("TF-IDF error: %s", e)
             return []
     
     
@@ -278,9 +314,10 @@ class NLPAnalyzer:
                     
                 total += val
                 count += 1
-                print(f"[ENGAGEMENT] Found number: {num} -> {val}")
+                # Satu baris per angka -> debug & di-sampling
+                engagement_log.debug("Found number: %s -> %s", num, val, sample="engagement")
             except Exception as e:
-                print(f"[ENGAGEMENT] Error converting {num}: {e}")
+                engagement_log.debug("Error converting %s: %s", num, e, sample="engagement_error")
                 pass
         
         avg = total / count if count > 0 else 0
@@ -291,30 +328,49 @@ class NLPAnalyzer:
         }
     
     
-    def comprehensive_analysis(self, text: str) -> Dict:
+    def comprehensive_analysis(self, text: str, deadline=None, weights: List[int] = None) -> Dict:
         """
         Full NLP Analysis Pipeline
         Combines all methods above
+        deadline: budget job (opsional), dicek sebelum tiap stage -> DeadlineExceeded
+        weights: ukuran cluster per item (output dedup); sentiment & keyword dibobot jika ada duplikat
         """
         if not text:
             return self._get_empty_analysis()
+
+        items = split_items(text) if weights and max(weights) > 1 else None
+        if items and len(items) != len(weights):
+            items = None
+
+        def check(stage: str):
+            if deadline:
+                deadline.check(f"nlp-{stage}")
             
         try:
-            print(f"[NLP] Analyzing text length: {len(text)}")
+            log.debug("Analyzing text length: %d", len(text), length=len(text))
             
             # Sentiment Analysis (2 methods)
-            vader_sentiment = self.sentiment_analysis_vader(text)
-            textblob_sentiment = self.sentiment_analysis_textblob(text)
+            if items:
+                check("sentiment")
+                vader_sentiment, textblob_sentiment = self.weighted_sentiment(items, weights)
+            else:
+                check("vader")
+                vader_sentiment = self.sentiment_analysis_vader(text)
+                check("textblob")
+                textblob_sentiment = self.sentiment_analysis_textblob(text)
             
             # Keyword Extraction
-            keywords = self.extract_keywords(text, top_n=10)
-            print(f"[NLP] Extracted {len(keywords)} keywords")
+            check("keywords")
+            keywords = self.extract_keywords(text, top_n=10, weights=weights if items else None)
+            log.debug("Extracted %d keywords", len(keywords))
             
             # Engagement Metrics
+            check("engagement")
             engagement = self.analyze_engagement_metrics(text)
-            print(f"[NLP] Engagement: {engagement}")
+            log.debug("Engagement: %s", engagement)
             
             # Text Stats
+            check("stats")
             tokens = self.robust_tokenize(text)
             word_count = len(tokens)
             unique_words = len(set(tokens))
@@ -350,11 +406,14 @@ class NLPAnalyzer:
                 }
             }
             
-            print(f"[NLP] Analysis completed: {result['sentiment']['label']} ({result['sentiment']['score']}/10)")
+            log.info("Analysis completed: %s (%s/10)", result['sentiment']['label'], result['sentiment']['score'],
+                     label=result['sentiment']['label'], score=result['sentiment']['score'], words=word_count)
             return result
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            print(f"[NLP] Comprehensive analysis error: {e}")
+            log.error("Comprehensive analysis error: %s", e)
             return self._get_empty_analysis()
     
     def _get_empty_analysis(self) -> Dict:
@@ -0,0 +1,69 @@
+# core/pipeline.py
+"""
+Pipeline Resources
+- Semua resource warm milik satu worker: LLM + NLP, browser pool, HTTP fetcher,
+  circuit breaker, cek session login, index dedup/korpus/trending/search, sink Parquet
+- Dibuat sekali, dipakai ulang oleh setiap job (worker ledger maupun service mode)
+"""
+
+from config import settings
+from core.llm import LLMProcessor
+from core.browser import BrowserPool
+from core.breaker import CircuitBreaker
+from core.fetcher import TieredFetcher
+from core.session import SessionChecker, DEAD_STATUSES
+from core.dedup import DedupIndex
+from core.corpus import CorpusIDF
+from core.trending import TrendingTerms
+from core.search_index import SearchIndex
+from utils.columnar import ParquetSink, PYARROW_AVAILABLE
+from utils.logger import get_logger
+
+
+class Pipeline:
+    def __init__(self, llm: LLMProcessor = None, save_sessions: bool = True):
+        self.llm = llm or LLMProcessor()
+        # Semua index memakai tokenizer yang sama dengan NLP (robust_tokenize)
+        tokenizer = self.llm.nlp_analyzer.robust_tokenize if self.llm.nlp_analyzer else None
+
+        # Dengan --workers N hanya satu proses yang menulis balik file session
+        self.pool = BrowserPool(save_sessions=save_sessions)
+        self.fetcher = TieredFetcher()
+        self.breaker = CircuitBreaker()
+        self.sessions = SessionChecker() if settings.SESSION_CHECK else None
+        self.dedup = DedupIndex(tokenizer) if settings.DEDUP_ENABLED else None
+        self.corpus = CorpusIDF(tokenizer) if tokenizer else None
+        self.trending = TrendingTerms(tokenizer) if tokenizer else None
+        self.search_index = SearchIndex(tokenizer) if settings.SEARCH_INDEX and tokenizer else None
+        self.parquet = ParquetSink() if settings.PARQUET_EXPORT and PYARROW_AVAILABLE else None
+
+    async def session_allows(self, platform: str) -> bool:
+        """False jika job harus di-skip karena session mati; selain itu atur mode login/anonymous"""
+        if not self.sessions:
+            return True
+        # Cache-first: probe ulang hanya jika TTL habis atau file session berubah
+        status = (await self.sessions.check_all([platform]))[platform]
+        dead = status in DEAD_STATUSES
+        if dead and settings.SESSION_DEAD_ACTION == "skip":
+            return False
+        self.pool.set_anonymous(platform, dead)
+        return True
+
+    def report_stats(self, worker_id: str):
+        """Statistik browser pool, cache asset & LLM di akhir worker"""
+        log = get_logger(worker_id)
+        log.info(self.pool.summary())
+        if self.pool.asset_cache:
+            log.info(self.pool.asset_cache.summary())
+        llm_stats = self.llm.session.stats
+        if llm_stats["calls"]:
+            log.info("[LLM] %d call, rata-rata TTFT %.2fs, latency %.2fs", llm_stats['calls'],
+                     llm_stats['ttft_total'] / llm_stats['calls'], llm_stats['latency_total'] / llm_stats['calls'])
+
+    async def close(self):
+        await self.fetcher.close()
+        await self.pool.close()
+        self.breaker.close()
+        for resource in (self.sessions, self.dedup, self.corpus, self.trending, self.search_index, self.parquet):
+            if resource:
+                resource.close()
@@ -0,0 +1,151 @@
+# core/scheduler.py
+"""
+Adaptive Monitoring Scheduler
+- Interval refresh per keyword x platform dari trend_strength terakhir
+  (Viral: menit, Rising: ~jam, Stable: jam-an, Declining: lebih jarang lagi)
+- Change rate: skor yang bergerak jauh -> interval dipersingkat; tidak berubah -> back off,
+  maksimal SCHEDULE_BACKOFF_CAP x interval dasar trend-nya (topik Viral tetap dalam hitungan menit)
+- Budget global: maksimal SCHEDULE_BUDGET_PER_HOUR job per jam, yang paling overdue didahulukan
+- State disimpan di file ledger (bertahan antar restart)
+"""
+
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+from config import settings
+from scrapers.base import ScrapeOutcome
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedule (
+    keyword     TEXT NOT NULL,
+    platform    TEXT NOT NULL,
+    next_run    REAL NOT NULL,
+    interval    REAL,
+    last_run    REAL,
+    last_score  REAL,
+    last_trend  TEXT,
+    runs        INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, platform)
+);
+CREATE INDEX IF NOT EXISTS idx_schedule_next ON schedule (next_run);
+CREATE TABLE IF NOT EXISTS dispatches (
+    ts  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dispatches_ts ON dispatches (ts);
+"""
+
+
+def trend_intervals() -> dict:
+    return {
+        "Viral": settings.SCHEDULE_VIRAL,
+        "Rising": settings.SCHEDULE_RISING,
+        "Stable": settings.SCHEDULE_STABLE,
+        "Declining": settings.SCHEDULE_DECLINING,
+    }
+
+
+class AdaptiveScheduler:
+    def __init__(self, path: str = None):
+        self.conn = sqlite3.connect(path or settings.LEDGER_FILE, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def seed(self, keywords: List[str], platforms: List[str]):
+        """Pasangan baru langsung jatuh tempo; yang sudah ada tidak diubah"""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO schedule (keyword, platform, next_run) VALUES (?, ?, ?)",
+            [(kw, platform, now) for kw in keywords for platform in platforms]
+        )
+
+    # ===== DISPATCH =====
+    def budget_left(self) -> int:
+        hour_ago = time.time() - 3600
+        self.conn.execute("DELETE FROM dispatches WHERE ts < ?", (hour_ago,))
+        used = self.conn.execute("SELECT COUNT(*) AS n FROM dispatches").fetchone()["n"]
+        return max(0, settings.SCHEDULE_BUDGET_PER_HOUR - used)
+
+    def dispatch_due(self, keywords: List[str], platforms: List[str]) -> List[Tuple[str, str]]:
+        """Ambil pasangan yang jatuh tempo (dibatasi budget) & catat sebagai dispatched"""
+        now = time.time()
+        budget = self.budget_left()
+        if not budget:
+            return []
+
+        # Paling overdue relatif terhadap interval-nya dulu (Viral telat 5 menit > Stable telat 5 menit)
+        rows = self.conn.execute(
+            "SELECT keyword, platform FROM schedule WHERE next_run <= ? "
+            "ORDER BY (? - next_run) / COALESCE(interval, ?) DESC",
+            (now, now, settings.SCHEDULE_STABLE)
+        ).fetchall()
+        # Hanya keyword/platform yang masih dikonfigurasi
+        pairs = [(row["keyword"], row["platform"]) for row in rows
+                 if row["keyword"] in keywords and row["platform"] in platforms][:budget]
+
+        self.conn.executemany("INSERT INTO dispatches (ts) VALUES (?)", [(now,)] * len(pairs))
+        self.conn.executemany(
+            "UPDATE schedule SET last_run = ?, runs = runs + 1 WHERE keyword = ? AND platform = ?",
+            [(now, kw, platform) for kw, platform in pairs]
+        )
+        return pairs
+
+    def seconds_until_next(self) -> Optional[float]:
+        row = self.conn.execute("SELECT MIN(next_run) AS next_run FROM schedule").fetchone()
+        return None if row["next_run"] is None else max(0.0, row["next_run"] - time.time())
+
+    # ===== ADAPTASI INTERVAL =====
+    @staticmethod
+    def next_interval(row: sqlite3.Row, outcome: str, result: dict = None) -> Tuple[float, Optional[float], Optional[str]]:
+        """Return (interval, skor, trend) berdasarkan hasil terakhir & perubahan skor"""
+        intervals = trend_intervals()
+        previous = row["interval"]
+
+        if outcome == ScrapeOutcome.OK.value and result:
+            trend = result.get('trend_strength')
+            try:
+                score = float(result.get('score'))
+            except (TypeError, ValueError):
+                score = None
+            interval = intervals.get(trend, settings.SCHEDULE_STABLE)
+
+            if score is not None and row["last_score"] is not None:
+                change = abs(score - row["last_score"])
+                if change >= settings.SCHEDULE_CHANGE:
+                    # Bergerak cepat -> refresh lebih sering dari default trend-nya
+                    interval /= 2
+                elif trend == row["last_trend"] and previous:
+                    # Tenang & trend sama -> back off dari interval sebelumnya, dibatasi relatif ke trend
+                    cap = interval * settings.SCHEDULE_BACKOFF_CAP
+                    interval = max(interval, min(previous * settings.SCHEDULE_BACKOFF, cap))
+        elif outcome == ScrapeOutcome.DUPLICATE.value:
+            # Tidak ada konten baru
+            base = intervals.get(row["last_trend"], settings.SCHEDULE_STABLE)
+            backoff = (previous or base) * settings.SCHEDULE_BACKOFF
+            interval, score, trend = max(base, min(backoff, base * settings.SCHEDULE_BACKOFF_CAP)), None, None
+        else:
+            # Error / blokir / kosong: coba lagi dengan ritme yang sama (breaker menangani blokir)
+            interval, score, trend = previous or settings.SCHEDULE_STABLE, None, None
+
+        interval = min(settings.SCHEDULE_MAX, max(settings.SCHEDULE_MIN, interval))
+        return interval, score, trend
+
+    def update(self, keyword: str, platform: str, outcome: str, result: dict = None) -> Optional[float]:
+        row = self.conn.execute(
+            "SELECT * FROM schedule WHERE keyword = ? AND platform = ?", (keyword, platform)
+        ).fetchone()
+        if not row:
+            return None
+
+        interval, score, trend = self.next_interval(row, outcome, result)
+        self.conn.execute(
+            "UPDATE schedule SET interval = ?, next_run = ?, "
+            "last_score = COALESCE(?, last_score), last_trend = COALESCE(?, last_trend) "
+            "WHERE keyword = ? AND platform = ?",
+            (interval, time.time() + interval, score, trend, keyword, platform)
+        )
+        return interval
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,233 @@
+# core/search_index.py
+"""
+Inverted Full-Text Index (SQLite)
+- Item mentah (post/tweet/video) & summary LLM disimpan sebagai dokumen
+- Token dari robust_tokenize -> posting list per term: doc id & posisi, varint + delta encoding
+- Append incremental: posting baru ditempel ke blok terakhir term (blok baru jika penuh)
+- Query boolean (AND default, OR, -term) & frasa ("..."), filter platform & rentang waktu
+"""
+
+import re
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import settings
+from core.dedup import split_items
+
+KIND_ITEM = "item"
+KIND_SUMMARY = "summary"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts        REAL NOT NULL,
+    keyword   TEXT NOT NULL,
+    platform  TEXT NOT NULL,
+    kind      TEXT NOT NULL,
+    text      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_ts ON docs (ts);
+CREATE TABLE IF NOT EXISTS postings (
+    term       TEXT NOT NULL,
+    first_doc  INTEGER NOT NULL,
+    last_doc   INTEGER NOT NULL,
+    data       BLOB NOT NULL,
+    PRIMARY KEY (term, first_doc)
+) WITHOUT ROWID;
+"""
+
+
+# ===== VARINT =====
+def encode_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varints(data: bytes) -> Iterator[int]:
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+def encode_postings(postings: List[Tuple[int, List[int]]], prev_doc: int) -> bytes:
+    """[(doc_id, [posisi])] -> doc delta, jumlah posisi, posisi delta"""
+    out = bytearray()
+    for doc_id, positions in postings:
+        encode_varint(doc_id - prev_doc, out)
+        encode_varint(len(positions), out)
+        prev_pos = 0
+        for pos in positions:
+            encode_varint(pos - prev_pos, out)
+            prev_pos = pos
+        prev_doc = doc_id
+    return bytes(out)
+
+
+def decode_postings(data: bytes, prev_doc: int) -> Iterator[Tuple[int, List[int]]]:
+    values = decode_varints(data)
+    for delta in values:
+        prev_doc += delta
+        positions, pos = [], 0
+        for _ in range(next(values)):
+            pos += next(values)
+            positions.append(pos)
+        yield prev_doc, positions
+
+
+class SearchIndex:
+    def __init__(self, tokenizer: Callable[[str], List[str]] = None, path: str = None):
+        self.tokenizer = tokenizer or (lambda text: re.findall(r'\w+', text.lower()))
+
+        self.conn = sqlite3.connect(path or settings.SEARCH_DB, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    # ===== INDEXING =====
+    def add(self, keyword: str, platform: str, raw_text: str, summary: str = None) -> int:
+        """Simpan item & summary satu hasil, lalu append posting-nya. Return jumlah dokumen"""
+        docs = [(KIND_ITEM, item) for item in split_items(raw_text)]
+        if summary:
+            docs.append((KIND_SUMMARY, summary))
+        if not docs:
+            return 0
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Doc id & ts naik monoton (AUTOINCREMENT + write lock) -> posting selalu append di ujung
+            now = time.time()
+            term_postings = defaultdict(list)
+            for kind, text in docs:
+                doc_id = self.conn.execute(
+                    "INSERT INTO docs (ts, keyword, platform, kind, text) VALUES (?, ?, ?, ?, ?)",
+                    (now, keyword, platform, kind, text)
+                ).lastrowid
+                positions = defaultdict(list)
+                for pos, term in enumerate(self.tokenizer(text)):
+                    positions[term].append(pos)
+                for term, term_positions in positions.items():
+                    term_postings[term].append((doc_id, term_positions))
+
+            for term, postings in term_postings.items():
+                self._append(term, postings)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return len(docs)
+
+    def _append(self, term: str, postings: List[Tuple[int, List[int]]]):
+        last = self.conn.execute(
+            "SELECT first_doc, last_doc, length(data) AS size FROM postings "
+            "WHERE term = ? ORDER BY first_doc DESC LIMIT 1", (term,)
+        ).fetchone()
+
+        if last and last["size"] < settings.SEARCH_BLOCK_BYTES:
+            self.conn.execute(
+                "UPDATE postings SET data = CAST(data || ? AS BLOB), last_doc = ? WHERE term = ? AND first_doc = ?",
+                (encode_postings(postings, last["last_doc"]), postings[-1][0], term, last["first_doc"])
+            )
+        else:
+            # Blok baru: delta pertama relatif ke first_doc - 1
+            first_doc = postings[0][0]
+            self.conn.execute(
+                "INSERT INTO postings (term, first_doc, last_doc, data) VALUES (?, ?, ?, ?)",
+                (term, first_doc, postings[-1][0], encode_postings(postings, first_doc - 1))
+            )
+
+    # ===== QUERY =====
+    def _postings(self, term: str, min_doc: int, max_doc: int) -> Dict[int, List[int]]:
+        """Decode hanya blok yang beririsan dengan rentang doc id"""
+        rows = self.conn.execute(
+            "SELECT first_doc, data FROM postings WHERE term = ? AND last_doc >= ? AND first_doc <= ?",
+            (term, min_doc, max_doc)
+        ).fetchall()
+        result = {}
+        for row in rows:
+            for doc_id, positions in decode_postings(row["data"], row["first_doc"] - 1):
+                if min_doc <= doc_id <= max_doc:
+                    result[doc_id] = positions
+        return result
+
+    def _phrase(self, terms: List[str], min_doc: int, max_doc: int) -> set:
+        lists = [self._postings(term, min_doc, max_doc) for term in terms]
+        if not lists:
+            return set()
+        matches = set()
+        for doc_id in set.intersection(*(set(p) for p in lists)):
+            starts = set(lists[0][doc_id])
+            for offset, postings in enumerate(lists[1:], 1):
+                starts &= {pos - offset for pos in postings[doc_id]}
+            if starts:
+                matches.add(doc_id)
+        return matches
+
+    def _doc_range(self, since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+        """Rentang waktu -> rentang doc id (doc id monoton terhadap waktu insert)"""
+        lo = self.conn.execute(
+            "SELECT id FROM docs WHERE ts >= ? ORDER BY ts, id LIMIT 1", (since or 0,)
+        ).fetchone()
+        hi = self.conn.execute(
+            "SELECT id FROM docs WHERE ts <= ? ORDER BY ts DESC, id DESC LIMIT 1", (until or float("inf"),)
+        ).fetchone()
+        return (lo["id"], hi["id"]) if lo and hi else (1, 0)
+
+    def search(self, query: str, platform: str = None, since: float = None, until: float = None,
+               limit: int = 20) -> List[dict]:
+        """
+        Query: term (AND), OR antar grup, -term untuk exclude, "frasa beberapa kata".
+        Contoh: golang "web framework" -java OR fiber
+        """
+        min_doc, max_doc = self._doc_range(since, until)
+        if min_doc > max_doc:
+            return []
+
+        matched = set()
+        for group in re.split(r'\s+OR\s+', query.strip()):
+            include, exclude = None, set()
+            for negate, phrase, word in re.findall(r'(-?)(?:"([^"]+)"|(\S+))', group):
+                terms = self.tokenizer(phrase or word)
+                if not terms:
+                    continue  # stopword saja
+                docs = self._phrase(terms, min_doc, max_doc)
+                if negate:
+                    exclude |= docs
+                else:
+                    include = docs if include is None else include & docs
+            if include:
+                matched |= include - exclude
+
+        if not matched:
+            return []
+
+        ids = sorted(matched, reverse=True)
+        filters, params = "", []
+        if platform:
+            filters = " AND platform = ?"
+            params.append(platform)
+
+        results = []
+        # Terbaru dulu; metadata diambil per batch sampai limit terpenuhi
+        for i in range(0, len(ids), 500):
+            part = ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT * FROM docs WHERE id IN ({','.join('?' * len(part))}){filters} ORDER BY id DESC",
+                (*part, *params)
+            ).fetchall()
+            results.extend(dict(row) for row in rows)
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,257 @@
+# core/session.py
+"""
+Session Login per Platform
+- Satu file storage state per platform: <SESSION_DIR>/<platform>.json
+  (session.json gabungan versi lama dipecah otomatis sekali)
+- Pre-flight: cek session semua platform paralel saat startup
+  1. cookie auth wajib ada & belum expired (offline)
+  2. GET endpoint ringan yang butuh login; redirect ke halaman login = session mati
+- Hasil di-cache di file ledger dengan TTL (dipakai bersama antar worker), invalid otomatis
+  jika file session berubah (login ulang)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from config import settings
+from utils.logger import get_logger
+
+log = get_logger("SESSION")
+
+LEGACY_SESSION_FILE = "session.json"
+
+VALID = "valid"
+MISSING = "missing"      # belum pernah login -> anonymous seperti biasa
+EXPIRED = "expired"      # cookie auth hilang / kedaluwarsa
+INVALID = "invalid"      # endpoint redirect ke halaman login
+UNKNOWN = "unknown"      # probe gagal (network) -> tidak dianggap mati
+
+DEAD_STATUSES = {EXPIRED, INVALID}
+
+# Domain cookie/origin yang ikut di file session tiap platform:
+# domain terdaftar, cocok persis atau subdomain (".x.com", "www.x.com")
+PLATFORM_DOMAINS = {
+    "google": ["google.com", "google.co.id"],
+    "youtube": ["youtube.com", "google.com", "google.co.id"],   # login YouTube lewat akun Google
+    "tiktok": ["tiktok.com"],
+    "instagram": ["instagram.com"],
+    "threads": ["threads.net", "threads.com", "instagram.com"],  # login Threads lewat Instagram
+    "facebook": ["facebook.com"],
+    "twitter": ["x.com", "twitter.com"],
+}
+
+# Cookie yang hanya ada jika benar-benar login
+AUTH_COOKIES = {
+    "google": "SID",
+    "youtube": "SID",
+    "tiktok": "sessionid",
+    "instagram": "sessionid",
+    "threads": "sessionid",
+    "facebook": "c_user",
+    "twitter": "auth_token",
+}
+
+# Endpoint ringan yang redirect ke login jika session mati.
+# Platform SPA (twitter, threads, tiktok) selalu 200 tanpa JS -> cukup cek cookie.
+CHECK_URLS = {
+    "google": "https://myaccount.google.com/",
+    "youtube": "https://www.youtube.com/account",
+    "instagram": "https://www.instagram.com/accounts/edit/",
+    "facebook": "https://www.facebook.com/settings",
+}
+
+LOGIN_MARKERS = ["login", "signin", "checkpoint"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_checks (
+    platform      TEXT PRIMARY KEY,
+    status        TEXT NOT NULL,
+    detail        TEXT,
+    checked_at    REAL NOT NULL,
+    session_mtime REAL
+);
+"""
+
+
+# ===== FILE SESSION =====
+def session_path(platform: str, session_dir: str = None) -> str:
+    return os.path.join(session_dir or settings.SESSION_DIR, f"{platform}.json")
+
+
+def session_mtime(platform: str, session_dir: str = None) -> Optional[float]:
+    try:
+        return os.path.getmtime(session_path(platform, session_dir))
+    except OSError:
+        return None
+
+
+def state_fingerprint(platform: str, state: Optional[dict]) -> Optional[str]:
+    """Hash cookie auth platform (identitas login); cookie tracking & localStorage yang berubah
+    tiap request diabaikan agar simpanan rutin tidak dianggap login baru"""
+    if state is None:
+        return None
+    auth = sorted((c["name"], c.get("domain", ""), c.get("value", "")) for c in state.get("cookies", [])
+                  if c.get("name") == AUTH_COOKIES.get(platform))
+    return hashlib.sha1(json.dumps(auth or state, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def session_fingerprint(platform: str, session_dir: str = None) -> Optional[str]:
+    return state_fingerprint(platform, load_session(platform, session_dir))
+
+
+def load_session(platform: str, session_dir: str = None) -> Optional[dict]:
+    try:
+        with open(session_path(platform, session_dir), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_session(platform: str, state: dict, session_dir: str = None):
+    path = session_path(platform, session_dir)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_file, path)
+
+
+def _owned(domain: str, platform: str) -> bool:
+    """Domain cookie (".x.com") atau origin ("https://www.x.com") milik platform?"""
+    if "://" in domain:
+        domain = urlparse(domain).hostname or ""
+    domain = domain.lower().lstrip(".")
+    return any(domain == d or domain.endswith("." + d) for d in PLATFORM_DOMAINS.get(platform, []))
+
+
+def split_storage_state(state: dict, platforms: List[str] = None) -> Dict[str, dict]:
+    """Storage state gabungan -> {platform: state}; platform tanpa cookie auth tidak ikut"""
+    result = {}
+    for platform in platforms or PLATFORM_DOMAINS:
+        cookies = [c for c in state.get("cookies", []) if _owned(c["domain"], platform)]
+        if not any(c["name"] == AUTH_COOKIES.get(platform) for c in cookies):
+            continue
+        origins = [o for o in state.get("origins", []) if _owned(o["origin"], platform)]
+        result[platform] = {"cookies": cookies, "origins": origins}
+    return result
+
+
+def migrate_legacy_session(session_dir: str = None) -> List[str]:
+    """Pecah session.json lama ke file per platform (sekali, jika direktori session belum ada)"""
+    session_dir = session_dir or settings.SESSION_DIR
+    if os.path.isdir(session_dir) or not os.path.exists(LEGACY_SESSION_FILE):
+        return []
+    try:
+        with open(LEGACY_SESSION_FILE, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+
+    states = split_storage_state(state)
+    for platform, platform_state in states.items():
+        write_session(platform, platform_state, session_dir)
+    os.makedirs(session_dir, exist_ok=True)
+    log.info("%s dipecah ke %s/: %s", LEGACY_SESSION_FILE, session_dir, ", ".join(sorted(states)) or "-")
+    return sorted(states)
+
+
+# ===== PRE-FLIGHT =====
+class SessionChecker:
+    def __init__(self, path: str = None, session_dir: str = None):
+        self.session_dir = session_dir or settings.SESSION_DIR
+        migrate_legacy_session(self.session_dir)
+        self.conn = sqlite3.connect(path or settings.LEDGER_FILE, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def cached(self, platform: str) -> Optional[str]:
+        """Status dari cache jika masih dalam TTL & file session tidak berubah"""
+        row = self.conn.execute("SELECT * FROM session_checks WHERE platform = ?", (platform,)).fetchone()
+        if not row or time.time() - row["checked_at"] >= settings.SESSION_CHECK_TTL:
+            return None
+        if row["session_mtime"] != session_mtime(platform, self.session_dir):
+            return None
+        return row["status"]
+
+    def record(self, platform: str, status: str, detail: str = None):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO session_checks (platform, status, detail, checked_at, session_mtime) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (platform, status, detail, time.time(), session_mtime(platform, self.session_dir))
+        )
+
+    async def probe(self, platform: str) -> Tuple[str, str]:
+        """Return (status, detail) untuk satu platform"""
+        state = load_session(platform, self.session_dir)
+        if state is None:
+            return MISSING, "belum ada file session"
+
+        auth_cookie = AUTH_COOKIES.get(platform)
+        cookies = state.get("cookies", [])
+        if auth_cookie:
+            matches = [c for c in cookies if c["name"] == auth_cookie]
+            if not matches:
+                return EXPIRED, f"cookie {auth_cookie} tidak ada"
+            # expires -1 = session cookie (tidak kedaluwarsa selama browser hidup)
+            if all(0 < c.get("expires", -1) < time.time() for c in matches):
+                return EXPIRED, f"cookie {auth_cookie} kedaluwarsa"
+
+        url = CHECK_URLS.get(platform)
+        if not url:
+            return VALID, "cookie auth ada"
+
+        jar = httpx.Cookies()
+        for c in cookies:
+            jar.set(c["name"], c["value"], domain=c["domain"], path=c.get("path", "/"))
+        try:
+            async with httpx.AsyncClient(
+                headers={
+                    "User-Agent": (
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/120.0.0.0 Safari/537.36"
+                    ),
+                },
+                cookies=jar,
+                timeout=settings.SESSION_CHECK_TIMEOUT / 1000,
+                follow_redirects=True,
+            ) as client:
+                response = await client.get(url)
+        except httpx.HTTPError as e:
+            return UNKNOWN, f"probe gagal ({e.__class__.__name__})"
+
+        final_url = str(response.url).lower()
+        if any(marker in final_url for marker in LOGIN_MARKERS):
+            return INVALID, f"redirect ke {response.url.host}{response.url.path}"
+        if response.status_code == 401:
+            return INVALID, "HTTP 401"
+        return VALID, f"HTTP {response.status_code}"
+
+    async def check_all(self, platforms: List[str]) -> Dict[str, str]:
+        """Status semua platform; yang tidak ada di cache di-probe paralel"""
+        statuses = {platform: self.cached(platform) for platform in platforms}
+        stale = [platform for platform, status in statuses.items() if status is None]
+        if not stale:
+            return statuses
+
+        results = await asyncio.gather(*(self.probe(platform) for platform in stale))
+        for platform, (status, detail) in zip(stale, results):
+            self.record(platform, status, detail)
+            statuses[platform] = status
+            if status in DEAD_STATUSES:
+                log.warning("%s: %s (%s)", platform, status, detail, platform=platform, status=status)
+            elif status != MISSING:
+                log.info("%s: %s (%s)", platform, status, detail, platform=platform, status=status)
+        return statuses
+
+    def close(self):
+        self.conn.close()
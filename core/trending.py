@@ -0,0 +1,118 @@
+# core/trending.py
+"""
+Trending Terms (streaming heavy hitters)
+- Space-Saving top-k per keyword per time bucket (default per jam), disimpan di SQLite
+- Memori/row tetap: maksimal TRENDING_CAPACITY term per bucket, berapapun panjang history
+- count per term adalah batas atas; count - error adalah batas bawah
+- Query top term keyword untuk N jam/hari terakhir
+"""
+
+import re
+import sqlite3
+import time
+from collections import Counter
+from typing import Callable, List, Tuple
+
+from config import settings
+from core.dedup import split_items, shingle_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS heavy_hitters (
+    keyword       TEXT NOT NULL,
+    bucket_start  INTEGER NOT NULL,
+    term          TEXT NOT NULL,
+    count         INTEGER NOT NULL,
+    error         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (keyword, bucket_start, term)
+) WITHOUT ROWID;
+"""
+
+WINDOW_UNITS = {"h": 3600, "d": 86400}
+
+
+def parse_window(window: str) -> int:
+    """'24h' / '7d' -> detik"""
+    match = re.fullmatch(r'(\d+)([hd])', window.strip().lower())
+    if not match:
+        raise ValueError(f"Format window tidak valid: {window} (contoh: 24h, 7d)")
+    return int(match.group(1)) * WINDOW_UNITS[match.group(2)]
+
+
+class TrendingTerms:
+    def __init__(self, tokenizer: Callable[[str], List[str]] = None, path: str = None):
+        self.tokenizer = tokenizer or (lambda text: re.findall(r'\w+', text.lower()))
+        self.capacity = settings.TRENDING_CAPACITY
+        self.bucket_seconds = settings.TRENDING_BUCKET_SECONDS
+
+        self.conn = sqlite3.connect(path or settings.CORPUS_DB, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(SCHEMA)
+
+    def add(self, keyword: str, raw_text: str, timestamp: float = None, weights: List[int] = None):
+        """
+        Masukkan term dari satu hasil ke bucket waktu sekarang (Space-Saving update).
+        weights: ukuran cluster per item dari dedup -> term item duplikat dihitung sebanyak copy-nya
+        """
+        items = split_items(raw_text)
+        weights = weights if weights and len(weights) == len(items) else [1] * len(items)
+        terms = Counter()
+        for item, weight in zip(items, weights):
+            for term in self.tokenizer(shingle_text(item)):
+                terms[term] += weight
+        if not terms:
+            return
+
+        keyword = keyword.lower()
+        bucket = int((timestamp or time.time()) // self.bucket_seconds * self.bucket_seconds)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(
+                "SELECT term, count, error FROM heavy_hitters WHERE keyword = ? AND bucket_start = ?",
+                (keyword, bucket)
+            ).fetchall()
+            counters = {row["term"]: [row["count"], row["error"]] for row in rows}
+            evicted, changed = set(), set()
+
+            # Term paling sering dulu: term jarang tidak mengusir term besar dari batch yang sama
+            for term, count in terms.most_common():
+                if term in counters:
+                    counters[term][0] += count
+                elif len(counters) < self.capacity:
+                    counters[term] = [count, 0]
+                else:
+                    victim = min(counters, key=lambda t: counters[t][0])
+                    floor = counters.pop(victim)[0]
+                    evicted.add(victim)
+                    counters[term] = [floor + count, floor]
+                changed.add(term)
+
+            evicted -= counters.keys()
+            self.conn.executemany(
+                "DELETE FROM heavy_hitters WHERE keyword = ? AND bucket_start = ? AND term = ?",
+                [(keyword, bucket, term) for term in evicted]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO heavy_hitters (keyword, bucket_start, term, count, error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(keyword, bucket, term, *counters[term]) for term in changed if term in counters]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def top(self, keyword: str, window_seconds: int, n: int = 10) -> List[Tuple[str, int, int]]:
+        """Top-n term keyword dalam window terakhir: [(term, count, error)]"""
+        since = time.time() - window_seconds
+        rows = self.conn.execute(
+            "SELECT term, SUM(count) AS count, SUM(error) AS error FROM heavy_hitters "
+            "WHERE keyword = ? AND bucket_start > ? GROUP BY term ORDER BY count DESC LIMIT ?",
+            (keyword.lower(), since - self.bucket_seconds, n)
+        ).fetchall()
+        return [(row["term"], row["count"], row["error"]) for row in rows]
+
+    def close(self):
+        self.conn.close()
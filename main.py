@@ -1,12 +1,39 @@
 # main.py - ENHANCED VERSION dengan NLP Integration
 import os
+import time
+import socket
 import asyncio
-from playwright.async_api import async_playwright
+import argparse
+import multiprocessing
+from collections import Counter
+from datetime import datetime
 
 from config import settings
 from scrapers.factory import ScraperFactory
+from scrapers.base import ScrapeOutcome
 from core.llm import LLMProcessor
+from core.browser import BrowserPool
+from core.ledger import RUNNING, JobLedger
+from core.aggregates import RunAggregates, SCOPE_PLATFORM
+from core.breaker import CircuitBreaker, is_block_signal
+from core.deadline import Deadline, DeadlineExceeded
+from core.pipeline import Pipeline
+from core.scheduler import AdaptiveScheduler
+from core.session import SessionChecker, INVALID
+from core.trending import TrendingTerms, parse_window
+from core.search_index import SearchIndex
+from core.fetcher import TIER_HTTP, TIER_BROWSER
 from utils.storage import StorageManager
+from utils.profiler import profiler
+from utils import logger
+from utils.logger import get_logger
+
+log = get_logger("*")
+job_log = get_logger("X")
+monitor_log = get_logger("MONITOR")
+breaker_log = get_logger("BREAKER")
+session_log = get_logger("SESSION")
+dedup_log = get_logger("DEDUP")
 
 # Import Enhanced Visualizer
 try:
@@ -14,7 +41,7 @@ try:
     VIZ_ENABLED = True
 except ImportError:
     VIZ_ENABLED = False
-    print("[WARN] Enhanced visualizer not available. Using basic charts.")
+    log.warning("Enhanced visualizer not available. Using basic charts.")
 
 
 # ================================
@@ -31,145 +58,468 @@ def draw_basic_chart(platform, keyword, score):
     print(f"|{bar}| {score * 10}%\n")
 
 
+# ================================
+#  BROWSER TIER (Playwright)
+# ================================
+async def scrape_with_browser(pool: BrowserPool, platform: str, keyword: str, deadline: Deadline = None) -> str:
+    # Context per platform tetap warm; tiap job hanya membuka page baru
+    page = await pool.new_page(platform)
+    try:
+        scraper = ScraperFactory.get_scraper(platform, page, deadline)
+        return await scraper.scrape(keyword)
+    finally:
+        await pool.release(page)
+
+
 # ================================
 #  TASK SCRAPER (Enhanced)
 # ================================
-async def run_task(platform: str, keyword: str, llm: LLMProcessor):
-    async with async_playwright() as p:
-        # ---- AUTH SUPPORT ----
-        session_file = "session.json"
-
-        if not os.path.exists(session_file):
-            print("[WARN] session.json tidak ditemukan! Mode Anonymous.")
-            context_options = {
-                "user_agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            }
+async def run_task(platform: str, keyword: str, pipeline: Pipeline):
+    """Jalankan satu job; return (outcome, result). Result None untuk outcome selain OK"""
+    llm, pool, fetcher, breaker = pipeline.llm, pipeline.pool, pipeline.fetcher, pipeline.breaker
+    dedup, corpus, trending = pipeline.dedup, pipeline.corpus, pipeline.trending
+    search_index, parquet = pipeline.search_index, pipeline.parquet
+
+    # Satu budget untuk seluruh job; tiap stage memakai sisanya
+    deadline = Deadline.for_platform(platform)
+
+    # ---- 1. SCRAPE (HTTP tier dulu, browser jika perlu) ----
+    try:
+        with profiler.stage("scrape"):
+            raw_data = await deadline.run(fetcher.fetch(platform, keyword), "http") if fetcher else None
+            tier = TIER_HTTP
+            if raw_data is None:
+                tier = TIER_BROWSER
+                # Jika deadline lewat, scrape dibatalkan & page tetap dilepas (finally di scrape_with_browser)
+                raw_data = await deadline.run(scrape_with_browser(pool, platform, keyword, deadline), "scrape")
+    except Exception:
+        # Deadline / error saat scrape: probe half-open dianggap gagal
+        if breaker:
+            breaker.record_failure(platform)
+        raise
+
+    # ---- Circuit breaker: sukses hanya untuk OK, blokir untuk captcha/login wall ----
+    outcome = getattr(raw_data, "outcome", ScrapeOutcome.OK)
+    if breaker:
+        if outcome == ScrapeOutcome.OK:
+            breaker.record_success(platform)
+        elif is_block_signal(raw_data):
+            breaker.record_block(platform)
+        elif outcome == ScrapeOutcome.ERROR:
+            breaker.record_failure(platform)
         else:
-            print("[INFO] Menggunakan session.json (Login Mode)")
-            context_options = {
-                "storage_state": session_file,
-                "user_agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            }
-
-        # ---- Launch browser ----
-        browser = await p.chromium.launch(
-            headless=settings.HEADLESS,
-            args=["--disable-blink-features=AutomationControlled"]
-        )
-
-        context = await browser.new_context(**context_options)
-        page = await context.new_page()
-
-        try:
-            # ---- 1. SCRAPE ----
-            scraper = ScraperFactory.get_scraper(platform, page)
-            raw_data = await scraper.scrape(keyword)
-
-            if isinstance(raw_data, str) and "TERDETEKSI BOT" in raw_data:
-                print(f"[!] BOT DETECTED di {platform}, skip.")
-                return None
-
-            # ---- 2. ANALISIS LLM + NLP ----
-            print(f"[*] Menganalisis {platform} dengan AI + NLP...")
-            result = llm.analyze_content(raw_data, keyword)
-            
-            # Add platform & keyword ke result
-            result['platform'] = platform
-            result['keyword'] = keyword
-
-            # ---- 3. ENHANCED VISUALIZATION ----
-            if VIZ_ENABLED:
-                viz = Visualizer()
-                viz.draw_comprehensive_dashboard(result)
-            else:
-                # Fallback ke basic chart
-                print(f"\n--- HASIL: {keyword} ({platform.upper()}) ---")
-                print(f"Summary: {result.get('summary')}")
-                print(f"Category: {result.get('category')}")
-                print(f"Trend: {result.get('trend_strength')}")
-                draw_basic_chart(platform, keyword, result['score'])
-
-            # ---- 4. SAVE CSV ----
-            save_data = {
-                "platform": platform,
-                "keyword": keyword,
-                "summary": result.get("summary", ""),
-                "score": result.get("score", 0),
-                "category": result.get("category", "Unknown"),
-                "trend_strength": result.get("trend_strength", "Unknown")
-            }
-            
-            # Add NLP metrics jika ada
-            if result.get('nlp_analysis'):
-                nlp = result['nlp_analysis']
-                save_data['nlp_sentiment'] = nlp.get('sentiment_label', 'N/A')
-                save_data['nlp_score'] = nlp.get('sentiment_score', 0)
-                save_data['top_keywords'] = ', '.join(nlp.get('top_keywords', []))
-            
-            StorageManager.save_to_csv(save_data)
-            
-            return result
-
-        except Exception as e:
-            print(f"[X] ERROR di {platform}: {e}")
-            return None
-
-        finally:
-            await browser.close()
+            breaker.record_neutral(platform)
+
+    # ---- Outcome selain OK tidak perlu NLP/LLM maupun disimpan ----
+    if outcome == ScrapeOutcome.LOGIN_REQUIRED and pipeline.sessions and platform not in pool.anonymous:
+        # Session ternyata mati di tengah run -> job berikutnya tidak perlu menunggu cache TTL habis
+        pipeline.sessions.record(platform, INVALID, "login wall saat scrape")
+    if outcome != ScrapeOutcome.OK:
+        log.warning("%s: outcome %s, skip analisis. (%s)", platform, outcome.value, raw_data[:80],
+                    platform=platform, keyword=keyword, outcome=outcome.value)
+        return outcome, None
+
+    # ---- Near-duplicate: hanya representatif cluster baru yang dianalisis ----
+    dedup_stats = dedup_batch = None
+    if dedup:
+        raw_data, dedup_stats, dedup_batch = dedup.filter(raw_data, platform)
+        if not dedup_stats["unique"]:
+            dedup_log.info("%s: semua %d item sudah pernah dianalisis, skip.", platform, dedup_stats['items'],
+                           platform=platform, keyword=keyword, outcome=ScrapeOutcome.DUPLICATE.value)
+            dedup.commit(dedup_batch)
+            return ScrapeOutcome.DUPLICATE, None
+
+    # ---- 2. ANALISIS LLM + NLP ----
+    log.info("Menganalisis %s dengan AI + NLP...", platform, platform=platform, keyword=keyword)
+    # Jalan di thread agar event loop (heartbeat ledger) tidak terblokir. wait_for hanya membatalkan
+    # await-nya; thread berhenti sendiri lewat deadline.check() per stage NLP/chunk & timeout request LLM
+    weights = dedup_stats["weights"] if dedup_stats else None
+    result = await deadline.run(asyncio.to_thread(llm.analyze_content, raw_data, keyword, deadline, weights),
+                                "analysis")
+    
+    # Add platform & keyword ke result
+    result['platform'] = platform
+    result['keyword'] = keyword
+    result['tier'] = tier
+    with profiler.stage("index"):
+        if dedup:
+            # Cluster baru baru dicatat setelah analisis berhasil
+            dedup.commit(dedup_batch)
+            result['dedup'] = dedup_stats
+        if corpus:
+            # Term yang menonjol dibanding baseline korpus (sebelum hasil ini ditambahkan)
+            result['distinctive_terms'] = [term for term, _ in corpus.distinctive_terms(raw_data, keyword)]
+        if trending:
+            trending.add(keyword, raw_data, weights=weights)
+        if search_index:
+            search_index.add(keyword, platform, raw_data, result.get('summary'))
+
+    # ---- 3. ENHANCED VISUALIZATION ----
+    # Dashboard langsung ke terminal: tulis dulu log job ini agar urutannya tetap terbaca
+    logger.flush()
+    if VIZ_ENABLED:
+        viz = Visualizer()
+        viz.draw_comprehensive_dashboard(result)
+    else:
+        # Fallback ke basic chart
+        print(f"\n--- HASIL: {keyword} ({platform.upper()}) ---")
+        print(f"Summary: {result.get('summary')}")
+        print(f"Category: {result.get('category')}")
+        print(f"Trend: {result.get('trend_strength')}")
+        draw_basic_chart(platform, keyword, result['score'])
+
+    # ---- 4. SAVE CSV ----
+    save_data = {
+        "platform": platform,
+        "keyword": keyword,
+        "summary": result.get("summary", ""),
+        "score": result.get("score", 0),
+        "category": result.get("category", "Unknown"),
+        "trend_strength": result.get("trend_strength", "Unknown"),
+        "tier": tier,
+        "llm_tier": result.get("llm_tier", "main")
+    }
+    
+    # Add NLP metrics jika ada
+    if result.get('nlp_analysis'):
+        nlp = result['nlp_analysis']
+        save_data['nlp_sentiment'] = nlp.get('sentiment_label', 'N/A')
+        save_data['nlp_score'] = nlp.get('sentiment_score', 0)
+        save_data['top_keywords'] = ', '.join(nlp.get('top_keywords', []))
+    if result.get('distinctive_terms'):
+        save_data['distinctive_terms'] = ', '.join(result['distinctive_terms'])
+    
+    with profiler.stage("storage"):
+        StorageManager.save_to_csv(save_data)
+        if parquet:
+            parquet.write(result)
+    
+    return outcome, result
+
+
+# ================================
+#  WORKER (claim job dari ledger)
+# ================================
+PLATFORMS = [
+    "tiktok", "youtube", "instagram", "twitter",
+    "google", "threads", "facebook"
+]
+
+
+async def _heartbeat(ledger: JobLedger, job_id: int, worker_id: str):
+    while True:
+        await asyncio.sleep(settings.LEDGER_HEARTBEAT)
+        ledger.heartbeat(job_id, worker_id)
+
+
+def write_report(run_id: str, partial: bool = False, echo: bool = True) -> bool:
+    """Report dari agregat streaming run ini -> analysis_summary.txt (bisa saat run masih jalan)"""
+    if not VIZ_ENABLED:
+        return False
+    aggregates = RunAggregates()
+    stats = aggregates.load(run_id)
+    aggregates.close()
+    if not stats['keyword']:
+        return False
+
+    summary = Visualizer.generate_aggregate_report(stats, run_id, partial)
+    if echo:
+        print(summary)
+    with open("analysis_summary.txt", "w", encoding="utf-8") as f:
+        f.write(summary)
+    return True
+
+
+async def worker_loop(run_id: str, worker_id: str, llm: LLMProcessor = None, pipeline: Pipeline = None,
+                      save_sessions: bool = True):
+    """Claim job satu per satu sampai antrian run ini habis"""
+    ledger = JobLedger()
+    aggregates = RunAggregates()
+    # Pipeline dari caller (mode monitor) tetap warm setelah run selesai
+    own_pipeline = pipeline is None
+    pipeline = pipeline or Pipeline(llm, save_sessions)
+    completed = 0
+    current_keyword = None
+    job = None
+
+    try:
+        while True:
+            job = ledger.claim(run_id, worker_id)
+            if not job:
+                # Masih ada job running milik worker lain: tunggu selesai, atau stale lalu di-requeue
+                if not ledger.counts(run_id).get(RUNNING):
+                    break
+                await asyncio.sleep(settings.LEDGER_HEARTBEAT)
+                continue
+
+            platform, keyword = job["platform"], job["keyword"]
+            if keyword != current_keyword:
+                current_keyword = keyword
+                logger.flush()
+                print(f"\n{'═'*80}")
+                print(f"Processing Keyword: {keyword.upper()}  [{worker_id}]")
+                print(f"{'═'*80}\n")
+
+            # Session dicek dulu agar slot probe breaker (half-open) tidak terpakai job yang di-skip
+            if not await pipeline.session_allows(platform):
+                session_log.warning("Session %s mati, skip %s", platform, keyword,
+                                    platform=platform, outcome="session_dead")
+                ledger.skip(job["id"], worker_id, "session_dead")
+                continue
+            # Platform yang sedang diblokir tidak perlu dibuka sama sekali
+            if not pipeline.breaker.allow(platform):
+                breaker_log.warning("%s sedang cooldown, skip %s", platform, keyword,
+                                    platform=platform, outcome="circuit_open")
+                ledger.skip(job["id"], worker_id, "circuit_open")
+                continue
+
+            heartbeat = asyncio.create_task(_heartbeat(ledger, job["id"], worker_id))
+            try:
+                outcome, result = await run_task(platform, keyword, pipeline)
+                if outcome == ScrapeOutcome.OK:
+                    if ledger.complete(job["id"], worker_id, result):
+                        aggregates.record(run_id, result)
+                        completed += 1
+                        if settings.REPORT_EVERY and completed % settings.REPORT_EVERY == 0:
+                            write_report(run_id, partial=True, echo=False)
+                    else:
+                        # Heartbeat sempat stale, job sudah di-requeue / diambil worker lain
+                        job_log.warning("Job %s (%s/%s) bukan milik %s lagi, hasil dibuang", job["id"], platform,
+                                        keyword, worker_id, platform=platform, keyword=keyword)
+                elif outcome == ScrapeOutcome.ERROR:
+                    # Error scraper biasanya sementara (timeout, network) -> boleh dicoba ulang
+                    ledger.release(job["id"], worker_id, "scraper error", outcome.value)
+                else:
+                    ledger.skip(job["id"], worker_id, outcome.value)
+            except DeadlineExceeded as e:
+                job_log.error("DEADLINE di %s: %s", platform, e, platform=platform, keyword=keyword)
+                ledger.release(job["id"], worker_id, str(e), "deadline")
+            except Exception as e:
+                job_log.error("ERROR di %s: %s", platform, e, platform=platform, keyword=keyword)
+                ledger.release(job["id"], worker_id, str(e))
+            finally:
+                heartbeat.cancel()
+
+            # Small delay between platforms
+            await asyncio.sleep(2)
+    except BaseException:
+        # Ctrl-C / task di-cancel: job yang sedang jalan jangan tertinggal RUNNING sampai stale
+        # (no-op jika job terakhir sudah selesai)
+        if job:
+            ledger.requeue(job["id"], worker_id)
+        raise
+    finally:
+        ledger.close()
+        aggregates.close()
+        profiler.write(os.path.join(run_id, str(os.getpid())))
+        if own_pipeline:
+            await pipeline.close()
+            # ---- ASSET CACHE & LLM STATS ----
+            pipeline.report_stats(worker_id)
+
+
+async def monitor_loop():
+    """Mode monitor: refresh keyword x platform sesuai jadwal adaptif, pipeline tetap warm"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:monitor"
+    scheduler = AdaptiveScheduler()
+    ledger = JobLedger()
+    pipeline = Pipeline()
+    scheduler.seed(settings.KEYWORDS, PLATFORMS)
+    if pipeline.sessions:
+        await pipeline.sessions.check_all(PLATFORMS)
+
+    try:
+        while True:
+            pairs = scheduler.dispatch_due(settings.KEYWORDS, PLATFORMS)
+            if pairs:
+                run_id = JobLedger.new_run_id()
+                ledger.enqueue_pairs(run_id, pairs)
+                monitor_log.info("Run %s: %d job jatuh tempo, sisa budget %d/jam", run_id, len(pairs),
+                                 scheduler.budget_left(), run_id=run_id, jobs=len(pairs))
+                await worker_loop(run_id, worker_id, pipeline=pipeline)
+
+                for job in ledger.jobs(run_id):
+                    interval = scheduler.update(job["keyword"], job["platform"], job["outcome"], job["result"])
+                    trend = (job["result"] or {}).get("trend_strength", "-")
+                    monitor_log.info("%-30s %-10s %-14s %-9s -> refresh %.0f menit lagi", job['keyword'][:30],
+                                     job['platform'], job['outcome'] or '-', trend, interval / 60,
+                                     keyword=job['keyword'], platform=job['platform'], interval=interval)
+
+            wait = scheduler.seconds_until_next()
+            if wait is None or (not pairs and wait == 0):
+                # Tidak ada jadwal, atau ada yang jatuh tempo tapi budget jam ini habis
+                wait = settings.SCHEDULE_TICK
+            # Bangun minimal tiap SCHEDULE_TICK (budget bisa tersedia lagi)
+            await asyncio.sleep(max(1.0, min(wait, settings.SCHEDULE_TICK)))
+    finally:
+        await pipeline.close()
+        pipeline.report_stats(worker_id)
+        scheduler.close()
+        ledger.close()
+
+
+def worker_process(run_id: str, index: int):
+    """Entry point proses worker (browser pool, LLM & NLP milik sendiri)"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:w{index}"
+    try:
+        # Worker 0 pemilik file session; worker lain hanya membaca (context tidak saling di-reload)
+        asyncio.run(worker_loop(run_id, worker_id, save_sessions=index == 0))
+    finally:
+        # Proses multiprocessing keluar lewat os._exit (atexit tidak jalan) -> kosongkan queue log dulu
+        logger.shutdown()
 
 
 # ================================
 #  MAIN LOOP (Enhanced)
 # ================================
+def parse_args():
+    parser = argparse.ArgumentParser(description="Universal Scraper")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jumlah proses worker (>1 = multi-process, masing-masing punya browser pool)")
+    parser.add_argument("--run-id", help="Lanjutkan/jalankan run dengan ID ini")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Selalu mulai run baru walau ada run yang belum selesai")
+    parser.add_argument("--top-terms", metavar="KEYWORD",
+                        help="Tampilkan term trending untuk keyword ini lalu keluar (tanpa scraping)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Jalankan service mode: job API lokal dengan pipeline yang tetap warm")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="Profil CPU & alokasi per stage; hasil di DIR/<run_id>/<pid>/ (default: profiles)")
+    parser.add_argument("--monitor", action="store_true",
+                        help="Monitoring berulang dengan jadwal adaptif per trend_strength (tidak berhenti)")
+    parser.add_argument("--report", action="store_true",
+                        help="Tampilkan report agregat run (--run-id atau run terakhir) lalu keluar")
+    parser.add_argument("--search", metavar="QUERY",
+                        help='Cari post & summary tersimpan lalu keluar, mis. \'golang "web framework" -java\'')
+    parser.add_argument("--platform", help="Filter platform untuk --search")
+    parser.add_argument("--window",
+                        help="Window waktu untuk --top-terms / --search, mis. 24h atau 7d (default 24h / semua)")
+    return parser.parse_args()
+
+
+def print_top_terms(keyword: str, window: str, n: int = 20):
+    trending = TrendingTerms()
+    rows = trending.top(keyword, parse_window(window), n)
+    trending.close()
+
+    print(f"\n🔥 Top terms '{keyword}' ({window} terakhir)")
+    if not rows:
+        print("   (belum ada data)")
+    for rank, (term, count, error) in enumerate(rows, 1):
+        print(f"{rank:3}. {term:25} {count:>8}  (±{error})")
+
+
+def print_search(query: str, platform: str = None, window: str = None, limit: int = 20):
+    # Tokenizer harus sama dengan saat indexing (robust_tokenize)
+    from core.nlp_analyzer import NLPAnalyzer
+    index = SearchIndex(NLPAnalyzer().robust_tokenize)
+    since = time.time() - parse_window(window) if window else None
+
+    start = time.perf_counter()
+    docs = index.search(query, platform=platform, since=since, limit=limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    index.close()
+
+    print(f"\n🔎 '{query}': {len(docs)} hasil ({elapsed:.1f} ms)")
+    for doc in docs:
+        print(f"[{datetime.fromtimestamp(doc['ts']):%Y-%m-%d %H:%M}] {doc['platform']:9} "
+              f"{doc['kind']:7} ({doc['keyword']}) {doc['text'][:150]}")
+
+
 async def main():
-    llm = LLMProcessor()
-    
-    platforms = [
-        "tiktok", "youtube", "instagram", "twitter",
-        "google", "threads", "facebook"
-    ]
-    
-    all_results = []
+    args = parse_args()
+    if args.profile:
+        # Lewat env agar proses worker (spawn) ikut mengaktifkan profiler saat import
+        os.environ["PROFILE_DIR"] = settings.PROFILE_DIR = args.profile
+        profiler.enable(args.profile)
+    if args.top_terms:
+        print_top_terms(args.top_terms, args.window or "24h")
+        return
+    if args.search:
+        print_search(args.search, args.platform, args.window)
+        return
+    if args.monitor:
+        await monitor_loop()
+        return
+    if args.serve:
+        from service import JobService
+        await JobService(run_task, PLATFORMS).serve()
+        return
+
+    ledger = JobLedger()
+    if args.report:
+        run_id = args.run_id or ledger.latest_run()
+        counts = ledger.counts(run_id) if run_id else {}
+        finished = not counts.get("pending") and not counts.get("running")
+        ledger.close()
+        if not run_id or not write_report(run_id, partial=not finished):
+            print("[REPORT] Belum ada hasil untuk dilaporkan.")
+        return
+
+    # ---- RUN ID: resume run yang terputus, atau buat run baru ----
+    run_id = args.run_id or (None if args.fresh else ledger.latest_open_run())
+    if run_id and not args.run_id:
+        print(f"[LEDGER] Melanjutkan run yang belum selesai: {run_id}")
+    run_id = run_id or JobLedger.new_run_id()
+    added = ledger.enqueue(run_id, settings.KEYWORDS, PLATFORMS)
     
     print("\n" + "="*80)
     print("🚀 UNIVERSAL SCRAPER - ENHANCED NLP VERSION")
     print("="*80)
     print(f"🎯 Keywords: {settings.KEYWORDS}")
-    print(f"📱 Platforms: {', '.join(platforms)}")
+    print(f"📱 Platforms: {', '.join(PLATFORMS)}")
     print(f"🤖 AI Model: {settings.OLLAMA_MODEL}")
-    print(f"🔬 NLP: {'ENABLED ✓' if llm.nlp_analyzer else 'DISABLED ✗'}")
+    print(f"🧾 Run: {run_id} ({added} job baru, {ledger.counts(run_id)})")
+    print(f"⚙️  Workers: {args.workers}")
     print("="*80 + "\n")
 
-    for keyword in settings.KEYWORDS:
-        print(f"\n{'═'*80}")
-        print(f"Processing Keyword: {keyword.upper()}")
-        print(f"{'═'*80}\n")
-        
-        for platform in platforms:
-            result = await run_task(platform, keyword, llm)
-            if result:
-                all_results.append(result)
-            
-            # Small delay between platforms
-            await asyncio.sleep(2)
+    if settings.SESSION_CHECK:
+        # Pre-flight semua platform paralel; worker membaca hasilnya dari cache
+        sessions = SessionChecker()
+        await sessions.check_all(PLATFORMS)
+        sessions.close()
+
+    if args.workers > 1:
+        # Proses terpisah -> throughput skala dengan jumlah core
+        mp = multiprocessing.get_context("spawn")
+        workers = [mp.Process(target=worker_process, args=(run_id, i)) for i in range(args.workers)]
+        for worker in workers:
+            worker.start()
+        await asyncio.gather(*(asyncio.to_thread(worker.join) for worker in workers))
+    else:
+        llm = LLMProcessor()
+        print(f"🔬 NLP: {'ENABLED ✓' if llm.nlp_analyzer else 'DISABLED ✗'}")
+        await worker_loop(run_id, f"{socket.gethostname()}:{os.getpid()}", llm)
+
+    # Log worker yang masih di queue ditulis dulu sebelum ringkasan akhir
+    logger.flush()
+    print(f"\n[LEDGER] Run {run_id}: {ledger.counts(run_id)}")
+    for platform, outcomes in ledger.outcome_counts(run_id).items():
+        detail = ", ".join(f"{name}={count}" for name, count in sorted(outcomes.items()))
+        print(f"[OUTCOME] {platform:10} {detail}")
+    ledger.close()
+
+    # ---- BREAKER STATUS ----
+    breaker = CircuitBreaker()
+    for platform, state in breaker.status().items():
+        print(f"[BREAKER] {platform}: {state['state']} (trip #{state['trips']}, "
+              f"sampai {datetime.fromtimestamp(state['open_until']):%H:%M:%S})")
+    breaker.close()
+
+    # ---- FETCH TIER STATS (dari agregat per platform) ----
+    aggregates = RunAggregates()
+    platform_stats = aggregates.load(run_id)[SCOPE_PLATFORM].values()
+    aggregates.close()
+    tier_stats = sum((stats.tiers for stats in platform_stats), Counter())
+    total_jobs = sum(tier_stats.values())
+    if total_jobs:
+        print(f"\n[TIER] HTTP: {tier_stats[TIER_HTTP]}/{total_jobs} job "
+              f"({tier_stats[TIER_HTTP] / total_jobs:.0%}), Browser: {tier_stats[TIER_BROWSER]}/{total_jobs}")
+        llm_tiers = sum((stats.llm_tiers for stats in platform_stats), Counter())
+        print(f"[CASCADE] " + ", ".join(f"{name}: {count}" for name, count in sorted(llm_tiers.items())))
     
     # ---- FINAL SUMMARY REPORT ----
-    if VIZ_ENABLED and all_results:
-        viz = Visualizer()
-        summary = viz.generate_summary_report(all_results)
-        print(summary)
-        
-        # Save summary to file
-        with open("analysis_summary.txt", "w", encoding="utf-8") as f:
-            f.write(summary)
+    if write_report(run_id):
         print("[✓] Summary report saved to: analysis_summary.txt")
 
 
@@ -1,12 +1,151 @@
 # scrapers/base.py
+import asyncio
+import json
+import os
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Dict, List, Optional
 from playwright.async_api import Page
 
+from config import settings
+from core.capture import CAPTURE_PATTERNS, ITEM_SEPARATOR, ResponseCapture, format_items
+from core.deadline import Deadline
+from utils.logger import get_logger
+
+log = get_logger("*")
+capture_log = get_logger("CAPTURE")
+selector_log = get_logger("SELECTOR")
+
+class ScrapeOutcome(str, Enum):
+    OK = "ok"
+    EMPTY = "empty"
+    LOGIN_REQUIRED = "login_required"
+    BLOCKED = "blocked"
+    ERROR = "error"
+    DUPLICATE = "duplicate"  # semua item near-duplicate dari konten yang sudah dianalisis
+
+
+class ScrapeResult(str):
+    """Teks hasil scrape + outcome bertipe (tetap bisa dipakai sebagai str biasa)"""
+    def __new__(cls, text: str, outcome: ScrapeOutcome = ScrapeOutcome.OK):
+        obj = super().__new__(cls, text)
+        obj.outcome = outcome
+        return obj
+
+    @classmethod
+    def ok(cls, text: str) -> "ScrapeResult":
+        """Outcome OK, atau EMPTY jika tidak ada teks sama sekali"""
+        return cls(text, ScrapeOutcome.OK if text and text.strip() else ScrapeOutcome.EMPTY)
+
+
+class SelectorStats:
+    """Hitung strategi selector yang menang per platform (disimpan ke JSON antar run)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.wins = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.wins = {}
+
+    def rank(self, platform: str, names: List[str]) -> List[str]:
+        """Urutkan strategi: yang paling sering menang duluan (urutan asli jika seri)"""
+        wins = self.wins.get(platform, {})
+        return sorted(names, key=lambda name: -wins.get(name, 0))
+
+    def record(self, platform: str, name: str):
+        platform_wins = self.wins.setdefault(platform, {})
+        platform_wins[name] = platform_wins.get(name, 0) + 1
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.wins, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+selector_stats = SelectorStats(settings.SELECTOR_STATS_FILE)
+
+
 class BaseScraper(ABC):
-    def __init__(self, page: Page):
+    # Nama platform (key untuk capture layer & statistik selector)
+    platform = None
+
+    def __init__(self, page: Page, deadline: Deadline = None):
         self.page = page
+        self.capture = None
+        self.deadline = deadline
+
+    def budget_ms(self, timeout_ms: int) -> int:
+        """Timeout satu operasi, dipotong ke sisa budget job (jika ada deadline)"""
+        return self.deadline.remaining_ms(timeout_ms) if self.deadline else timeout_ms
 
     @abstractmethod
-    async def scrape(self, keyword: str) -> str:
+    async def scrape(self, keyword: str) -> ScrapeResult:
         """Method ini wajib diimplementasikan oleh setiap platform scraper"""
-        pass
\ No newline at end of file
+        pass
+
+    async def start_capture(self):
+        """Pasang listener response SEBELUM goto agar payload awal ikut tertangkap"""
+        if settings.CAPTURE_MODE and self.platform in CAPTURE_PATTERNS:
+            self.capture = ResponseCapture(self.platform)
+            self.capture.attach(self.page)
+
+    @property
+    def wait_until(self) -> str:
+        """Saat capture aktif tidak perlu menunggu event 'load' (render & asset)"""
+        return "domcontentloaded" if self.capture else "load"
+
+    async def captured_text(self, label: str, limit: int = 10) -> str:
+        """Teks dari payload network, atau string kosong jika harus fallback ke DOM"""
+        if not self.capture:
+            return ""
+
+        items = await self.capture.wait_for_items(self.budget_ms(settings.CAPTURE_WAIT))
+        if not items:
+            capture_log.info("Tidak ada payload %s, fallback ke DOM", self.platform, platform=self.platform)
+            return ""
+
+        capture_log.info("%d item dari network payload %s", len(items), self.platform,
+                         platform=self.platform, items=len(items))
+        return format_items(items, label, limit)
+
+
+    async def wait_for_any(self, candidates: Dict[str, str], timeout: int = 10000) -> Optional[str]:
+        """
+        Tunggu beberapa selector alternatif SEKALIGUS, ambil yang pertama muncul.
+        candidates: {nama_strategi: selector}
+        Return nama strategi pemenang, atau None jika semua timeout.
+        """
+        ranked = selector_stats.rank(self.platform, list(candidates))
+        timeout = self.budget_ms(timeout)
+
+        # Jalur cepat: elemen sudah ada di DOM (cek strategi yang biasa menang duluan)
+        for name in ranked:
+            if await self.page.query_selector(candidates[name]):
+                selector_stats.record(self.platform, name)
+                return name
+
+        tasks = {
+            asyncio.create_task(self.page.wait_for_selector(candidates[name], timeout=timeout)): name
+            for name in ranked
+        }
+        pending = set(tasks)
+        winner = None
+
+        try:
+            while pending and not winner:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                matched = [tasks[task] for task in done if task.exception() is None]
+                if matched:
+                    # Jika beberapa selesai bersamaan, pilih yang rank-nya lebih tinggi
+                    winner = min(matched, key=ranked.index)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if winner:
+            selector_stats.record(self.platform, winner)
+            selector_log.info("%s: strategi '%s' menang", self.platform, winner, platform=self.platform)
+        return winner
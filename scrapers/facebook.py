@@ -1,21 +1,23 @@
 # scrapers/facebook.py
 import asyncio
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class FacebookScraper(BaseScraper):
+    platform = "facebook"
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping Facebook untuk: {keyword}")
+        log.info("Scraping Facebook untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         # URL Search Postingan Publik
         url = f"https://www.facebook.com/search/posts/?q={keyword}"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT))
             
             # Cek login: Jika ada tombol "Log In" di header, berarti session gagal/expired
             if "login" in self.page.url:
-                return "GAGAL: Session tidak valid. Harap jalankan auth_generator.py lagi."
+                return ScrapeResult("GAGAL: Session tidak valid. Harap jalankan auth_generator.py lagi.", ScrapeOutcome.LOGIN_REQUIRED)
 
             # Facebook butuh waktu load yang agak lama (CSR)
             await self.page.wait_for_timeout(5000)
@@ -31,13 +33,13 @@ class FacebookScraper(BaseScraper):
                 
                 # Ambil text dari elemen role="article" (Postingan biasanya berupa article)
                 posts = await self.page.locator('[role="article"]').all_inner_texts()
-            except:
-                return "Tidak ada postingan ditemukan atau layout Facebook berubah."
+            except Exception:
+                return ScrapeResult("Tidak ada postingan ditemukan atau layout Facebook berubah.", ScrapeOutcome.EMPTY)
 
             if not posts:
                  # Fallback extreme: Ambil body text jika selector spesifik gagal
                  body = await self.page.locator('body').inner_text()
-                 return body[:3000] # Ambil sebagian saja
+                 return ScrapeResult.ok(body[:3000]) # Ambil sebagian saja
 
             # Bersihkan data (Facebook banyak teks tombol seperti 'Like', 'Comment')
             clean_posts = []
@@ -46,7 +48,7 @@ class FacebookScraper(BaseScraper):
                 clean_p = " ".join(p.split())
                 clean_posts.append(f"Post: {clean_p[:300]}") # Potong biar gak kepanjangan
             
-            return "\n---\n".join(clean_posts)
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(clean_posts))
 
         except Exception as e:
-            return f"Error Facebook: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error Facebook: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
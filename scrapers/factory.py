@@ -1,5 +1,6 @@
 # scrapers/factory.py
 from playwright.async_api import Page
+from core.deadline import Deadline
 from scrapers.google import GoogleScraper
 from scrapers.tiktok import TiktokScraper
 from scrapers.instagram import InstagramScraper
@@ -10,7 +11,7 @@ from scrapers.threads import ThreadsScraper
 
 class ScraperFactory:
     @staticmethod
-    def get_scraper(platform: str, page: Page):
+    def get_scraper(platform: str, page: Page, deadline: Deadline = None):
         platforms = {
             "google": GoogleScraper,
             "tiktok": TiktokScraper,
@@ -26,4 +27,4 @@ class ScraperFactory:
         if not scraper_class:
             raise ValueError(f"Platform '{platform}' belum didukung.")
         
-        return scraper_class(page)
\ No newline at end of file
+        return scraper_class(page, deadline)
\ No newline at end of file
@@ -1,34 +1,37 @@
 # scrapers/google.py
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ScrapeResult, ScrapeOutcome, log
 from config import settings
 import asyncio
 
 class GoogleScraper(BaseScraper):
+    platform = "google"
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping Google untuk: {keyword}")
+        log.info("Scraping Google untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         # Gunakan URL dengan parameter 'hl=id' (Bahasa Indonesia) & 'gl=id' (Lokasi Indo)
         url = f"https://www.google.com/search?q={keyword}&hl=id&gl=id"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT))
             
             # Cek apakah terkena CAPTCHA/Consent page
             if "google_abuse" in self.page.url or "sorry" in self.page.url:
-                return "TERDETEKSI BOT: Google memblokir request ini (Captcha)."
+                return ScrapeResult("TERDETEKSI BOT: Google memblokir request ini (Captcha).", ScrapeOutcome.BLOCKED)
 
-            # Tunggu elemen hasil pencarian (div.g atau div[data-header-feature])
-            # Kita gunakan try/except untuk selector
-            try:
-                await self.page.wait_for_selector("div#search", timeout=10000)
-            except:
-                pass # Lanjut saja siapa tau konten sudah load
+            # Tunggu elemen hasil pencarian (layout Google berganti-ganti, race beberapa selector)
+            # Jika semua timeout, lanjut saja siapa tau konten sudah load
+            await self.wait_for_any({
+                "search": "div#search",
+                "rso": "div#rso",
+                "result_block": "div.g",
+            })
 
             # Ambil semua teks body sebagai fallback jika selector spesifik gagal
             body_text = await self.page.locator("body").inner_text()
             
             # Potong agar tidak terlalu panjang (hemat token LLM)
-            return body_text[:5000] 
+            return ScrapeResult.ok(body_text[:5000])
 
         except Exception as e:
-            return f"Error Google Scraping: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error Google Scraping: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
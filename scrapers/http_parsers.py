@@ -0,0 +1,45 @@
+# scrapers/http_parsers.py
+"""
+Parser HTML untuk fetch tier HTTP (tanpa browser)
+Setiap parser return teks dengan format yang sama seperti scraper Playwright,
+atau string kosong jika HTML tidak berisi hasil (-> eskalasi ke browser)
+"""
+
+from bs4 import BeautifulSoup
+
+from core.capture import ITEM_SEPARATOR, extract_yt_initial_data, parse_youtube, format_items
+
+
+def parse_google(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    search = soup.select_one("div#search") or soup
+
+    collected = []
+    for heading in search.select("h3"):
+        title = heading.get_text(" ", strip=True)
+        if not title:
+            continue
+
+        # Snippet biasanya ada di container hasil yang sama dengan judul
+        container = heading.find_parent("div", class_="g") or heading.find_parent("div")
+        snippet_el = container.select_one("div.VwiC3b, div[data-sncf], span.aCOpRe") if container else None
+        snippet = snippet_el.get_text(" ", strip=True) if snippet_el else ""
+
+        collected.append(f"Result {len(collected)+1}: {title}" + (f" - {snippet}" if snippet else ""))
+        if len(collected) >= 10:
+            break
+
+    return ITEM_SEPARATOR.join(collected)
+
+
+def parse_youtube_html(html: str) -> str:
+    data = extract_yt_initial_data(html)
+    if not data:
+        return ""
+    return format_items(parse_youtube(data), "Video")
+
+
+HTTP_PARSERS = {
+    "google": parse_google,
+    "youtube": parse_youtube_html,
+}
@@ -1,32 +1,43 @@
 # scrapers/instagram.py
 import asyncio
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class InstagramScraper(BaseScraper):
+    platform = "instagram"
+
+    # Strategi selector container post -> selector gambar di dalamnya
+    POST_SELECTORS = {
+        "article": "article",
+        "post_link": 'a[href*="/p/"]',
+    }
+    IMAGE_SELECTORS = {
+        "article": "article img",
+        "post_link": 'a[href*="/p/"] img',
+    }
+
     async def scrape(self, keyword: str) -> str:
         # Ubah "Ide Bisnis AI" menjadi "IdeBisnisAI" untuk pencarian Hashtag
         hashtag = keyword.replace(" ", "")
-        print(f"[*] Scraping Instagram Hashtag: #{hashtag}")
+        log.info("Scraping Instagram Hashtag: #%s", hashtag, platform=self.platform, keyword=keyword)
         
         url = f"https://www.instagram.com/explore/tags/{hashtag}/"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT))
             
             # Instagram sering minta login, kita coba tunggu konten muncul
             # Selector untuk grid gambar di explore page
-            try:
-                await self.page.wait_for_selector('article', timeout=10000)
-            except:
+            strategy = await self.wait_for_any(self.POST_SELECTORS)
+            if not strategy:
                 # Cek jika dialihkan ke halaman login
                 if "login" in self.page.url:
-                    return "GAGAL: Instagram meminta Login. (Perlu implementasi Cookies/Session)"
-                return "KONTEN KOSONG: Tidak ada postingan untuk hashtag ini."
+                    return ScrapeResult("GAGAL: Instagram meminta Login. (Perlu implementasi Cookies/Session)", ScrapeOutcome.LOGIN_REQUIRED)
+                return ScrapeResult("KONTEN KOSONG: Tidak ada postingan untuk hashtag ini.", ScrapeOutcome.EMPTY)
 
             # Ambil deskripsi dari atribut 'alt' pada gambar (karena caption ada di alt text img)
             # Kita ambil 15 postingan teratas
-            images = await self.page.locator('article img').all()
+            images = await self.page.locator(self.IMAGE_SELECTORS[strategy]).all()
             
             collected_text = []
             for i, img in enumerate(images[:15]): 
@@ -35,9 +46,9 @@ class InstagramScraper(BaseScraper):
                     collected_text.append(f"Post {i+1}: {alt_text}")
             
             if not collected_text:
-                return "Data ditemukan tapi tidak ada teks deskripsi (Mungkin video tanpa alt text)."
+                return ScrapeResult("Data ditemukan tapi tidak ada teks deskripsi (Mungkin video tanpa alt text).", ScrapeOutcome.EMPTY)
 
-            return "\n".join(collected_text)
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(collected_text))
 
         except Exception as e:
-            return f"Error Instagram: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error Instagram: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
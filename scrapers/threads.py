@@ -1,21 +1,35 @@
 # scrapers/threads.py
 import asyncio
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class ThreadsScraper(BaseScraper):
+    platform = "threads"
+
+    THREAD_SELECTORS = {
+        "pressable": 'div[data-pressable-container="true"]',
+        "thread_class": 'div[class*="Thread"]',
+    }
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping Threads untuk: {keyword}")
+        log.info("Scraping Threads untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         url = f"https://www.threads.net/search?q={keyword}"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
-            await self.page.wait_for_timeout(3000) # Tunggu render
+            await self.start_capture()
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT), wait_until=self.wait_until)
 
             # Cek Login
             if "login" in self.page.url:
-                 return "GAGAL: Butuh Login (Jalankan auth_generator.py)."
+                 return ScrapeResult("GAGAL: Butuh Login (Jalankan auth_generator.py).", ScrapeOutcome.LOGIN_REQUIRED)
+
+            # Jalur cepat: hasil search dari response GraphQL
+            captured = await self.captured_text("Thread")
+            if captured:
+                return ScrapeResult.ok(captured)
+
+            await self.page.wait_for_timeout(3000) # Tunggu render
 
             # Threads menggunakan div dengan style grid. 
             # Kita coba ambil teks dari div yang berisi konten thread.
@@ -29,14 +43,12 @@ class ThreadsScraper(BaseScraper):
             await self.page.evaluate("window.scrollBy(0, 1000)")
             await self.page.wait_for_timeout(1000)
 
-            results = await self.page.locator('div[data-pressable-container="true"]').all_inner_texts()
-            
-            if not results:
-                # Coba selector alternatif
-                results = await self.page.locator('div[class*="Thread"]').all_inner_texts()
+            # Race selector utama & alternatif sekaligus, bukan satu per satu
+            strategy = await self.wait_for_any(self.THREAD_SELECTORS, timeout=5000)
+            results = await self.page.locator(self.THREAD_SELECTORS[strategy]).all_inner_texts() if strategy else []
 
             clean_data = [r.replace('\n', ' ') for r in results[:10]]
-            return "\n".join(clean_data)
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(clean_data))
 
         except Exception as e:
-            return f"Error Threads: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error Threads: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
@@ -1,19 +1,37 @@
 # scrapers/tiktok.py
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class TiktokScraper(BaseScraper):
+    platform = "tiktok"
+
+    ITEM_SELECTORS = {
+        "top_item": 'div[data-e2e="search_top-item"]',
+        "video_item": 'div[data-e2e="search_video-item"]',
+    }
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping TikTok untuk: {keyword}")
+        log.info("Scraping TikTok untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         # Pergi ke halaman search TikTok
         url = f"https://www.tiktok.com/search?q={keyword}"
-        await self.page.goto(url, timeout=settings.TIMEOUT)
+        await self.start_capture()
+        await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT), wait_until=self.wait_until)
+
+        # Jalur cepat: hasil search dari XHR /api/search/...
+        captured = await self.captured_text("Video")
+        if captured:
+            return ScrapeResult.ok(captured)
         
         # Tunggu konten dimuat (bisa disesuaikan selectornya)
-        try:
-            await self.page.wait_for_selector('div[data-e2e="search_top-item"]', timeout=10000)
-            elements = await self.page.locator('div[data-e2e="search_top-item"]').all_inner_texts()
-            return "\n".join(elements)
-        except:
-            return "Konten TikTok tidak ditemukan atau butuh Login/Captcha handling."
\ No newline at end of file
+        strategy = await self.wait_for_any(self.ITEM_SELECTORS)
+        if strategy:
+            elements = await self.page.locator(self.ITEM_SELECTORS[strategy]).all_inner_texts()
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(elements))
+
+        # Bedakan captcha / login wall dari hasil yang memang kosong
+        if await self.page.locator('[id*="captcha"], [class*="captcha"]').count() > 0:
+            return ScrapeResult("TERDETEKSI BOT: TikTok menampilkan Captcha.", ScrapeOutcome.BLOCKED)
+        if "login" in self.page.url:
+            return ScrapeResult("GAGAL: TikTok meminta Login.", ScrapeOutcome.LOGIN_REQUIRED)
+        return ScrapeResult("Konten TikTok tidak ditemukan atau butuh Login/Captcha handling.", ScrapeOutcome.EMPTY)
@@ -1,33 +1,45 @@
 # scrapers/twitter.py
 import asyncio
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class TwitterScraper(BaseScraper):
+    platform = "twitter"
+
+    # Selector paling stabil di X adalah data-testid; article sebagai cadangan
+    TWEET_SELECTORS = {
+        "tweet_testid": '[data-testid="tweet"]',
+        "article": 'article[role="article"]',
+    }
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping Twitter (X) untuk: {keyword}")
+        log.info("Scraping Twitter (X) untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         # Gunakan src=typed_query agar hasil lebih relevan
         url = f"https://x.com/search?q={keyword}&src=typed_query"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
+            await self.start_capture()
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT), wait_until=self.wait_until)
             
             # Cek apakah dilempar ke Login Wall
             # Twitter sering redirect url ke /login atau /i/flow/login
             await self.page.wait_for_timeout(3000) # Tunggu redirect sebentar
             if "login" in self.page.url:
-                return "GAGAL: Twitter mewajibkan Login. (Sistem Session diperlukan nanti)"
+                return ScrapeResult("GAGAL: Twitter mewajibkan Login. (Sistem Session diperlukan nanti)", ScrapeOutcome.LOGIN_REQUIRED)
+
+            # Jalur cepat: tweet dari response GraphQL SearchTimeline
+            captured = await self.captured_text("Tweet")
+            if captured:
+                return ScrapeResult.ok(captured)
 
             # Tunggu tweet muncul
-            try:
-                # Selector paling stabil di X adalah data-testid
-                await self.page.wait_for_selector('[data-testid="tweet"]', timeout=10000)
-            except:
-                return "Tidak ada Tweet ditemukan atau Loading terlalu lama."
+            strategy = await self.wait_for_any(self.TWEET_SELECTORS)
+            if not strategy:
+                return ScrapeResult("Tidak ada Tweet ditemukan atau Loading terlalu lama.", ScrapeOutcome.EMPTY)
 
             # Ambil Tweet
-            tweets = await self.page.locator('[data-testid="tweet"]').all()
+            tweets = await self.page.locator(self.TWEET_SELECTORS[strategy]).all()
             
             collected_data = []
             for i, tweet in enumerate(tweets[:10]):
@@ -39,9 +51,9 @@ class TwitterScraper(BaseScraper):
                     collected_data.append(f"Tweet {i+1}: {text}")
             
             if not collected_data:
-                return "Tweet elemen ada, tapi teks tidak terbaca (Mungkin hanya gambar/video)."
+                return ScrapeResult("Tweet elemen ada, tapi teks tidak terbaca (Mungkin hanya gambar/video).", ScrapeOutcome.EMPTY)
 
-            return "\n".join(collected_data)
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(collected_data))
 
         except Exception as e:
-            return f"Error Twitter: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error Twitter: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
@@ -1,27 +1,40 @@
 # scrapers/youtube.py
 import asyncio
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, ITEM_SEPARATOR, ScrapeResult, ScrapeOutcome, log
 from config import settings
 
 class YoutubeScraper(BaseScraper):
+    platform = "youtube"
+
+    # Hasil search biasa vs layout grid (rich item)
+    VIDEO_SELECTORS = {
+        "video_renderer": "ytd-video-renderer",
+        "rich_item": "ytd-rich-item-renderer",
+    }
+
     async def scrape(self, keyword: str) -> str:
-        print(f"[*] Scraping YouTube untuk: {keyword}")
+        log.info("Scraping YouTube untuk: %s", keyword, platform=self.platform, keyword=keyword)
         
         # URL Search YouTube
         url = f"https://www.youtube.com/results?search_query={keyword}"
         
         try:
-            await self.page.goto(url, timeout=settings.TIMEOUT)
+            await self.start_capture()
+            await self.page.goto(url, timeout=self.budget_ms(settings.TIMEOUT), wait_until=self.wait_until)
+
+            # Jalur cepat: ytInitialData di HTML + response /youtubei/v1/search
+            captured = await self.captured_text("Video")
+            if captured:
+                return ScrapeResult.ok(captured)
             
             # Tunggu elemen video muncul
             # ytd-video-renderer adalah container utama per video di hasil search
-            try:
-                await self.page.wait_for_selector('ytd-video-renderer', timeout=10000)
-            except:
-                return "YouTube tidak memuat hasil (Timeout)."
+            strategy = await self.wait_for_any(self.VIDEO_SELECTORS)
+            if not strategy:
+                return ScrapeResult("YouTube tidak memuat hasil (Timeout).", ScrapeOutcome.EMPTY)
 
             # Ambil judul dan metadata video
-            videos = await self.page.locator('ytd-video-renderer').all()
+            videos = await self.page.locator(self.VIDEO_SELECTORS[strategy]).all()
             
             collected_data = []
             
@@ -41,9 +54,9 @@ class YoutubeScraper(BaseScraper):
                 collected_data.append(f"Video {i+1}: {title} ({meta})")
             
             if not collected_data:
-                return "Elemen ditemukan tapi gagal mengekstrak teks."
+                return ScrapeResult("Elemen ditemukan tapi gagal mengekstrak teks.", ScrapeOutcome.EMPTY)
 
-            return "\n".join(collected_data)
+            return ScrapeResult.ok(ITEM_SEPARATOR.join(collected_data))
 
         except Exception as e:
-            return f"Error YouTube: {str(e)}"
\ No newline at end of file
+            return ScrapeResult(f"Error YouTube: {str(e)}", ScrapeOutcome.ERROR)
\ No newline at end of file
@@ -0,0 +1,240 @@
+# service.py
+"""
+Service Mode (daemon)
+- Browser pool, NLP analyzer & sesi LLM di-load sekali lalu tetap warm
+- Job API lokal (HTTP di 127.0.0.1 atau Unix socket):
+    POST /jobs    {"keywords": [...], "platforms": [...], "priority": 0}
+                  -> hasil di-stream sebagai NDJSON, satu baris per keyword x platform
+    GET  /health  -> status antrian & statistik
+- Job diproses berurutan menurut prioritas (angka lebih besar dulu), FIFO untuk prioritas sama
+- Stream NDJSON dikirim dengan Transfer-Encoding: chunked; client yang putus (EOF) langsung
+  terdeteksi, sisa job request-nya tidak dikerjakan
+- Jalankan: python main.py --serve
+
+Contoh:
+    curl -N -X POST localhost:8765/jobs -d '{"keywords": ["golang"], "platforms": ["youtube"]}'
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Callable, List, Optional
+
+from config import settings
+from core.deadline import DeadlineExceeded
+from core.pipeline import Pipeline
+from utils.profiler import profiler
+from utils.logger import get_logger
+
+log = get_logger("SERVICE")
+
+MAX_BODY_BYTES = 1 << 20
+
+HTTP_STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+
+
+class JobRequest:
+    """Satu POST /jobs: hasil job-nya dikirim ke queue milik koneksi tersebut"""
+
+    def __init__(self, keywords: list, platforms: list, priority: int):
+        self.keywords = keywords
+        self.platforms = platforms
+        self.priority = priority
+        self.results = asyncio.Queue()
+        self.cancelled = False
+
+    @property
+    def total(self) -> int:
+        return len(self.keywords) * len(self.platforms)
+
+
+class JobService:
+    def __init__(self, run_task: Callable, platforms: List[str]):
+        # run_task & daftar platform dari main.py (diinjeksi agar main tidak ter-import dua kali)
+        self.run_task = run_task
+        self.platforms = platforms
+        self.pipeline: Optional[Pipeline] = None
+        self.queue = asyncio.PriorityQueue()
+        self.sequence = itertools.count()
+        self.stats = {"requests": 0, "jobs": 0, "started": time.time()}
+
+    # ===== WORKER =====
+    async def execute(self, platform: str, keyword: str) -> dict:
+        """Satu job keyword x platform -> baris NDJSON"""
+        start = time.perf_counter()
+        line = {"keyword": keyword, "platform": platform}
+
+        if not await self.pipeline.session_allows(platform):
+            line["outcome"] = "session_dead"
+        elif not self.pipeline.breaker.allow(platform):
+            line["outcome"] = "circuit_open"
+        else:
+            try:
+                outcome, result = await self.run_task(platform, keyword, self.pipeline)
+                line["outcome"] = outcome.value
+                if result:
+                    line["result"] = result
+            except DeadlineExceeded as e:
+                line.update(outcome="deadline", error=str(e))
+            except Exception as e:
+                line.update(outcome="error", error=str(e))
+
+        line["elapsed"] = round(time.perf_counter() - start, 2)
+        return line
+
+    async def worker(self):
+        while True:
+            _, _, request, platform, keyword = await self.queue.get()
+            try:
+                if request.cancelled:
+                    continue
+                line = await self.execute(platform, keyword)
+                self.stats["jobs"] += 1
+                await request.results.put(line)
+            finally:
+                self.queue.task_done()
+
+    def submit(self, request: JobRequest):
+        for keyword in request.keywords:
+            for platform in request.platforms:
+                # PriorityQueue mengambil nilai terkecil -> prioritas dinegasikan
+                self.queue.put_nowait((-request.priority, next(self.sequence), request, platform, keyword))
+
+    # ===== HTTP =====
+    def parse_job(self, body: bytes) -> JobRequest:
+        payload = json.loads(body or b"{}")
+        if not isinstance(payload, dict):
+            raise ValueError("body harus object JSON")
+        keywords = payload.get("keywords") or settings.KEYWORDS
+        platforms = payload.get("platforms") or self.platforms
+        priority = payload.get("priority", 0)
+        if not isinstance(keywords, list) or not all(isinstance(k, str) and k.strip() for k in keywords):
+            raise ValueError("keywords harus list string")
+        if not isinstance(platforms, list) or not all(isinstance(p, str) for p in platforms):
+            raise ValueError("platforms harus list string")
+        # bool juga subclass int: {"priority": true} ditolak
+        if not isinstance(priority, int) or isinstance(priority, bool):
+            raise ValueError("priority harus integer")
+        unknown = set(platforms) - set(self.platforms)
+        if unknown:
+            raise ValueError(f"platform tidak dikenal: {', '.join(sorted(unknown))}")
+        return JobRequest([k.strip() for k in keywords], list(platforms), priority)
+
+    @staticmethod
+    async def send_head(writer: asyncio.StreamWriter, status: int, content_type: str, length: int = None):
+        """length None -> body dikirim chunked"""
+        framing = f"Content-Length: {length}" if length is not None else "Transfer-Encoding: chunked"
+        writer.write(
+            f"HTTP/1.1 {status} {HTTP_STATUS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"{framing}\r\n"
+            "Connection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+
+    async def send_json(self, writer: asyncio.StreamWriter, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode() + b"\n"
+        await self.send_head(writer, status, "application/json", len(body))
+        writer.write(body)
+        await writer.drain()
+
+    @staticmethod
+    async def send_chunk(writer: asyncio.StreamWriter, data: bytes):
+        """Satu chunk HTTP/1.1; data kosong = chunk penutup"""
+        writer.write(f"{len(data):X}\r\n".encode() + data + b"\r\n" if data else b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def watch_disconnect(reader: asyncio.StreamReader, request: JobRequest):
+        """Selesai saat client menutup koneksi (EOF); request langsung ditandai batal"""
+        while await reader.read(4096):
+            pass
+        request.cancelled = True
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        request = watcher = None
+        try:
+            method, path, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                await self.send_json(writer, 413, {"error": "body terlalu besar"})
+                return
+            body = await reader.readexactly(length) if length else b""
+
+            if method == "GET" and path == "/health":
+                await self.send_json(writer, 200, {
+                    "status": "ok", "queued": self.queue.qsize(),
+                    "uptime": round(time.time() - self.stats["started"]), **self.stats,
+                })
+                return
+            if method != "POST" or path != "/jobs":
+                await self.send_json(writer, 404, {"error": f"{method} {path} tidak dikenal"})
+                return
+
+            try:
+                request = self.parse_job(body)
+            except (ValueError, TypeError, AttributeError) as e:
+                await self.send_json(writer, 400, {"error": str(e)})
+                return
+
+            self.stats["requests"] += 1
+            self.submit(request)
+            await self.send_head(writer, 200, "application/x-ndjson")
+            # Putus terdeteksi saat itu juga, bukan baru saat hasil job berikutnya ditulis
+            watcher = asyncio.create_task(self.watch_disconnect(reader, request))
+
+            for _ in range(request.total):
+                result = asyncio.ensure_future(request.results.get())
+                await asyncio.wait({result, watcher}, return_when=asyncio.FIRST_COMPLETED)
+                if not result.done():
+                    result.cancel()
+                    return
+                line = result.result()
+                await self.send_chunk(writer, json.dumps(line, ensure_ascii=False, default=str).encode() + b"\n")
+            await self.send_chunk(writer, json.dumps({"done": True, "jobs": request.total}).encode() + b"\n")
+            await self.send_chunk(writer, b"")
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            # Client putus di tengah jalan -> sisa job request ini tidak perlu dikerjakan
+            if request:
+                request.cancelled = True
+            if watcher:
+                watcher.cancel()
+            writer.close()
+
+    # ===== LIFECYCLE =====
+    async def serve(self):
+        log.info("Memanaskan pipeline (browser pool, NLP, LLM)...")
+        self.pipeline = Pipeline()
+        if self.pipeline.sessions:
+            await self.pipeline.sessions.check_all(self.platforms)
+        worker = asyncio.create_task(self.worker())
+
+        if settings.SERVICE_SOCKET:
+            if os.path.exists(settings.SERVICE_SOCKET):
+                os.remove(settings.SERVICE_SOCKET)
+            server = await asyncio.start_unix_server(self.handle, path=settings.SERVICE_SOCKET)
+            log.info("Listening di unix:%s", settings.SERVICE_SOCKET)
+        else:
+            server = await asyncio.start_server(self.handle, settings.SERVICE_HOST, settings.SERVICE_PORT)
+            log.info("Listening di http://%s:%s", settings.SERVICE_HOST, settings.SERVICE_PORT)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            worker.cancel()
+            await self.pipeline.close()
+            self.pipeline.report_stats("service")
+            profiler.write(os.path.join("service", str(os.getpid())))
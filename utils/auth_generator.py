@@ -1,11 +1,18 @@
 # utils/auth_generator.py
+# Jalankan: python utils/auth_generator.py [platform ...]
+# Tanpa argumen semua platform yang berhasil login disimpan; dengan argumen hanya platform itu
+# (file session platform lain tidak disentuh)
 import asyncio
+import os
+import sys
 from playwright.async_api import async_playwright
 
-# Nama file tempat menyimpan session
-SESSION_FILE = "session.json"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-async def generate_session():
+from config import settings  # noqa: E402
+from core.session import split_storage_state, write_session, PLATFORM_DOMAINS  # noqa: E402
+
+async def generate_session(platforms=None):
     print("🚀 Membuka Browser 'Stealth' untuk Login Manual...")
     
     async with async_playwright() as p:
@@ -47,6 +54,7 @@ async def generate_session():
         print("   - https://www.instagram.com")
         print("   - https://x.com")
         print("   - https://www.threads.net")
+        print("   - https://www.tiktok.com")
         print("3. Jika sudah semua, kembali ke terminal ini dan TEKAN ENTER.")
         print("-----------------\n")
 
@@ -55,10 +63,18 @@ async def generate_session():
 
         input("👉 SUDAH SELESAI LOGIN SEMUA? Tekan Enter untuk menyimpan session...")
 
-        await context.storage_state(path=SESSION_FILE)
-        print(f"\n[✔] Session berhasil disimpan di: {SESSION_FILE}")
+        # Satu file per platform -> session yang mati tidak menyeret platform lain
+        states = split_storage_state(await context.storage_state(), platforms)
+        for platform, state in states.items():
+            write_session(platform, state)
+            print(f"[✔] Session {platform} disimpan di: {settings.SESSION_DIR}/{platform}.json")
+        for platform in sorted(set(platforms or PLATFORM_DOMAINS) - set(states)):
+            print(f"[!] {platform}: belum login (cookie auth tidak ditemukan), tidak disimpan")
         
         await browser.close()
 
 if __name__ == "__main__":
-    asyncio.run(generate_session())
\ No newline at end of file
+    unknown = set(sys.argv[1:]) - set(PLATFORM_DOMAINS)
+    if unknown:
+        sys.exit(f"Platform tidak dikenal: {', '.join(sorted(unknown))} (pilihan: {', '.join(PLATFORM_DOMAINS)})")
+    asyncio.run(generate_session(sys.argv[1:] or None))
\ No newline at end of file
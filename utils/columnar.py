@@ -0,0 +1,157 @@
+# utils/columnar.py
+"""
+Columnar Export (Parquet / Arrow)
+- Hasil bertipe (score int, nlp_score float, keyword sebagai list) - bukan string seperti CSV
+- Partisi hive: date=YYYY-MM-DD/keyword=.../platform=... -> scan hanya partisi yang dibutuhkan
+- Reader memory-mapped: baca kolom tertentu saja, ke pandas tanpa copy (ArrowDtype)
+- pyarrow opsional: tanpa pyarrow sink & reader tidak aktif, CSV tetap jalan
+"""
+
+import os
+import uuid
+from datetime import date, datetime
+from typing import List, Optional
+
+from config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+PARTITION_COLUMNS = ["date", "keyword", "platform"]
+
+if PYARROW_AVAILABLE:
+    SCHEMA = pa.schema([
+        ("timestamp", pa.timestamp("s")),
+        ("score", pa.int32()),
+        ("category", pa.string()),
+        ("trend_strength", pa.string()),
+        ("nlp_sentiment", pa.string()),
+        ("nlp_score", pa.float64()),
+        ("top_keywords", pa.list_(pa.string())),
+        ("distinctive_terms", pa.list_(pa.string())),
+        ("summary", pa.string()),
+        ("tier", pa.string()),
+        ("llm_tier", pa.string()),
+        ("items", pa.int32()),
+        ("duplicates", pa.int32()),
+        # Kolom partisi (ditulis sebagai path, bukan di dalam file)
+        ("date", pa.string()),
+        ("keyword", pa.string()),
+        ("platform", pa.string()),
+    ])
+    PARTITIONING = ds.partitioning(
+        pa.schema([(name, pa.string()) for name in PARTITION_COLUMNS]), flavor="hive"
+    )
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(round(float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ParquetSink:
+    """Buffer hasil per worker, tulis sebagai file Parquet baru per flush (tanpa rewrite)"""
+
+    def __init__(self, root: str = None, flush_rows: int = None):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow tidak terinstall (pip install pyarrow)")
+        self.root = root or settings.PARQUET_DIR
+        self.flush_rows = flush_rows or settings.PARQUET_FLUSH_ROWS
+        self.rows = []
+        # Nama file unik per worker -> aman untuk multi-proses
+        self.prefix = f"part-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.flushes = 0
+
+    def write(self, result: dict):
+        now = datetime.now().replace(microsecond=0)
+        nlp = result.get('nlp_analysis') or {}
+        dedup = result.get('dedup') or {}
+        self.rows.append({
+            "timestamp": now,
+            "score": _to_int(result.get('score')),
+            "category": result.get('category'),
+            "trend_strength": result.get('trend_strength'),
+            "nlp_sentiment": nlp.get('sentiment_label'),
+            "nlp_score": _to_float(nlp.get('sentiment_score')),
+            "top_keywords": list(nlp.get('top_keywords') or []),
+            "distinctive_terms": list(result.get('distinctive_terms') or []),
+            "summary": result.get('summary'),
+            "tier": result.get('tier'),
+            "llm_tier": result.get('llm_tier'),
+            "items": dedup.get('items'),
+            "duplicates": dedup.get('duplicates'),
+            "date": now.strftime("%Y-%m-%d"),
+            "keyword": result['keyword'],
+            "platform": result['platform'],
+        })
+        if len(self.rows) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        table = pa.Table.from_pylist(self.rows, schema=SCHEMA)
+        ds.write_dataset(
+            table, self.root, format="parquet", partitioning=PARTITIONING,
+            basename_template=f"{self.prefix}-{self.flushes}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        self.flushes += 1
+        self.rows = []
+
+    def close(self):
+        self.flush()
+
+
+# ================================
+#  READER (memory-mapped)
+# ================================
+def open_dataset(root: str = None) -> "ds.Dataset":
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow tidak terinstall (pip install pyarrow)")
+    return ds.dataset(
+        root or settings.PARQUET_DIR, format="parquet", partitioning=PARTITIONING,
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+
+
+def load_table(columns: List[str] = None, keyword: str = None, platform: str = None,
+               since: date = None, until: date = None, root: str = None) -> "pa.Table":
+    """
+    Scan dataset: filter partisi (keyword/platform/tanggal) dipangkas sebelum file dibuka,
+    hanya kolom yang diminta yang dibaca.
+    """
+    expression = None
+    conditions = []
+    if keyword:
+        conditions.append(ds.field("keyword") == keyword)
+    if platform:
+        conditions.append(ds.field("platform") == platform)
+    if since:
+        conditions.append(ds.field("date") >= since.isoformat())
+    if until:
+        conditions.append(ds.field("date") <= until.isoformat())
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    return open_dataset(root).to_table(columns=columns, filter=expression)
+
+
+def load_dataframe(**kwargs):
+    """pandas DataFrame berbasis Arrow (ArrowDtype): buffer kolom dipakai langsung, tanpa konversi"""
+    import pandas as pd
+    return load_table(**kwargs).to_pandas(types_mapper=pd.ArrowDtype)
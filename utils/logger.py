@@ -0,0 +1,168 @@
+# utils/logger.py
+"""
+Structured Logger (non-blocking)
+- Hot path hanya memasukkan record ke queue; format & I/O (terminal / file) dikerjakan
+  satu thread background, jadi job yang jalan bersamaan tidak saling menunggu terminal
+- Format text ("[TAG] pesan", sama seperti print lama) atau JSON per baris (LOG_FORMAT=json)
+- Level via LOG_LEVEL; event frekuensi tinggi diberi key `sample` -> hanya 1 dari
+  LOG_SAMPLE_RATE yang ditulis
+- Queue penuh -> record dibuang & dihitung, pemanggil tidak pernah diblokir
+
+Pemakaian:
+    log = get_logger("NLP")
+    log.info("Analyzing text length: %d", len(text), length=len(text))
+    log.debug("Found number: %s -> %s", num, val, sample="engagement")
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from config import settings
+
+ROOT = "scraper"
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue, sample_rate: int):
+        super().__init__(log_queue)
+        self.sample_rate = sample_rate
+        self.sample_counters = {}    # key sample -> itertools.count
+        self.dropped = 0             # queue penuh
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample", None)
+        if key and self.sample_rate > 1:
+            counter = self.sample_counters.get(key) or self.sample_counters.setdefault(key, itertools.count())
+            if next(counter) % self.sample_rate:
+                self.sampled_out += 1
+                return False
+            record.sampled = self.sample_rate  # satu record mewakili N event
+        return super().filter(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler bawaan memformat pesan di thread pemanggil; di sini ditunda ke listener
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self):
+        # Blocking: saat shutdown queue bisa penuh, listener tetap mengosongkannya
+        self.queue.put(self._sentinel)
+
+
+def _tag(record: logging.LogRecord) -> str:
+    return record.name.split(".", 1)[-1]  # "scraper.NLP" -> "NLP"
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname}: {message}"
+        line = f"[{_tag(record)}] {message}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "tag": _tag(record),
+            "msg": record.getMessage(),
+            "pid": record.process,
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if getattr(record, "sampled", None):
+            entry["sampled"] = record.sampled
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class Logger:
+    """Lapisan tipis di atas logging.Logger: field terstruktur sebagai kwargs, `sample` untuk sampling"""
+
+    def __init__(self, tag: str):
+        self.logger = logging.getLogger(f"{ROOT}.{tag}")
+
+    def _log(self, level: int, msg: str, args: tuple, sample: str, fields: dict, exc_info=False):
+        # Cek level dulu: record yang tidak ditulis tidak perlu dibuat sama sekali
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, msg, *args, exc_info=exc_info, extra={"fields": fields, "sample": sample})
+
+    def debug(self, msg: str, *args, sample: str = None, **fields):
+        self._log(logging.DEBUG, msg, args, sample, fields)
+
+    def info(self, msg: str, *args, sample: str = None, **fields):
+        self._log(logging.INFO, msg, args, sample, fields)
+
+    def warning(self, msg: str, *args, sample: str = None, **fields):
+        self._log(logging.WARNING, msg, args, sample, fields)
+
+    def error(self, msg: str, *args, sample: str = None, exc_info=False, **fields):
+        self._log(logging.ERROR, msg, args, sample, fields, exc_info)
+
+
+_handler = None
+_listener = None
+_setup_lock = threading.Lock()
+
+
+def setup():
+    """Pasang queue handler + listener sekali per proses (worker spawn memanggilnya sendiri)"""
+    global _handler, _listener
+    with _setup_lock:
+        if _listener:
+            return
+        if settings.LOG_FILE:
+            output = logging.FileHandler(settings.LOG_FILE, encoding="utf-8")
+        else:
+            output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else TextFormatter())
+
+        root = logging.getLogger(ROOT)
+        root.setLevel(settings.LOG_LEVEL)
+        root.propagate = False
+        _handler = _NonBlockingQueueHandler(queue.Queue(settings.LOG_QUEUE_SIZE), settings.LOG_SAMPLE_RATE)
+        root.addHandler(_handler)
+
+        _listener = _Listener(_handler.queue, output)
+        _listener.start()
+        atexit.register(shutdown)
+
+
+def get_logger(tag: str) -> Logger:
+    setup()
+    return Logger(tag)
+
+
+def flush():
+    """Tunggu semua record tertulis (sebelum output print langsung, mis. laporan akhir)"""
+    if _listener:
+        _handler.queue.join()
+
+
+def shutdown():
+    global _listener
+    if not _listener:
+        return
+    _listener.stop()
+    _listener = None
+    if _handler.dropped:
+        print(f"[LOG] {_handler.dropped} record dibuang (queue penuh)", file=sys.stderr)
@@ -0,0 +1,187 @@
+# utils/profiler.py
+"""
+Stage Profiler (--profile)
+- cProfile per stage pipeline (scrape, nlp, llm_parse, index, storage), digabung antar job
+- Satu cProfile aktif per proses: stage yang mulai saat profiler sedang dipakai (mis. chunk
+  llm_parse paralel) tidak diprofil & dihitung sebagai "skipped" -- tidak pernah error, hasil job
+  tidak berubah. Stage async (scrape) ikut mencatat callback lain di event loop yang sama (heartbeat)
+- tracemalloc: peak & selisih memori ter-trace per stage, plus snapshot sebelum/sesudah stage
+  (compare_to per baris) untuk top-N lokasi alokasi, digabung antar eksekusi
+- Output per run: <stage>.pstats, <stage>.txt (memori + top-N lokasi alokasi + top-N fungsi),
+  <stage>.collapsed (input flamegraph.pl / speedscope)
+- Nonaktif (tanpa overhead) kecuali --profile / PROFILE_DIR diset
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+from config import settings
+from utils.logger import get_logger
+
+log = get_logger("PROFILE")
+
+MAX_STACK_DEPTH = 64
+
+# Alokasi milik profiler, tracemalloc & import system sendiri tidak relevan untuk stage
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def _func_label(func: tuple) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name  # built-in, mis. <method 'findall' of 're.Pattern' objects>
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Counter:
+    """
+    Ubah call graph cProfile menjadi format collapsed stack ("a;b;c <mikrodetik>").
+    cProfile tidak menyimpan stack penuh: waktu tiap fungsi dibagi ke caller sesuai proporsi
+    cumulative time dari masing-masing caller (aproksimasi standar pstats -> flamegraph).
+    """
+    entries = stats.stats  # func -> (cc, nc, tt, ct, callers)
+    callees = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, caller_ct) in callers.items():
+            callees.setdefault(caller, []).append((func, caller_ct))
+
+    stacks = Counter()
+
+    def walk(func, path, weight):
+        _, _, tt, ct, _ = entries[func]
+        path = path + [_func_label(func)]
+        if tt * weight > 0:
+            stacks[";".join(path)] += int(tt * weight * 1e6)
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        for child, edge_ct in callees.get(func, []):
+            child_ct = entries[child][3]
+            if child_ct <= 0 or _func_label(child) in path:
+                continue  # rekursi: cukup satu level
+            walk(child, path, weight * min(1.0, edge_ct / child_ct))
+
+    roots = [func for func, (_, _, _, _, callers) in entries.items() if not callers]
+    for root in roots:
+        walk(root, [], 1.0)
+    return stacks
+
+
+class StageProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.out_dir = None
+        self.lock = threading.Lock()
+        self.active = threading.Lock()  # dipegang selama satu stage diprofil
+        self.stats = {}               # stage -> pstats.Stats
+        self.memory = {}              # stage -> {"peak": byte maks, "net": total selisih byte}
+        self.allocations = {}         # stage -> {"file:line": [selisih byte, selisih jumlah blok]}
+        self.calls = Counter()        # stage -> jumlah eksekusi yang diprofil
+        self.skipped = Counter()      # stage -> eksekusi yang dilewati (profiler sedang dipakai)
+
+    def enable(self, out_dir: str):
+        self.enabled = True
+        self.out_dir = out_dir
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        # Python 3.12+ menolak dua cProfile aktif sekaligus (sys.monitoring): jangan menunggu / error
+        if not self.active.acquire(blocking=False):
+            with self.lock:
+                self.skipped[name] += 1
+            yield
+            return
+
+        profile = cProfile.Profile()
+        try:
+            # Snapshot di luar cProfile agar biayanya tidak ikut terhitung ke stage
+            before = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                current, peak = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+                diffs = after.compare_to(before, "lineno")
+                with self.lock:
+                    sites = self.allocations.setdefault(name, {})
+                    for diff in diffs:
+                        if diff.size_diff or diff.count_diff:
+                            frame = diff.traceback[0]
+                            site = sites.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+                            site[0] += diff.size_diff
+                            site[1] += diff.count_diff
+                    self.calls[name] += 1
+                    if name in self.stats:
+                        self.stats[name].add(profile)
+                    else:
+                        self.stats[name] = pstats.Stats(profile)
+                    memory = self.memory.setdefault(name, {"peak": 0, "net": 0})
+                    memory["peak"] = max(memory["peak"], peak - start)
+                    memory["net"] += current - start
+        finally:
+            self.active.release()
+
+    def write(self, label: str) -> str:
+        """Tulis hasil semua stage ke <out_dir>/<label>/; return path direktori"""
+        if not self.enabled or not self.stats:
+            return None
+        directory = os.path.join(self.out_dir, label)
+        os.makedirs(directory, exist_ok=True)
+        top_n = settings.PROFILE_TOP_N
+
+        with self.lock:
+            for name, stats in self.stats.items():
+                stats.dump_stats(os.path.join(directory, f"{name}.pstats"))
+
+                with open(os.path.join(directory, f"{name}.collapsed"), "w", encoding="utf-8") as f:
+                    for stack, micros in sorted(collapsed_stacks(stats).items()):
+                        f.write(f"{stack} {micros}\n")
+
+                with open(os.path.join(directory, f"{name}.txt"), "w", encoding="utf-8") as f:
+                    memory = self.memory[name]
+                    f.write(f"# Stage {name}: {self.calls[name]} eksekusi diprofil, "
+                            f"{self.skipped[name]} dilewati (profiler sedang dipakai)\n")
+                    f.write(f"# Memori ter-trace: peak {memory['peak'] / 1_048_576:.2f} MB, "
+                            f"selisih bersih {memory['net'] / 1_048_576:.2f} MB (semua thread)\n\n")
+
+                    sites = sorted(self.allocations.get(name, {}).items(),
+                                   key=lambda item: abs(item[1][0]), reverse=True)[:top_n]
+                    f.write(f"# Top {len(sites)} lokasi alokasi (snapshot sesudah vs sebelum stage, total)\n")
+                    for site, (size, count) in sites:
+                        f.write(f"{size / 1024:+12.1f} KiB {count:+9d} blok  {site}\n")
+                    f.write("\n")
+                    stats.stream = f
+                    stats.sort_stats("cumulative").print_stats(top_n)
+
+            summary = ", ".join(f"{name}×{n}" for name, n in sorted(self.calls.items()))
+            # Mulai bersih untuk run berikutnya (mode monitor / service)
+            self.stats, self.memory, self.allocations = {}, {}, {}
+            self.calls, self.skipped = Counter(), Counter()
+        log.info("%s -> %s", summary, directory)
+        return directory
+
+
+# Satu profiler per proses; stage di modul lain: `with profiler.stage("nlp"): ...`
+profiler = StageProfiler()
+if settings.PROFILE_DIR:
+    profiler.enable(settings.PROFILE_DIR)
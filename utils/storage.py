@@ -3,6 +3,9 @@ import csv
 import os
 from datetime import datetime
 from config import settings
+from utils.logger import get_logger
+
+log = get_logger("STORAGE")
 
 
 class StorageManager:
@@ -17,14 +20,60 @@ class StorageManager:
         "nlp_sentiment", 
         "nlp_score",     
         "top_keywords",  
-        "summary"
+        "summary",
+        # Kolom baru selalu ditambahkan di akhir
+        "tier",
+        "llm_tier",
+        "distinctive_terms"
     ]
+
+    # Header versi sebelum kolom tier/llm_tier/distinctive_terms
+    LEGACY_FIELDNAMES = FIELDNAMES[:10]
     
+    # Header file CSV sudah dicek di proses ini
+    _header_checked = False
+
+    @staticmethod
+    def _ensure_header():
+        """
+        Header file lama != FIELDNAMES -> jangan append (kolom bergeser).
+        Header versi lama (10 kolom): file ditulis ulang dengan header baru (kolom baru = N/A).
+        Header lain: file lama dirotasi ke <nama>.<timestamp>.csv, mulai file baru.
+        """
+        if StorageManager._header_checked or not os.path.isfile(settings.CSV_FILE):
+            StorageManager._header_checked = True
+            return
+        StorageManager._header_checked = True
+
+        with open(settings.CSV_FILE, mode='r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            header = reader.fieldnames or []
+            if header == StorageManager.FIELDNAMES:
+                return
+            rows = list(reader) if header == StorageManager.LEGACY_FIELDNAMES else None
+
+        if rows is None:
+            base, ext = os.path.splitext(settings.CSV_FILE)
+            rotated = f"{base}.{datetime.now().strftime('%Y%m%d%H%M%S')}{ext}"
+            os.replace(settings.CSV_FILE, rotated)
+            log.warning("Header %s tidak cocok, file lama dirotasi ke %s", settings.CSV_FILE, rotated)
+            return
+
+        tmp_file = f"{settings.CSV_FILE}.{os.getpid()}.tmp"
+        with open(tmp_file, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=StorageManager.FIELDNAMES, restval='N/A')
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_file, settings.CSV_FILE)
+        log.info("Header %s dimigrasi (%d baris, kolom baru: %s)", settings.CSV_FILE, len(rows),
+                 ", ".join(f for f in StorageManager.FIELDNAMES if f not in header))
+
     @staticmethod
     def save_to_csv(data: dict):
         """
         Save enhanced data to CSV dengan NLP metrics
         """
+        StorageManager._ensure_header()
         file_exists = os.path.isfile(settings.CSV_FILE)
         
         with open(settings.CSV_FILE, mode='a', newline='', encoding='utf-8') as f:
@@ -42,7 +91,7 @@ class StorageManager:
                     data[field] = 'N/A'
             
             writer.writerow(data)
-            print(f"[✔] Data saved to {settings.CSV_FILE}")
+            log.info("Data saved to %s", settings.CSV_FILE, platform=data.get("platform"), keyword=data.get("keyword"))
     
     
     @staticmethod
@@ -6,7 +6,7 @@ Enhanced Visualization Module
 - Summary Report Generator
 """
 
-from typing import Dict, List
+from typing import Dict
 from datetime import datetime
 
 
@@ -160,48 +160,56 @@ class Visualizer:
     
     
     @staticmethod
-    def generate_summary_report(all_results: List[Dict]) -> str:
+    def generate_aggregate_report(aggregates: Dict, run_id: str = None, partial: bool = False) -> str:
         """
-        Generate text summary report dari multiple results
+        Summary report dari agregat streaming (core/aggregates.py) - tidak perlu semua result di memori
+        aggregates: {'keyword': {nama: RunningStats}, 'platform': {nama: RunningStats}}
         """
-        if not all_results:
+        keywords = aggregates.get('keyword', {})
+        if not keywords:
             return "No data to report."
         
+        total = sum(stats.count for stats in keywords.values())
+        title = "📊 TREND ANALYSIS SUMMARY REPORT" + (" (PARTIAL)" if partial else "")
+        
         report = []
         report.append("\n" + "="*80)
-        report.append("📊 TREND ANALYSIS SUMMARY REPORT")
+        report.append(title)
         report.append("="*80)
         report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Analysis: {len(all_results)}")
+        if run_id:
+            report.append(f"Run: {run_id}")
+        report.append(f"Total Analysis: {total}")
         report.append("")
         
-        # Group by keyword
-        keywords = {}
-        for result in all_results:
-            kw = result['keyword']
-            if kw not in keywords:
-                keywords[kw] = []
-            keywords[kw].append(result)
-        
-        for keyword, results in keywords.items():
+        for keyword, stats in keywords.items():
             report.append(f"\n{'─'*80}")
             report.append(f"🎯 KEYWORD: {keyword.upper()}")
             report.append(f"{'─'*80}")
             
-            # Statistics
-            avg_score = sum(r['score'] for r in results) / len(results)
-            max_score = max(results, key=lambda x: x['score'])
-            
             report.append(f"\n📈 Statistics:")
-            report.append(f"  • Average Score: {avg_score:.1f}/10")
-            report.append(f"  • Best Platform: {max_score['platform']} ({max_score['score']}/10)")
-            report.append(f"  • Total Platforms: {len(results)}")
+            report.append(f"  • Average Score: {stats.mean:.1f}/10")
+            report.append(f"  • Best Platform: {stats.max_label} ({stats.max:g}/10)")
+            report.append(f"  • Score p50/p90: {stats.percentile(50):g} / {stats.percentile(90):g}")
+            report.append(f"  • Total Platforms: {stats.count}")
+            if stats.sentiments:
+                distribution = ", ".join(f"{label} {n}" for label, n in stats.sentiments.most_common())
+                report.append(f"  • Sentiment: {distribution}")
             
-            # Platform breakdown
             report.append(f"\n📱 Platform Breakdown:")
-            for r in sorted(results, key=lambda x: x['score'], reverse=True):
-                report.append(f"  • {r['platform']:12} → Score: {r['score']}/10 | {r.get('trend_strength', 'N/A')}")
+            for platform, item in sorted(stats.breakdown.items(), key=lambda x: x[1]['score'], reverse=True):
+                report.append(f"  • {platform:12} → Score: {item['score']:g}/10 | {item.get('trend') or 'N/A'}")
+        
+        platforms = aggregates.get('platform', {})
+        if platforms:
+            report.append(f"\n{'─'*80}")
+            report.append("📱 PER PLATFORM")
+            report.append(f"{'─'*80}")
+            for platform, stats in platforms.items():
+                report.append(f"  • {platform:12} n={stats.count:<4} avg {stats.mean:.1f} | "
+                              f"max {stats.max:g} ({stats.max_label}) | p50 {stats.percentile(50):g}")
         
         report.append("\n" + "="*80 + "\n")
         
         return "\n".join(report)
+